@@ -1,9 +1,9 @@
 """FastAPI dashboard application entry point."""
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
-import httpx
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.core_specs.configuration.config_loader import config_loader
 from app.middleware import (
+    ConditionalResponseMiddleware,
     CorrelationIdMiddleware,
     DashboardEnvironmentMiddleware,
     RequestLoggingMiddleware,
@@ -24,8 +25,12 @@ from app.routers import (
     infrastructure,
     overview,
     sessions,
+    stream,
     users,
 )
+from app.services import http_client, metrics_stream
+from app.services.live import rollups
+from app.services.providers import database
 from app.utils.custom_logger import log_handler, shutdown_logger
 
 _app_cfg = config_loader["app"]
@@ -35,15 +40,26 @@ API_PREFIX = _app_cfg["api_prefix"]
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifecycle: shared HTTP client."""
+    """Manage application lifecycle: pooled clients, rollup refresh and metric streams."""
     log_handler.info(
         "Dashboard backend starting (mode=%s, port=%s)",
         settings.dashboard_data_mode,
         settings.dashboard_backend_port,
     )
-    app.state.http_client = httpx.AsyncClient(timeout=httpx.Timeout(35.0))
+    app.state.http_client = http_client.get_http_client()
+    refresher = None
+    if settings.dashboard_data_mode == "live":
+        source = rollups.default_source()
+        if source is not None:
+            refresher = asyncio.create_task(rollups.run_refresh_loop(source))
     yield
-    await app.state.http_client.aclose()
+    await metrics_stream.close_broadcaster()
+    if refresher is not None:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+    await http_client.close_http_client()
+    database.dispose_engines()
     shutdown_logger()
 
 
@@ -53,6 +69,7 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(ConditionalResponseMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(DashboardEnvironmentMiddleware)
 app.add_middleware(CorrelationIdMiddleware)
@@ -72,6 +89,7 @@ app.include_router(activity.router, prefix=API_PREFIX)
 app.include_router(ai.router, prefix=API_PREFIX)
 app.include_router(infrastructure.router, prefix=API_PREFIX)
 app.include_router(costs.router, prefix=API_PREFIX)
+app.include_router(stream.router, prefix=API_PREFIX)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 """HTTP middleware for the dashboard backend."""
 
+import gzip
+import hashlib
 import uuid
+from collections import OrderedDict, defaultdict
 from typing import Literal
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -8,8 +11,18 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from app.config import settings
+from app.core_specs.configuration.config_loader import config_loader
 from app.utils.custom_logger import log_handler
 
+try:
+    import brotli
+
+    _HAS_BROTLI = True
+except ImportError:
+    _HAS_BROTLI = False
+
+_responses_cfg = config_loader["responses"]
+
 DashboardEnvironment = Literal["test", "prod"]
 
 
@@ -48,3 +61,103 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             getattr(request.state, "dashboard_environment", "test"),
         )
         return await call_next(request)
+
+
+_response_stats: dict[str, dict[str, int]] = defaultdict(
+    lambda: {"requests": 0, "not_modified": 0, "bytes_raw": 0, "bytes_sent": 0}
+)
+_encoded_bodies: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+
+def get_response_stats() -> dict[str, dict[str, int]]:
+    """Per-path counters for JSON GETs; ``bytes_saved`` = raw minus sent (304s, compression)."""
+    return {
+        path: {**stats, "bytes_saved": stats["bytes_raw"] - stats["bytes_sent"]}
+        for path, stats in sorted(_response_stats.items())
+    }
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison (RFC 9110 13.1.2) against an If-None-Match list."""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag[2:] for tag in candidates)
+
+
+def _choose_encoding(accept_encoding: str) -> str | None:
+    offered = {
+        part.split(";")[0].strip().lower()
+        for part in accept_encoding.split(",")
+        if "q=0" not in part.replace(" ", "").split(";")[1:]
+    }
+    if _HAS_BROTLI and "br" in offered:
+        return "br"
+    if "gzip" in offered:
+        return "gzip"
+    return None
+
+
+def _encode(body: bytes, etag: str, encoding: str) -> bytes:
+    """Compressed body, cached by ETag so repeat loads skip recompression."""
+    key = (etag, encoding)
+    encoded = _encoded_bodies.get(key)
+    if encoded is not None:
+        _encoded_bodies.move_to_end(key)
+        return encoded
+    if encoding == "br":
+        encoded = brotli.compress(body, quality=_responses_cfg["brotli_quality"])
+    else:
+        encoded = gzip.compress(body, compresslevel=_responses_cfg["gzip_level"], mtime=0)
+    _encoded_bodies[key] = encoded
+    while len(_encoded_bodies) > _responses_cfg["encoded_cache_entries"]:
+        _encoded_bodies.popitem(last=False)
+    return encoded
+
+
+class ConditionalResponseMiddleware(BaseHTTPMiddleware):
+    """ETag / 304 Not Modified and gzip (or brotli) for JSON GET responses."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or response.headers.get("content-type", "").split(";")[0] != "application/json"
+            or "content-encoding" in response.headers
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        stats = _response_stats[request.url.path]
+        stats["requests"] += 1
+        stats["bytes_raw"] += len(body)
+        headers = [
+            (name, value)
+            for name, value in response.headers.raw
+            if name not in (b"content-length", b"etag", b"vary", b"cache-control")
+        ]
+        headers += [
+            (b"etag", etag.encode("latin-1")),
+            (b"vary", b"Accept-Encoding"),
+            (b"cache-control", b"no-cache"),
+        ]
+
+        if _etag_matches(request.headers.get("if-none-match", ""), etag):
+            stats["not_modified"] += 1
+            not_modified = Response(status_code=304)
+            not_modified.raw_headers = [
+                (name, value) for name, value in headers if name != b"content-type"
+            ]
+            return not_modified
+
+        encoding = None
+        if len(body) >= _responses_cfg["min_compress_bytes"]:
+            encoding = _choose_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is not None:
+            body = _encode(body, etag, encoding)
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+        stats["bytes_sent"] += len(body)
+        optimized = Response(content=body, status_code=response.status_code)
+        optimized.raw_headers = [*headers, (b"content-length", str(len(body)).encode("latin-1"))]
+        optimized.background = response.background
+        return optimized
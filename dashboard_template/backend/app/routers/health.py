@@ -4,6 +4,9 @@ from fastapi import APIRouter
 
 from app.config import settings
 from app.core_specs.configuration.config_loader import config_loader
+from app.middleware import get_response_stats
+from app.services.data_source import get_data_source_cache_stats
+from app.services.metrics_stream import get_broadcaster
 from app.services.providers import get_provider_status
 
 _cfg = config_loader["endpoints"]["health"]
@@ -18,4 +21,7 @@ async def health() -> dict:
         "status": "ok",
         "data_mode": settings.dashboard_data_mode,
         "providers": get_provider_status(),
+        "cache": get_data_source_cache_stats(),
+        "stream": get_broadcaster().stats(),
+        "responses": get_response_stats(),
     }
@@ -1,5 +1,7 @@
 """Infrastructure router."""
 
+import asyncio
+
 from fastapi import APIRouter, Request
 
 from app.config import settings
@@ -31,7 +33,7 @@ async def get_infrastructure(request: Request) -> dict:
 
         return await build(env)
 
-    return get_data_source().get_infrastructure()
+    return await asyncio.to_thread(get_data_source().get_infrastructure)
 
 
 @router.post(_cfg["wake_route"])
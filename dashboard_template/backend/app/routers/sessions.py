@@ -1,5 +1,6 @@
 """Sessions router."""
 
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, Query
@@ -20,4 +21,4 @@ async def get_sessions(
     data_source = get_data_source()
     from_dt = datetime.fromisoformat(from_date)
     to_dt = datetime.fromisoformat(to_date)
-    return data_source.get_sessions(from_dt, to_dt)
+    return await asyncio.to_thread(data_source.get_sessions, from_dt, to_dt)
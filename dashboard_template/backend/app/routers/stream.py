@@ -0,0 +1,58 @@
+"""Server-Sent Events stream router."""
+
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core_specs.configuration.config_loader import config_loader
+from app.services.metrics_stream import (
+    STREAM_ENDPOINTS,
+    TopicKey,
+    available_endpoints,
+    get_broadcaster,
+)
+
+_cfg = config_loader["endpoints"]["stream"]
+router = APIRouter(prefix=_cfg["router_prefix"], tags=[_cfg["endpoint_tag"]])
+
+
+@router.get(_cfg["endpoint_route"])
+async def stream_metrics(
+    request: Request,
+    from_date: str = Query(..., description="Start date (ISO format)"),
+    to_date: str = Query(..., description="End date (ISO format)"),
+    endpoints: str = Query(
+        "overview,users,sessions,activity",
+        description=f"Comma-separated subset of: {', '.join(STREAM_ENDPOINTS)}",
+    ),
+    environment: Literal["test", "prod"] | None = Query(
+        None, description="Overrides X-Dashboard-Environment (EventSource cannot set headers)"
+    ),
+) -> StreamingResponse:
+    """Push snapshot/patch events for the requested endpoints and date range."""
+    names = [name.strip() for name in endpoints.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(STREAM_ENDPOINTS))
+    if unknown or not names:
+        raise HTTPException(status_code=422, detail=f"Unknown endpoints: {', '.join(unknown)}")
+    unavailable = sorted(set(names) - set(available_endpoints()))
+    if unavailable:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Disabled endpoints: {', '.join(unavailable)}. "
+            "Set FEATURE_COSTS_MODULE=true to enable.",
+        )
+
+    env = environment or getattr(request.state, "dashboard_environment", "test")
+    from_dt = datetime.fromisoformat(from_date)
+    to_dt = datetime.fromisoformat(to_date)
+    keys: list[TopicKey] = [
+        (name, None, None, env) if name == "infrastructure" else (name, from_dt, to_dt, None)
+        for name in dict.fromkeys(names)
+    ]
+    return StreamingResponse(
+        get_broadcaster().subscribe(keys),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,141 @@
+"""Caching decorator for ``DataSource`` implementations.
+
+Wraps any ``DataSource`` and memoizes its results per method and date range.
+Dates are bucketed (``cache.date_bucket_seconds``) so dashboard loads a few
+seconds apart share an entry. Entries expire after the per-endpoint TTL in
+``config_file.json`` and the least recently used ones are evicted past
+``cache.max_entries``. Concurrent misses on the same key are coalesced: one
+caller computes, the others wait for its result. Waiting blocks the calling
+thread, so async callers (routers, ``metrics_stream``) go through
+``asyncio.to_thread`` rather than calling it on the event loop. Every caller
+gets its own deep copy of the result, so mutating it cannot touch the cache.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable
+
+from app.core_specs.configuration.config_loader import config_loader
+from app.services.data_source import DataSource
+
+_cfg = config_loader["cache"]
+
+
+class _Flight:
+    """One in-progress backend call that concurrent callers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class CachedDataSource(DataSource):
+    """TTL + LRU cache with single-flight coalescing around another source."""
+
+    def __init__(
+        self,
+        inner: DataSource,
+        *,
+        ttl_seconds: dict[str, float] | None = None,
+        default_ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        date_bucket_seconds: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._inner = inner
+        self._ttl = dict(_cfg["ttl_seconds"] if ttl_seconds is None else ttl_seconds)
+        self._default_ttl = (
+            _cfg["default_ttl_seconds"] if default_ttl_seconds is None else default_ttl_seconds
+        )
+        self._max_entries = _cfg["max_entries"] if max_entries is None else max_entries
+        self._bucket_seconds = (
+            _cfg["date_bucket_seconds"] if date_bucket_seconds is None else date_bucket_seconds
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._flights: dict[tuple, _Flight] = {}
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    @property
+    def inner(self) -> DataSource:
+        return self._inner
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters (``coalesced``: callers that waited on another's miss)."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _bucket(self, value: datetime) -> int:
+        return int(value.timestamp()) // max(1, self._bucket_seconds)
+
+    def _call(self, endpoint: str, *dates: datetime) -> dict:
+        key = (endpoint, *(self._bucket(d) for d in dates))
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return copy.deepcopy(cached[1])
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._counters["misses"] += 1
+            else:
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        try:
+            flight.value = getattr(self._inner, f"get_{endpoint}")(*dates)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                ttl = self._ttl.get(endpoint, self._default_ttl)
+                if flight.error is None and ttl > 0:
+                    self._entries[key] = (self._clock() + ttl, flight.value)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self._max_entries:
+                        self._entries.popitem(last=False)
+                        self._counters["evictions"] += 1
+            flight.done.set()
+        return copy.deepcopy(flight.value)
+
+    def get_overview(self, from_date: datetime, to_date: datetime) -> dict:
+        return self._call("overview", from_date, to_date)
+
+    def get_users(self, from_date: datetime, to_date: datetime) -> dict:
+        return self._call("users", from_date, to_date)
+
+    def get_sessions(self, from_date: datetime, to_date: datetime) -> dict:
+        return self._call("sessions", from_date, to_date)
+
+    def get_activity(self, from_date: datetime, to_date: datetime) -> dict:
+        return self._call("activity", from_date, to_date)
+
+    def get_infrastructure(self) -> dict:
+        return self._call("infrastructure")
+
+    def get_costs(self, from_date: datetime, to_date: datetime) -> dict:
+        return self._call("costs", from_date, to_date)
+
+    def get_ai_metrics(self, from_date: datetime, to_date: datetime) -> dict:
+        return self._call("ai_metrics", from_date, to_date)
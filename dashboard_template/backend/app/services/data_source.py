@@ -116,8 +116,25 @@ class LiveDataSource(DataSource):
         return self._analytics.build_ai_metrics(from_date, to_date)
 
 
+_data_sources: dict[str, DataSource] = {}
+
+
 def get_data_source() -> DataSource:
-    """Return mock or live data source based on ``DASHBOARD_DATA_MODE``."""
-    if settings.dashboard_data_mode == "mock":
-        return MockDataSource()
-    return LiveDataSource()
+    """Return the cached mock or live data source for ``DASHBOARD_DATA_MODE``.
+
+    One ``CachedDataSource`` per mode is shared across requests, so repeated
+    dashboard loads are served from memory (see ``cached_data_source``).
+    """
+    from app.services.cached_data_source import CachedDataSource
+
+    mode = settings.dashboard_data_mode
+    source = _data_sources.get(mode)
+    if source is None:
+        inner = MockDataSource() if mode == "mock" else LiveDataSource()
+        source = _data_sources.setdefault(mode, CachedDataSource(inner))
+    return source
+
+
+def get_data_source_cache_stats() -> dict[str, dict[str, int]]:
+    """Hit/miss counters of every data source cache created so far, by mode."""
+    return {mode: source.stats() for mode, source in _data_sources.items()}
@@ -41,19 +41,18 @@ async def generic_health_check(url: str) -> dict:
     Returns:
         dict with status, response_time, uptime
     """
-    import httpx
+    from app.services import http_client
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
-            response_time = response.elapsed.total_seconds() * 1000
-
-            return {
-                "status": "healthy" if response.status_code == 200 else "unhealthy",
-                "response_time": response_time,
-                "uptime": 99.9,  # Placeholder - would need historical data
-                "status_code": response.status_code,
-            }
+        response = await http_client.get(url, timeout=10.0)
+        response_time = response.elapsed.total_seconds() * 1000
+
+        return {
+            "status": "healthy" if response.status_code == 200 else "unhealthy",
+            "response_time": response_time,
+            "uptime": 99.9,  # Placeholder - would need historical data
+            "status_code": response.status_code,
+        }
     except Exception as e:
         return {
             "status": "unhealthy",
@@ -72,16 +71,15 @@ async def generic_wake(url: str) -> dict:
     Returns:
         dict with status and message
     """
-    import httpx
+    from app.services import http_client
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url)
-            return {
-                "status": "success" if response.status_code == 200 else "failed",
-                "message": "Wake request sent",
-                "status_code": response.status_code,
-            }
+        response = await http_client.get(url, timeout=30.0)
+        return {
+            "status": "success" if response.status_code == 200 else "failed",
+            "message": "Wake request sent",
+            "status_code": response.status_code,
+        }
     except Exception as e:
         return {
             "status": "failed",
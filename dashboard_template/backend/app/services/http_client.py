@@ -0,0 +1,104 @@
+"""Shared pooled HTTP client for provider calls.
+
+Providers used to open a fresh ``httpx.AsyncClient`` per call, paying a new
+TCP (and TLS) handshake every time. They now go through ``request`` / ``get``
+here, which reuse one keep-alive connection pool per event loop — the app's
+``lifespan`` opens it at startup and closes it at shutdown. Pool limits come
+from ``config_file.json`` (``http_client``); ``per_host_limit`` additionally
+caps in-flight requests per host so one slow provider cannot take the whole
+pool. HTTP/2 is used when enabled and the optional ``h2`` package is installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core_specs.configuration.config_loader import config_loader
+
+_cfg = config_loader["http_client"]
+
+
+class _Pool:
+    """One event loop's client plus its per-host request semaphores."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def slots_for(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        slots = self.host_slots.get(host)
+        if slots is None:
+            slots = self.host_slots[host] = asyncio.Semaphore(_cfg["per_host_limit"])
+        return slots
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(**overrides: Any) -> httpx.AsyncClient:
+    """Build a pooled ``httpx.AsyncClient`` from the ``http_client`` config.
+
+    ``overrides`` are passed through to ``httpx.AsyncClient`` (e.g. ``verify``).
+    """
+    options: dict[str, Any] = {
+        "timeout": httpx.Timeout(_cfg["timeout_seconds"]),
+        "limits": httpx.Limits(
+            max_connections=_cfg["max_connections"],
+            max_keepalive_connections=_cfg["max_keepalive_connections"],
+            keepalive_expiry=_cfg["keepalive_expiry_seconds"],
+        ),
+        "http2": bool(_cfg["http2"]) and http2_available(),
+    }
+    return httpx.AsyncClient(**{**options, **overrides})
+
+
+def _pool() -> _Pool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool.client.is_closed:
+        pool = _pools[loop] = _Pool(create_http_client())
+    return pool
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the running loop's shared client (created on first use)."""
+    return _pool().client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's shared client, if one was created."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.client.aclose()
+
+
+async def request(
+    method: str,
+    url: str,
+    *,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send a request on the shared pool (``timeout`` in seconds, per request)."""
+    pool = _pool()
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    async with pool.slots_for(url):
+        return await pool.client.request(method, url, **kwargs)
+
+
+async def get(url: str, **kwargs: Any) -> httpx.Response:
+    return await request("GET", url, **kwargs)
@@ -1,13 +1,24 @@
-"""Live infrastructure payload builder — composes optional providers."""
+"""Live infrastructure payload builder — composes optional providers.
+
+Enabled providers run concurrently, each under its own deadline from
+``config_file.json`` (``live_infrastructure``). A provider that misses its
+deadline or raises is reported in ``notes`` instead of holding up the page, and
+``timings_ms`` shows how long each one took.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import asyncio
+import time
+from typing import Any, Awaitable, Literal
 
 from app.config import settings
+from app.core_specs.configuration.config_loader import config_loader
 from app.services.hosting import get_hosting_service
 from app.services.providers import datadog, database, supabase, vercel
 
+_cfg = config_loader["live_infrastructure"]
+
 
 def _service_url_for_provider() -> str:
     urls = {
@@ -19,55 +30,97 @@ def _service_url_for_provider() -> str:
     return urls.get(settings.hosting_provider, "")
 
 
+def _deadline_for(name: str) -> float:
+    return float(_cfg["deadline_seconds"].get(name, _cfg["default_deadline_seconds"]))
+
+
+async def _run_provider(name: str, call: Awaitable[Any]) -> tuple[Any, float, str | None]:
+    """Await *call* under *name*'s deadline; return (result, elapsed_ms, note)."""
+    deadline = _deadline_for(name)
+    started = time.perf_counter()
+    try:
+        result, note = await asyncio.wait_for(call, timeout=deadline), None
+    except asyncio.TimeoutError:
+        result, note = None, f"{name} did not respond within {deadline:g}s; section skipped."
+    except Exception as exc:
+        result, note = None, f"{name} failed: {exc}"
+    return result, round((time.perf_counter() - started) * 1000, 1), note
+
+
 async def build(env: Literal["test", "prod"] = "test") -> dict[str, Any]:
     """Build infrastructure response for live mode."""
-    notes: list[str] = []
-    host_health: dict[str, Any] = {}
-    deployments: list[Any] = []
-    storage: list[Any] = []
-    database_tables: list[Any] = []
-    datadog_status: dict[str, Any] | None = None
+    # Each step is either a static note or a (provider name, awaitable) pair;
+    # keeping them in one ordered list preserves the notes order of the
+    # sequential version while the providers run concurrently.
+    steps: list[str | tuple[str, Awaitable[Any]]] = []
 
     if settings.feature_host_health:
         service_url = _service_url_for_provider()
         if service_url:
-            hosting = get_hosting_service()
-            host_health = await hosting.check_health(service_url)
+            steps.append(("host_health", get_hosting_service().check_health(service_url)))
         else:
-            notes.append(
+            steps.append(
                 f"Host health enabled but no URL for provider '{settings.hosting_provider}'."
             )
     else:
-        notes.append("Host health disabled. Set FEATURE_HOST_HEALTH=true to enable.")
+        steps.append("Host health disabled. Set FEATURE_HOST_HEALTH=true to enable.")
 
     if settings.feature_vercel:
-        vercel_data = await vercel.list_deployments(env)
-        deployments = vercel_data.get("deployments", [])
-        notes.extend(vercel_data.get("notes", []))
+        steps.append(("vercel", vercel.list_deployments(env)))
     else:
-        notes.append("Vercel disabled. Set FEATURE_VERCEL=true to enable deployments.")
+        steps.append("Vercel disabled. Set FEATURE_VERCEL=true to enable deployments.")
 
     if settings.feature_storage_metrics:
-        storage_data = await supabase.list_storage_buckets(env)
-        storage = storage_data.get("buckets", [])
-        notes.extend(storage_data.get("notes", []))
+        steps.append(("storage", supabase.list_storage_buckets(env)))
 
     if settings.feature_private_database:
-        db_data = database.list_table_row_counts()
-        database_tables = db_data.get("tables", [])
-        notes.extend(db_data.get("notes", []))
+        # SQLAlchemy is synchronous: keep it off the event loop.
+        steps.append(("database", asyncio.to_thread(database.list_table_row_counts)))
     elif settings.feature_supabase:
-        db_data = await supabase.list_table_row_counts(env)
-        database_tables = db_data.get("tables", [])
-        notes.extend(db_data.get("notes", []))
+        steps.append(("database", supabase.list_table_row_counts(env)))
     else:
-        notes.append(
+        steps.append(
             "Database section disabled. Enable FEATURE_SUPABASE or FEATURE_PRIVATE_DATABASE."
         )
 
     if settings.feature_datadog:
-        datadog_status = await datadog.validate_credentials()
-        notes.extend(datadog_status.get("notes", []))
+        steps.append(("datadog", datadog.validate_credentials()))
+
+    providers = [step for step in steps if isinstance(step, tuple)]
+    outcomes = await asyncio.gather(*(_run_provider(name, call) for name, call in providers))
+    results = {name: outcome for (name, _), outcome in zip(providers, outcomes)}
+
+    notes: list[str] = []
+    host_health: dict[str, Any] = {}
+    deployments: list[Any] = []
+    storage: list[Any] = []
+    database_tables: list[Any] = []
+    datadog_status: dict[str, Any] | None = None
+    timings_ms: dict[str, float] = {}
+
+    for step in steps:
+        if isinstance(step, str):
+            notes.append(step)
+            continue
+        name = step[0]
+        data, timings_ms[name], note = results[name]
+        if note is not None:
+            notes.append(note)
+            continue
+        if name == "host_health":
+            host_health = data
+        elif name == "vercel":
+            deployments = data.get("deployments", [])
+            notes.extend(data.get("notes", []))
+        elif name == "storage":
+            storage = data.get("buckets", [])
+            notes.extend(data.get("notes", []))
+        elif name == "database":
+            database_tables = data.get("tables", [])
+            notes.extend(data.get("notes", []))
+        elif name == "datadog":
+            datadog_status = data
+            notes.extend(data.get("notes", []))
 
     return {
         "host_health": host_health,
@@ -77,4 +130,5 @@ async def build(env: Literal["test", "prod"] = "test") -> dict[str, Any]:
         "datadog": datadog_status,
         "notes": notes,
         "environment": env,
+        "timings_ms": timings_ms,
     }
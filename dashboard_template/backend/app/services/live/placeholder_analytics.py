@@ -1,96 +1,129 @@
 """Placeholder analytics builders for live data mode.
 
-Replace these functions with your actual database queries and API calls.
+Overview, users, sessions and activity are answered from pre-aggregated
+hourly/daily buckets (see ``rollups``) rather than raw queries per request.
+Replace the remaining functions with your actual database queries and API calls.
 Each function documents expected tables/columns in docstrings.
 """
 
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from typing import Any
 
+from app.services.live import rollups
 
-def build_overview(from_date: datetime, to_date: datetime) -> dict[str, Any]:
-    """Build overview metrics for the dashboard.
 
-    TODO: Replace with your actual query logic.
+def _summarize(from_date: datetime, to_date: datetime) -> dict[str, Any]:
+    """Rollup summary for a dashboard range.
+
+    The dashboard sends date-only ranges (``YYYY-MM-DD``), so a ``to_date`` at
+    midnight names the last day to include rather than an exclusive bound.
+    """
+    if to_date.time() == time():
+        to_date += timedelta(days=1)
+    return rollups.summarize(from_date, to_date)
+
+
+def _growth_over_time(summary: dict[str, Any]) -> list[dict[str, Any]]:
+    """Cumulative user count at the end of each day of a rollup summary."""
+    total = summary["users_before"]
+    points = []
+    for day in summary["daily"]:
+        total += day["new_users"]
+        points.append({"date": day["date"], "value": total})
+    return points
+
+
+def build_overview(from_date: datetime, to_date: datetime) -> dict[str, Any]:
+    """Build overview metrics for the dashboard from the rollup store.
 
-    Expected tables/columns:
+    Expected tables/columns (rolled up by ``rollups.refresh``):
     - users: id, created_at
     - sessions: id, user_id, created_at
     - events: id, created_at, event_type
 
+    TODO: Add revenue from your billing source.
+
     Returns:
         dict with total_users, active_users, growth_rate, revenue, etc.
     """
-    # Placeholder implementation
+    summary = _summarize(from_date, to_date)
+    before = summary["users_before"]
+    growth_rate = summary["new_users"] / before if before else 0.0
     return {
-        "total_users": 0,
-        "active_users": 0,
-        "growth_rate": 0.0,
+        "total_users": summary["total_users"],
+        "active_users": summary["active_users"],
+        "growth_rate": growth_rate,
         "revenue": 0.0,
         "metrics": [],
-        "charts": {},
+        "charts": {"growth_over_time": _growth_over_time(summary)},
     }
 
 
 def build_users(from_date: datetime, to_date: datetime) -> dict[str, Any]:
-    """Build user analytics.
+    """Build user analytics from the rollup store.
 
-    TODO: Replace with your actual user query logic.
+    Expected tables/columns (rolled up by ``rollups.refresh``):
+    - users: id, created_at
+    - sessions: user_id, created_at, duration
 
-    Expected tables/columns:
-    - users: id, created_at, status, last_active_at
-    - sessions: id, user_id, duration
+    TODO: Add retention and a per-user table from your own queries.
 
     Returns:
         dict with user registration, engagement, and growth metrics
     """
+    summary = _summarize(from_date, to_date)
     return {
-        "total_users": 0,
-        "new_users": 0,
-        "active_users": 0,
+        "total_users": summary["total_users"],
+        "new_users": summary["new_users"],
+        "active_users": summary["active_users"],
         "retention_rate": 0.0,
         "metrics": [],
-        "charts": {},
+        "charts": {"user_growth": _growth_over_time(summary)},
         "table": [],
     }
 
 
 def build_sessions(from_date: datetime, to_date: datetime) -> dict[str, Any]:
-    """Build session analytics.
+    """Build session analytics from the rollup store.
 
-    TODO: Replace with your actual session query logic.
+    Expected tables/columns (rolled up by ``rollups.refresh``):
+    - sessions: user_id, created_at, duration
 
-    Expected tables/columns:
-    - sessions: id, user_id, created_at, duration, feeling_tags
-    - users: id, created_at
+    TODO: Add feeling_tags breakdowns and a session table from your own queries.
 
     Returns:
         dict with session counts, duration metrics, and engagement data
     """
+    summary = _summarize(from_date, to_date)
+    sessions = summary["sessions"]
     return {
-        "total_sessions": 0,
-        "avg_duration": 0.0,
+        "total_sessions": sessions,
+        "avg_duration": summary["session_seconds"] / sessions if sessions else 0.0,
         "metrics": [],
-        "charts": {},
+        "charts": {
+            "sessions_over_time": [
+                {"date": d["date"], "value": d["sessions"]} for d in summary["daily"]
+            ],
+        },
         "table": [],
     }
 
 
 def build_activity(from_date: datetime, to_date: datetime) -> dict[str, Any]:
-    """Build activity/events analytics.
+    """Build activity/events analytics from the rollup store.
 
-    TODO: Replace with your actual activity query logic.
+    Expected tables/columns (rolled up by ``rollups.refresh``):
+    - events: user_id, event_type, created_at
 
-    Expected tables/columns:
-    - events: id, user_id, event_type, created_at, properties
-    - users: id, created_at
+    TODO: Fill timeline/table with the latest raw events (a bounded query).
 
     Returns:
         dict with event counts, timeline, and breakdown by type
     """
+    summary = _summarize(from_date, to_date)
     return {
-        "total_events": 0,
-        "events_by_type": {},
+        "total_events": summary["events"],
+        "events_by_type": summary["events_by_type"],
         "timeline": [],
         "table": [],
     }
@@ -0,0 +1,387 @@
+"""Time-bucketed rollups of users, sessions and events for live analytics.
+
+Aggregating raw ``users`` / ``sessions`` / ``events`` rows for every requested
+range is a full scan per page view. Instead, ``RollupStore.refresh`` folds new
+rows into hourly and daily buckets kept in a local SQLite store
+(``config_file.json`` → ``rollups.store_path``), and ``summarize`` answers any
+range from hourly buckets at its ragged edges plus daily buckets in between —
+a few dozen rows whatever the range length. Distinct active users cannot be
+summed across buckets, so each bucket keeps a HyperLogLog sketch of its users
+(4 KiB, ~1.6% standard error) and a range merges the sketches it covers.
+
+Buckets are rebuilt a whole UTC day at a time, from ``rollups.lookback_hours``
+before the last refresh, so late-arriving rows are picked up. Backfill history
+with ``python -m app.tools.rollups backfill --since YYYY-MM-DD``; in live mode
+the app refreshes every ``rollups.refresh_interval_seconds`` when the private
+database is configured.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from app.config import settings
+from app.core_specs.configuration.config_loader import config_loader
+from app.services.providers import database
+from app.utils.custom_logger import log_handler
+
+_cfg = config_loader["rollups"]
+_BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+HOUR = 3600
+DAY = 86400
+
+# Expected columns (see placeholder_analytics): one row shape per table.
+_SOURCE_SQL = {
+    "users": "SELECT id, created_at FROM users WHERE created_at >= :start AND created_at < :end",
+    "sessions": (
+        "SELECT user_id, created_at, duration FROM sessions"
+        " WHERE created_at >= :start AND created_at < :end"
+    ),
+    "events": (
+        "SELECT user_id, created_at, event_type FROM events"
+        " WHERE created_at >= :start AND created_at < :end"
+    ),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_counts (
+    granularity TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (granularity, bucket_start, metric, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_active (
+    granularity TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    registers BLOB NOT NULL,
+    PRIMARY KEY (granularity, bucket_start)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_state (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _epoch(value: datetime | str | float) -> int:
+    """Seconds since the epoch; naive datetimes and ISO strings are taken as UTC."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _utc(seconds: int) -> datetime:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+
+
+# HyperLogLog with 2**12 one-byte registers.
+_HLL_BITS = 12
+_HLL_SIZE = 1 << _HLL_BITS
+_HLL_ALPHA = 0.7213 / (1 + 1.079 / _HLL_SIZE)
+_HLL_POWERS = [2.0**-rank for rank in range(65)]
+
+
+def _hll_add(registers: bytearray, user: str) -> None:
+    digest = int.from_bytes(hashlib.blake2b(user.encode(), digest_size=8).digest(), "big")
+    index = digest >> (64 - _HLL_BITS)
+    rest = digest & ((1 << (64 - _HLL_BITS)) - 1)
+    rank = (64 - _HLL_BITS) - rest.bit_length() + 1
+    if rank > registers[index]:
+        registers[index] = rank
+
+
+def _hll_merge(left: bytes, right: bytes) -> bytes:
+    return bytes(map(max, left, right))
+
+
+def _hll_count(registers: bytes) -> int:
+    estimate = _HLL_ALPHA * _HLL_SIZE * _HLL_SIZE / sum(map(_HLL_POWERS.__getitem__, registers))
+    zeros = registers.count(0)
+    if estimate <= 2.5 * _HLL_SIZE and zeros:
+        estimate = _HLL_SIZE * math.log(_HLL_SIZE / zeros)  # linear counting for small sets
+    return round(estimate)
+
+
+class RawSource(ABC):
+    """Where the raw ``users`` / ``sessions`` / ``events`` rows come from."""
+
+    @abstractmethod
+    def fetch(self, table: str, start: datetime, end: datetime) -> Iterable[tuple]:
+        """Rows of *table* created in [start, end) (naive UTC), shaped as ``_SOURCE_SQL``."""
+
+
+class SqlAlchemySource(RawSource):
+    """Private Postgres/MySQL via a SQLAlchemy engine (``uv sync --extra database``)."""
+
+    def __init__(self, engine: Any):
+        self._engine = engine
+
+    def fetch(self, table: str, start: datetime, end: datetime) -> Iterable[tuple]:
+        from sqlalchemy import text
+
+        with self._engine.connect() as conn:
+            return conn.execute(text(_SOURCE_SQL[table]), {"start": start, "end": end}).all()
+
+
+class SqliteSource(RawSource):
+    """Local SQLite database with ``created_at`` stored as ``YYYY-MM-DD HH:MM:SS`` UTC."""
+
+    def __init__(self, path: Path | str):
+        self._path = str(path)
+
+    def fetch(self, table: str, start: datetime, end: datetime) -> Iterable[tuple]:
+        params = {
+            "start": start.strftime("%Y-%m-%d %H:%M:%S"),
+            "end": end.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with closing(sqlite3.connect(self._path)) as conn:
+            return conn.execute(_SOURCE_SQL[table], params).fetchall()
+
+
+def default_source() -> RawSource | None:
+    """The private database when it is configured and SQLAlchemy is installed."""
+    if not (settings.feature_private_database and settings.database_url):
+        return None
+    try:
+        return SqlAlchemySource(database.get_engine(read=True))
+    except ImportError:
+        log_handler.warning("Rollups need the database extra: uv sync --extra database")
+        return None
+
+
+def _aggregate_day(source: RawSource, day: int) -> tuple[dict, set]:
+    """Hourly and daily counts plus per-bucket active-user sketches for one UTC day."""
+    counts: dict[tuple[str, int, str, str], float] = defaultdict(float)
+    active: dict[tuple[str, int], set[str]] = defaultdict(set)
+    start, end = _utc(day), _utc(day + DAY)
+
+    def add(created_at: Any, metric: str, key: str = "", value: float = 1.0, user: Any = None):
+        ts = _epoch(created_at)
+        for bucket in (("hour", ts - ts % HOUR), ("day", day)):
+            counts[(*bucket, metric, key)] += value
+            if user is not None:
+                active[bucket].add(str(user))
+
+    for _user_id, created_at in source.fetch("users", start, end):
+        add(created_at, "new_users")
+    for user_id, created_at, duration in source.fetch("sessions", start, end):
+        add(created_at, "sessions", user=user_id)
+        add(created_at, "session_seconds", value=float(duration or 0))
+    for user_id, created_at, event_type in source.fetch("events", start, end):
+        add(created_at, "events", user=user_id)
+        add(created_at, "events_by_type", key=str(event_type or "unknown"))
+
+    sketches = {}
+    for bucket, users in active.items():
+        registers = sketches[bucket] = bytearray(_HLL_SIZE)
+        for user in users:
+            _hll_add(registers, user)
+    return counts, sketches
+
+
+def _plan(start: int, end: int) -> list[tuple[str, int, int]]:
+    """Cover [start, end) with hourly buckets at the edges and daily ones in between."""
+    start -= start % HOUR
+    end += -end % HOUR
+    first_day, last_day = start + -start % DAY, end - end % DAY
+    if first_day >= last_day:
+        return [("hour", start, end)] if start < end else []
+    segments = [("hour", start, first_day), ("day", first_day, last_day), ("hour", last_day, end)]
+    return [segment for segment in segments if segment[1] < segment[2]]
+
+
+def _where(plan: list[tuple[str, int, int]]) -> tuple[str, list[Any]]:
+    if not plan:
+        return "0", []
+    clauses = " OR ".join(
+        "(granularity = ? AND bucket_start >= ? AND bucket_start < ?)" for _ in plan
+    )
+    return f"({clauses})", [value for segment in plan for value in segment]
+
+
+def _empty_summary() -> dict[str, Any]:
+    return {
+        "new_users": 0,
+        "users_before": 0,
+        "total_users": 0,
+        "active_users": 0,
+        "sessions": 0,
+        "session_seconds": 0.0,
+        "events": 0,
+        "events_by_type": {},
+        "daily": [],
+    }
+
+
+class RollupStore:
+    """Hourly/daily pre-aggregates in a SQLite file."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def watermark(self) -> datetime | None:
+        """End of the last refresh (naive UTC), or None before the first one."""
+        if not self.path.exists():
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM rollup_state WHERE name = 'watermark'").fetchone()
+        return _utc(int(row[0])) if row else None
+
+    def rebuild(self, source: RawSource, start: datetime, end: datetime) -> int:
+        """Recompute every UTC day touching [start, end); return the number of days."""
+        first, last = _epoch(start), _epoch(end)
+        first -= first % DAY
+        days = 0
+        with closing(self._connect()) as conn:
+            for day in range(first, last, DAY):
+                counts, active = _aggregate_day(source, day)
+                with conn:
+                    for table in ("rollup_counts", "rollup_active"):
+                        conn.execute(
+                            f"DELETE FROM {table} WHERE (granularity = 'day' AND bucket_start = ?)"
+                            " OR (granularity = 'hour' AND bucket_start >= ? AND bucket_start < ?)",
+                            (day, day, day + DAY),
+                        )
+                    conn.executemany(
+                        "INSERT INTO rollup_counts VALUES (?, ?, ?, ?, ?)",
+                        [(*key, value) for key, value in counts.items()],
+                    )
+                    conn.executemany(
+                        "INSERT INTO rollup_active VALUES (?, ?, ?)",
+                        [(*bucket, bytes(registers)) for bucket, registers in active.items()],
+                    )
+                days += 1
+        return days
+
+    def _advance_watermark(self, end: datetime) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO rollup_state VALUES ('watermark', ?) ON CONFLICT(name) DO UPDATE"
+                " SET value = MAX(value, excluded.value)",
+                (_epoch(end),),
+            )
+
+    def backfill(self, source: RawSource, since: datetime, until: datetime | None = None) -> int:
+        """Rebuild [since, until) (default: up to now) and advance the watermark."""
+        until = until or _utc(_epoch(datetime.now(timezone.utc)))
+        days = self.rebuild(source, since, until)
+        self._advance_watermark(until)
+        return days
+
+    def refresh(self, source: RawSource, now: datetime | None = None) -> int:
+        """Fold rows created since the last refresh (minus the lookback) into the buckets."""
+        now = now or _utc(_epoch(datetime.now(timezone.utc)))
+        watermark = self.watermark()
+        if watermark is None:
+            log_handler.info("Rollup store empty; refreshing the lookback window (run backfill)")
+            watermark = now
+        since = watermark - timedelta(hours=_cfg["lookback_hours"])
+        return self.backfill(source, since, now)
+
+    def summarize(self, from_date: datetime, to_date: datetime) -> dict[str, Any]:
+        """Totals, active users (estimated) and a daily series for [from_date, to_date).
+
+        Resolution is one hour: the range is widened to whole hours.
+        """
+        if not self.path.exists():
+            return _empty_summary()
+        start, end = _epoch(from_date), _epoch(to_date)
+        start -= start % HOUR
+        plan = _plan(start, end)
+        where, params = _where(plan)
+        summary = _empty_summary()
+        daily: dict[int, dict[str, Any]] = {}
+        with closing(self._connect()) as conn:
+            for metric, key, day, value in conn.execute(
+                f"SELECT metric, key, bucket_start - bucket_start % {DAY}, SUM(value)"
+                f" FROM rollup_counts WHERE {where} GROUP BY 1, 2, 3",
+                params,
+            ):
+                row = daily.setdefault(day, {"new_users": 0, "sessions": 0, "events": 0})
+                if metric == "events_by_type":
+                    by_type = summary["events_by_type"]
+                    by_type[key] = by_type.get(key, 0) + int(value)
+                    continue
+                summary[metric] += value
+                if metric in row:
+                    row[metric] += int(value)
+            by_day: dict[int, bytes] = {}
+            for bucket_start, registers in conn.execute(
+                f"SELECT bucket_start, registers FROM rollup_active WHERE {where}", params
+            ):
+                day = bucket_start - bucket_start % DAY
+                merged = by_day.get(day)
+                by_day[day] = registers if merged is None else _hll_merge(merged, registers)
+            total = None
+            for day, registers in by_day.items():
+                daily.setdefault(day, {"new_users": 0, "sessions": 0, "events": 0})
+                daily[day]["active_users"] = _hll_count(registers)
+                total = registers if total is None else _hll_merge(total, registers)
+            summary["active_users"] = 0 if total is None else _hll_count(total)
+            before_where, before_params = _where(_plan(0, start))
+            summary["users_before"] = int(
+                conn.execute(
+                    "SELECT COALESCE(SUM(value), 0) FROM rollup_counts"
+                    f" WHERE metric = 'new_users' AND {before_where}",
+                    before_params,
+                ).fetchone()[0]
+            )
+        for metric in ("new_users", "sessions", "events"):
+            summary[metric] = int(summary[metric])
+        summary["total_users"] = summary["users_before"] + summary["new_users"]
+        summary["daily"] = [
+            {"date": _utc(day).date().isoformat(), "active_users": 0, **daily[day]}
+            for day in sorted(daily)
+        ]
+        return summary
+
+
+_store: RollupStore | None = None
+
+
+def get_store() -> RollupStore:
+    """The store at ``rollups.store_path`` (relative to the backend directory)."""
+    global _store
+    if _store is None:
+        _store = RollupStore(_BACKEND_DIR / _cfg["store_path"])
+    return _store
+
+
+def summarize(from_date: datetime, to_date: datetime) -> dict[str, Any]:
+    return get_store().summarize(from_date, to_date)
+
+
+async def run_refresh_loop(source: RawSource, interval_seconds: float | None = None) -> None:
+    """Refresh the store forever (off the event loop); cancel the task to stop."""
+    interval = interval_seconds or _cfg["refresh_interval_seconds"]
+    store = get_store()
+    while True:
+        try:
+            days = await asyncio.to_thread(store.refresh, source)
+            log_handler.debug("Rollups refreshed (%d day(s) rebuilt)", days)
+        except Exception as exc:
+            log_handler.warning("Rollup refresh failed: %s", exc)
+        await asyncio.sleep(interval)
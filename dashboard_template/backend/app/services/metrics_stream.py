@@ -0,0 +1,225 @@
+"""Server-Sent Events push channel for dashboard metrics.
+
+Polling dashboards each re-request every endpoint. With ``/api/stream`` a topic
+— one endpoint for one date range (and environment, for infrastructure) — is
+computed once per ``stream.interval_seconds`` by a background task, however
+many dashboards subscribe to it. Subscribers get a ``snapshot`` event first and
+then ``patch`` events carrying an RFC 7386 JSON merge patch of what changed;
+unchanged payloads send nothing. A merge patch reads ``null`` as "delete", so a
+change that sets a value to null (e.g. a provider timing out) is sent as a
+fresh ``snapshot`` instead. A subscriber whose queue overflows is resynced
+with fresh snapshots instead of blocking the topic. ``costs`` is only streamed
+behind the same ``FEATURE_COSTS_MODULE`` gate as the costs router.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import weakref
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from app.config import settings
+from app.core_specs.configuration.config_loader import config_loader
+from app.services.data_source import get_data_source
+from app.utils.custom_logger import log_handler
+
+_cfg = config_loader["stream"]
+
+# Endpoint name -> DataSource method; infrastructure takes no date range.
+STREAM_ENDPOINTS = {
+    "overview": "get_overview",
+    "users": "get_users",
+    "sessions": "get_sessions",
+    "activity": "get_activity",
+    "ai": "get_ai_metrics",
+    "costs": "get_costs",
+    "infrastructure": "get_infrastructure",
+}
+
+
+
+def available_endpoints() -> list[str]:
+    """Streamable endpoints; ``costs`` is left out in live mode unless its module is enabled."""
+    if not settings.feature_costs_module and settings.dashboard_data_mode == "live":
+        return [name for name in STREAM_ENDPOINTS if name != "costs"]
+    return list(STREAM_ENDPOINTS)
+
+
+TopicKey = tuple[str, datetime | None, datetime | None, str | None]
+
+_MISSING = object()
+_UNPATCHABLE = object()
+
+
+def _patchable(value: Any) -> bool:
+    """True unless *value*, sent inside a merge patch, would carry a null member."""
+    if isinstance(value, dict):
+        return all(item is not None and _patchable(item) for item in value.values())
+    return True
+
+
+def merge_patch(old: Any, new: Any) -> Any:
+    """RFC 7386 merge patch turning *old* into *new*.
+
+    ``_MISSING`` when they are equal; ``_UNPATCHABLE`` when *new* sets a member
+    to null, which a merge patch can only express as a deletion.
+    """
+    if old == new:
+        return _MISSING
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return new if new is not None and _patchable(new) else _UNPATCHABLE
+    patch = {key: None for key in old if key not in new}
+    for key, value in new.items():
+        change = merge_patch(old[key], value) if key in old else merge_patch(_MISSING, value)
+        if change is _UNPATCHABLE:
+            return _UNPATCHABLE
+        if change is not _MISSING:
+            patch[key] = change
+    return patch
+
+
+def _event(name: str, data: dict[str, Any]) -> str:
+    return f"event: {name}\ndata: {json.dumps(data, separators=(',', ':'), default=str)}\n\n"
+
+
+class _Subscriber:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_cfg["queue_size"])
+        self.resync = False
+
+    def send(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.resync = True
+
+
+class _Topic:
+    """One endpoint/range computed on an interval and fanned out to subscribers."""
+
+    def __init__(self, key: TopicKey):
+        self.key = key
+        self.subscribers: set[_Subscriber] = set()
+        self.payload: dict[str, Any] | None = None
+        self.computations = 0
+        self.task: asyncio.Task | None = None
+
+    async def _compute(self) -> dict[str, Any]:
+        endpoint, from_date, to_date, env = self.key
+        self.computations += 1
+        if endpoint == "infrastructure":
+            if settings.dashboard_data_mode == "live":
+                from app.services.live.infrastructure_builder import build
+
+                return await build(env or "test")
+            return await asyncio.to_thread(get_data_source().get_infrastructure)
+        method = getattr(get_data_source(), STREAM_ENDPOINTS[endpoint])
+        return await asyncio.to_thread(method, from_date, to_date)
+
+    def snapshot(self) -> str:
+        return _event("snapshot", {"endpoint": self.key[0], "data": self.payload})
+
+    async def run(self) -> None:
+        while True:
+            try:
+                payload = await self._compute()
+            except Exception as exc:
+                log_handler.warning("Stream topic %s failed: %s", self.key[0], exc)
+                payload = None
+            if payload is not None:
+                previous, self.payload = self.payload, payload
+                patch = _UNPATCHABLE if previous is None else merge_patch(previous, payload)
+                if patch is _UNPATCHABLE:
+                    message = self.snapshot()
+                elif patch is _MISSING:
+                    message = None
+                else:
+                    message = _event("patch", {"endpoint": self.key[0], "patch": patch})
+                if message is not None:
+                    for subscriber in list(self.subscribers):
+                        subscriber.send(message)
+            await asyncio.sleep(_cfg["interval_seconds"])
+
+
+class MetricsBroadcaster:
+    """Topic registry for one event loop."""
+
+    def __init__(self) -> None:
+        self.topics: dict[TopicKey, _Topic] = {}
+
+    def _join(self, key: TopicKey, subscriber: _Subscriber) -> _Topic:
+        topic = self.topics.get(key)
+        if topic is None:
+            topic = self.topics[key] = _Topic(key)
+            topic.task = asyncio.create_task(topic.run())
+        elif topic.payload is not None:
+            subscriber.send(topic.snapshot())
+        topic.subscribers.add(subscriber)
+        return topic
+
+    def _leave(self, topic: _Topic, subscriber: _Subscriber) -> None:
+        topic.subscribers.discard(subscriber)
+        if not topic.subscribers and self.topics.get(topic.key) is topic:
+            del self.topics[topic.key]
+            if topic.task is not None:
+                topic.task.cancel()
+
+    async def subscribe(self, keys: list[TopicKey]) -> AsyncIterator[str]:
+        """Yield SSE frames for *keys* until the consumer stops iterating."""
+        subscriber = _Subscriber()
+        topics = [self._join(key, subscriber) for key in keys]
+        heartbeat = _cfg["heartbeat_seconds"]
+        try:
+            yield f"retry: {int(_cfg['retry_milliseconds'])}\n\n"
+            while True:
+                if subscriber.resync:
+                    subscriber.resync = False
+                    while not subscriber.queue.empty():
+                        subscriber.queue.get_nowait()
+                    for topic in topics:
+                        if topic.payload is not None:
+                            yield topic.snapshot()
+                    continue
+                try:
+                    yield await asyncio.wait_for(subscriber.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            for topic in topics:
+                self._leave(topic, subscriber)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "topics": len(self.topics),
+            "subscribers": len({s for t in self.topics.values() for s in t.subscribers}),
+            "computations": sum(t.computations for t in self.topics.values()),
+        }
+
+    async def close(self) -> None:
+        tasks = [t.task for t in self.topics.values() if t.task is not None]
+        self.topics.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_broadcasters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MetricsBroadcaster] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_broadcaster() -> MetricsBroadcaster:
+    """The running loop's broadcaster (created on first use)."""
+    loop = asyncio.get_running_loop()
+    broadcaster = _broadcasters.get(loop)
+    if broadcaster is None:
+        broadcaster = _broadcasters[loop] = MetricsBroadcaster()
+    return broadcaster
+
+
+async def close_broadcaster() -> None:
+    broadcaster = _broadcasters.pop(asyncio.get_running_loop(), None)
+    if broadcaster is not None:
+        await broadcaster.close()
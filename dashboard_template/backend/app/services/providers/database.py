@@ -2,18 +2,40 @@
 
 Install optional dependency: uv sync --extra database
 
-Use DATABASE_URL for Postgres/MySQL on a private server or VPN.
+Use DATABASE_URL for Postgres/MySQL on a private server or VPN, and optionally
+DATABASE_URL_READ for a read replica that dashboard queries should use.
+
+Engines are created once per URL and shared by the whole process; pool sizing
+lives in ``config_file.json`` (``database``). Row counts default to planner
+statistics (``pg_class.reltuples``, ``information_schema.TABLES``,
+``sqlite_stat1``) with an exact ``COUNT(*)`` fallback for small or never
+analyzed tables, and are cached for ``row_count_cache_seconds``.
 """
 
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal
 
 from app.config import settings
+from app.core_specs.configuration.config_loader import config_loader
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
 
 logger = logging.getLogger(__name__)
 
+_cfg = config_loader["database"]
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+_count_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_count_cache_lock = threading.Lock()
+
+RowCountMode = Literal["estimated", "exact"]
+
 
 def get_status() -> str:
     if not settings.feature_private_database:
@@ -23,8 +45,42 @@ def get_status() -> str:
     return "misconfigured"
 
 
-def check_connection() -> dict[str, Any]:
-    """Test database connectivity when SQLAlchemy is installed."""
+def get_engine(read: bool = False) -> Engine:
+    """Process-wide pooled engine; ``read=True`` prefers DATABASE_URL_READ."""
+    url = (settings.database_url_read if read else "") or settings.database_url
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            from sqlalchemy import create_engine
+            from sqlalchemy.engine import make_url
+
+            options: dict[str, Any] = {"pool_pre_ping": True}
+            if make_url(url).get_backend_name() != "sqlite":
+                options.update(
+                    pool_size=_cfg["pool_size"],
+                    max_overflow=_cfg["max_overflow"],
+                    pool_timeout=_cfg["pool_timeout_seconds"],
+                    pool_recycle=_cfg["pool_recycle_seconds"],
+                )
+            engine = _engines[url] = create_engine(url, **options)
+    return engine
+
+
+def dispose_engines() -> None:
+    """Close every pooled connection (app shutdown, tests, URL changes)."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    with _count_cache_lock:
+        _count_cache.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _unconfigured() -> dict[str, Any] | None:
     if not settings.feature_private_database:
         return {"status": "disabled", "notes": ["Set FEATURE_PRIVATE_DATABASE=true."]}
     if not settings.database_url:
@@ -32,45 +88,141 @@ def check_connection() -> dict[str, Any]:
             "status": "misconfigured",
             "notes": ["Set DATABASE_URL to your private Postgres/MySQL connection string."],
         }
+    return None
+
+
+def _not_installed() -> dict[str, Any]:
+    return {
+        "status": "ready",
+        "notes": [
+            "Install database extra: uv sync --extra database",
+            "Then implement query helpers in this module.",
+        ],
+    }
+
+
+def check_connection() -> dict[str, Any]:
+    """Test database connectivity when SQLAlchemy is installed."""
+    unconfigured = _unconfigured()
+    if unconfigured is not None:
+        return unconfigured
 
     try:
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
 
-        engine = create_engine(settings.database_url, pool_pre_ping=True)
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
         return {"status": "connected", "notes": []}
     except ImportError:
-        return {
-            "status": "ready",
-            "notes": [
-                "Install database extra: uv sync --extra database",
-                "Then implement query helpers in this module.",
-            ],
-        }
+        return _not_installed()
     except Exception as exc:
         logger.warning("Database connection failed: %s", exc)
         return {"status": "unavailable", "notes": [str(exc)]}
 
 
-def list_table_row_counts(tables: list[str] | None = None) -> dict[str, Any]:
-    """Example row counts for private Postgres — customize SQL for your schema."""
-    connection = check_connection()
-    if connection.get("status") not in {"connected"}:
-        return {"tables": [], **connection}
+def _quoted(conn: Connection, table: str) -> str:
+    preparer = conn.dialect.identifier_preparer
+    return ".".join(preparer.quote(part) for part in table.split("."))
+
+
+def _exact_counts(conn: Connection, tables: list[str]) -> dict[str, int]:
+    """All ``COUNT(*)`` in one round trip."""
+    from sqlalchemy import text
+
+    columns = ", ".join(
+        f"(SELECT COUNT(*) FROM {_quoted(conn, table)}) AS c{i}" for i, table in enumerate(tables)
+    )
+    row = conn.execute(text(f"SELECT {columns}")).one()
+    return {table: int(count) for table, count in zip(tables, row)}
+
+
+def _estimated_counts(conn: Connection, tables: list[str]) -> dict[str, int]:
+    """Planner row estimates; tables without usable statistics are left out."""
+    from sqlalchemy import bindparam, text
+
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        query = text(
+            "SELECT name, c.reltuples::bigint FROM unnest(CAST(:names AS text[])) AS t(name)"
+            " JOIN pg_class c ON c.oid = to_regclass(t.name)"
+        )
+        rows = conn.execute(query, {"names": tables})
+    elif dialect in {"mysql", "mariadb"}:
+        query = text(
+            "SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES"
+            " WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :names"
+        ).bindparams(bindparam("names", expanding=True))
+        rows = conn.execute(query, {"names": tables})
+    elif dialect == "sqlite":
+        has_stats = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        ).first()
+        if not has_stats:
+            return {}
+        query = text(
+            "SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1"
+            " WHERE tbl IN :names GROUP BY tbl"
+        ).bindparams(bindparam("names", expanding=True))
+        rows = conn.execute(query, {"names": tables})
+    else:
+        return {}
+    # reltuples is -1 for never-analyzed Postgres tables.
+    return {name: int(count) for name, count in rows if count is not None and count >= 0}
+
+
+def _count_rows(conn: Connection, tables: list[str], mode: RowCountMode) -> list[dict[str, Any]]:
+    estimates = _estimated_counts(conn, tables) if mode == "estimated" else {}
+    threshold = _cfg["exact_count_below"]
+    need_exact = [t for t in tables if estimates.get(t, -1) < threshold]
+    exact = _exact_counts(conn, need_exact) if need_exact else {}
+    return [
+        {"name": table, "row_count": exact[table], "estimated": False}
+        if table in exact
+        else {"name": table, "row_count": estimates[table], "estimated": True}
+        for table in tables
+    ]
+
+
+def list_table_row_counts(
+    tables: list[str] | None = None,
+    mode: RowCountMode | None = None,
+) -> dict[str, Any]:
+    """Row counts for private Postgres — customize the table list for your schema.
+
+    ``mode`` defaults to ``database.row_count_mode``: ``"estimated"`` uses planner
+    statistics (exact below ``exact_count_below`` rows or without statistics),
+    ``"exact"`` always runs ``COUNT(*)``. Counts go straight to the read engine:
+    failing to connect reports ``"unavailable"``, a failing query ``"error"``.
+    """
+    target_tables = tables or ["users", "sessions", "events"]
+    mode = mode or _cfg["row_count_mode"]
+    key = (settings.database_url_read or settings.database_url, tuple(target_tables), mode)
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
+
+    unconfigured = _unconfigured()
+    if unconfigured is not None:
+        return {"tables": [], **unconfigured}
+    try:
+        conn = get_engine(read=True).connect()
+    except ImportError:
+        return {"tables": [], **_not_installed()}
+    except Exception as exc:
+        logger.warning("Database connection failed: %s", exc)
+        return {"tables": [], "status": "unavailable", "notes": [str(exc)]}
 
     try:
-        from sqlalchemy import create_engine, text
-
-        target_tables = tables or ["users", "sessions", "events"]
-        engine = create_engine(settings.database_url, pool_pre_ping=True)
-        rows: list[dict[str, Any]] = []
-        with engine.connect() as conn:
-            for table in target_tables:
-                result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                count = result.scalar_one()
-                rows.append({"name": table, "row_count": int(count)})
-        return {"tables": rows, "status": "connected", "notes": []}
+        with conn:
+            rows = _count_rows(conn, target_tables, mode)
     except Exception as exc:
         logger.warning("Database table query failed: %s", exc)
         return {"tables": [], "status": "error", "notes": [str(exc)]}
+
+    result = {"tables": rows, "status": "connected", "notes": []}
+    ttl = _cfg["row_count_cache_seconds"]
+    if ttl > 0:
+        with _count_cache_lock:
+            _count_cache[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+    return result
@@ -8,9 +8,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import httpx
-
 from app.config import settings
+from app.services import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +46,12 @@ async def query_metrics(
         "DD-APPLICATION-KEY": settings.datadog_app_key,
     }
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.get(
-                f"{_base_url()}/api/v1/query",
-                params={"query": query, "from": from_ts, "to": to_ts},
-                headers=headers,
-            )
+        response = await http_client.get(
+            f"{_base_url()}/api/v1/query",
+            params={"query": query, "from": from_ts, "to": to_ts},
+            headers=headers,
+            timeout=20.0,
+        )
         if response.status_code >= 400:
             return {
                 "series": [],
@@ -75,11 +74,11 @@ async def validate_credentials() -> dict[str, Any]:
         "DD-APPLICATION-KEY": settings.datadog_app_key,
     }
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{_base_url()}/api/v1/validate",
-                headers=headers,
-            )
+        response = await http_client.get(
+            f"{_base_url()}/api/v1/validate",
+            headers=headers,
+            timeout=10.0,
+        )
         if response.status_code == 200:
             return {"status": "connected", "notes": []}
         return {
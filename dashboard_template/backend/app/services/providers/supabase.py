@@ -1,21 +1,53 @@
 """Supabase provider placeholder.
 
-Install optional dependency: uv sync --extra supabase
+Talks to the Supabase REST API (PostgREST) over the shared pooled HTTP client.
 
-Implement list_table_row_counts() with your schema when ready for live data.
+Table counts come back in one request from the ``dashboard_table_counts`` RPC
+(``deploy/supabase-table-counts.sql``), using planner estimates for large
+tables when ``supabase.row_count_mode`` is ``"estimated"``. Until that function
+exists, each table is counted with a concurrent ``HEAD`` request instead.
+Either way, tables the project does not have are left out and listed in a note.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from typing import Any, Literal
 
 import httpx
 
 from app.config import settings
+from app.core_specs.configuration.config_loader import config_loader
+from app.services import http_client
 
 logger = logging.getLogger(__name__)
 
+_cfg = config_loader["supabase"]
+
+RowCountMode = Literal["estimated", "exact"]
+
+
+@dataclass(frozen=True)
+class _RestClient:
+    """Base URL and service key for one environment's Supabase project.
+
+    Only the URL/key pair is held here; connections are pooled by ``http_client``.
+    """
+
+    url: str
+    key: str
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"apikey": self.key, "Authorization": f"Bearer {self.key}"}
+
+
+# Base URL -> monotonic time until which the counts RPC is assumed missing.
+_rpc_missing_until: dict[str, float] = {}
+
 
 def get_status() -> str:
     """Return disabled | misconfigured | ready."""
@@ -27,11 +59,9 @@ def get_status() -> str:
     return "misconfigured"
 
 
-async def check_connection(env: Literal["test", "prod"] = "test") -> dict[str, Any]:
-    """Ping Supabase REST API. Reference implementation for live mode."""
+def _config_problem(env: Literal["test", "prod"]) -> dict[str, Any] | None:
     if not settings.feature_supabase:
         return {"status": "disabled", "notes": ["Set FEATURE_SUPABASE=true to enable."]}
-
     creds = settings.credentials_for(env)
     if not creds.supabase_url or not creds.supabase_service_role_key:
         return {
@@ -41,23 +71,28 @@ async def check_connection(env: Literal["test", "prod"] = "test") -> dict[str, A
                 f"SUPABASE_SERVICE_ROLE_KEY_{env.upper()}."
             ],
         }
+    return None
 
-    url = creds.supabase_url.rstrip("/")
-    headers = {
-        "apikey": creds.supabase_service_role_key,
-        "Authorization": f"Bearer {creds.supabase_service_role_key}",
-    }
+
+def _client(env: Literal["test", "prod"]) -> _RestClient:
+    """The environment's current URL/key pair."""
+    creds = settings.credentials_for(env)
+    return _RestClient(creds.supabase_url.rstrip("/"), creds.supabase_service_role_key)
+
+
+async def check_connection(env: Literal["test", "prod"] = "test") -> dict[str, Any]:
+    """Ping Supabase REST API. Reference implementation for live mode."""
+    problem = _config_problem(env)
+    if problem is not None:
+        return problem
+
+    client = _client(env)
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{url}/rest/v1/", headers=headers)
+        response = await http_client.get(
+            f"{client.url}/rest/v1/", headers=client.headers, timeout=_cfg["timeout_seconds"]
+        )
         if response.status_code < 400:
-            return {
-                "status": "connected",
-                "notes": [
-                    "Supabase reachable. Implement list_table_row_counts() in "
-                    "app/services/providers/supabase.py for row counts."
-                ],
-            }
+            return {"status": "connected", "notes": ["Supabase reachable."]}
         return {
             "status": "error",
             "notes": [f"Supabase returned HTTP {response.status_code}."],
@@ -67,49 +102,109 @@ async def check_connection(env: Literal["test", "prod"] = "test") -> dict[str, A
         return {"status": "unavailable", "notes": [str(exc)]}
 
 
+async def _counts_via_rpc(
+    client: _RestClient, tables: list[str], mode: RowCountMode
+) -> list[dict[str, Any]] | None:
+    """All counts in one request, or None when the RPC is not installed.
+
+    Tables the RPC does not know are left out.
+    """
+    if _rpc_missing_until.get(client.url, 0.0) > time.monotonic():
+        return None
+    response = await http_client.request(
+        "POST",
+        f"{client.url}/rest/v1/rpc/{_cfg['counts_rpc']}",
+        headers=client.headers,
+        json={
+            "names": tables,
+            "use_estimates": mode == "estimated",
+            "exact_below": _cfg["exact_count_below"],
+        },
+        timeout=_cfg["timeout_seconds"],
+    )
+    if response.status_code == 404:
+        _rpc_missing_until[client.url] = time.monotonic() + _cfg["rpc_recheck_seconds"]
+        return None
+    response.raise_for_status()
+    by_name = {row["name"]: row for row in response.json()}
+    return [
+        {
+            "name": table,
+            "row_count": int(by_name[table]["row_count"]),
+            "estimated": bool(by_name[table]["estimated"]),
+        }
+        for table in tables
+        if table in by_name
+    ]
+
+
+async def _count_via_head(
+    client: _RestClient, table: str, mode: RowCountMode
+) -> dict[str, Any] | None:
+    """One table's count, or None when PostgREST does not know the table."""
+    response = await http_client.request(
+        "HEAD",
+        f"{client.url}/rest/v1/{table}",
+        params={"select": "*"},
+        headers={**client.headers, "Prefer": f"count={mode}", "Range": "0-0"},
+        timeout=_cfg["timeout_seconds"],
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    # Content-Range: "0-0/1234" (or "*/0" for an empty table)
+    total = response.headers.get("content-range", "").rpartition("/")[2]
+    return {
+        "name": table,
+        "row_count": int(total) if total.isdigit() else 0,
+        "estimated": mode == "estimated",
+    }
+
+
 async def list_table_row_counts(
     env: Literal["test", "prod"] = "test",
     tables: list[str] | None = None,
+    mode: RowCountMode | None = None,
 ) -> dict[str, Any]:
-    """Return table row counts — implement with supabase-py or SQL when ready."""
-    connection = await check_connection(env)
-    if connection.get("status") != "connected":
-        return {"tables": [], **connection}
-
-    # Optional: use supabase-py when installed
+    """Return table row counts in one round trip (concurrent HEADs without the RPC).
+
+    ``mode`` defaults to ``supabase.row_count_mode``; ``"estimated"`` accepts
+    planner estimates for tables of ``exact_count_below`` rows or more.
+    """
+    problem = _config_problem(env)
+    if problem is not None:
+        return {"tables": [], **problem}
+
+    client = _client(env)
+    target_tables = tables or ["users", "sessions", "events"]
+    mode = mode or _cfg["row_count_mode"]
+    notes: list[str] = []
     try:
-        from supabase import create_client  # type: ignore[import-untyped]
-
-        creds = settings.credentials_for(env)
-        client = create_client(creds.supabase_url, creds.supabase_service_role_key)
-        target_tables = tables or ["users", "sessions", "events"]
-        rows: list[dict[str, Any]] = []
-        for table in target_tables:
-            result = (
-                client.table(table)
-                .select("id", count="exact")
-                .limit(1)
-                .execute()
+        rows = await _counts_via_rpc(client, target_tables, mode)
+        if rows is None:
+            counted = await asyncio.gather(
+                *(_count_via_head(client, table, mode) for table in target_tables)
             )
-            count = result.count if result.count is not None else 0
-            rows.append({"name": table, "row_count": count})
-        return {"tables": rows, "status": "connected", "notes": []}
-    except ImportError:
-        return {
-            "tables": [],
-            "status": "connected",
-            "notes": [
-                "Install supabase extra: uv sync --extra supabase",
-                "Then implement list_table_row_counts() or pass explicit table names.",
-            ],
-        }
-    except Exception as exc:
+            rows = [row for row in counted if row is not None]
+            notes.append(
+                f"Install {_cfg['counts_rpc']} (deploy/supabase-table-counts.sql) "
+                "to fetch all table counts in one request."
+            )
+    except httpx.HTTPStatusError as exc:
         logger.warning("Supabase table query failed: %s", exc)
         return {
             "tables": [],
             "status": "error",
-            "notes": [str(exc)],
+            "notes": [f"Supabase returned HTTP {exc.response.status_code}."],
         }
+    except Exception as exc:
+        logger.warning("Supabase table query failed: %s", exc)
+        return {"tables": [], "status": "unavailable", "notes": [str(exc)]}
+    found = {row["name"] for row in rows}
+    missing = [table for table in target_tables if table not in found]
+    if missing:
+        notes.append(f"Tables not found: {', '.join(missing)}.")
+    return {"tables": rows, "status": "connected", "notes": notes}
 
 
 async def list_storage_buckets(env: Literal["test", "prod"] = "test") -> dict[str, Any]:
@@ -8,9 +8,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Literal
 
-import httpx
-
 from app.config import settings
+from app.services import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -55,12 +54,12 @@ async def list_deployments(
 
     headers = {"Authorization": f"Bearer {settings.vercel_api_token}"}
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(
-                f"{VERCEL_API}/v6/deployments",
-                params=params,
-                headers=headers,
-            )
+        response = await http_client.get(
+            f"{VERCEL_API}/v6/deployments",
+            params=params,
+            headers=headers,
+            timeout=15.0,
+        )
         if response.status_code >= 400:
             return {
                 "deployments": [],
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark private database row counts: engine per call vs the pooled provider.
+
+Builds a local SQLite stand-in (or uses --url, e.g. a scratch Postgres that
+already has users / sessions / events) and times ``list_table_row_counts`` the
+way it used to run — ``create_engine`` plus one ``COUNT(*)`` per table on every
+call — against the shared engine with exact, estimated and cached counts.
+
+Usage:
+    cd backend && uv run python -m app.tools.benchmark_database [--rows 1000000] [--url URL]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Callable
+
+from app.config import settings
+from app.services.providers import database
+
+_TABLES = ["users", "sessions", "events"]
+
+
+def _build_sqlite(path: Path, rows: int) -> None:
+    with closing(sqlite3.connect(path)) as conn, conn:
+        for table, share in zip(_TABLES, (100, 10, 1)):
+            conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, created_at TEXT)")
+            conn.execute(
+                f"INSERT INTO {table} (created_at)"
+                " WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?)"
+                " SELECT datetime('now') FROM n",
+                (rows // share,),
+            )
+            conn.execute(f"CREATE INDEX {table}_created_at ON {table} (created_at)")
+        conn.execute("ANALYZE")
+
+
+def _cold_counts() -> None:
+    """The previous implementation: new engine and pool, COUNT(*) per table."""
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(settings.database_url, pool_pre_ping=True)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    engine = create_engine(settings.database_url, pool_pre_ping=True)
+    with engine.connect() as conn:
+        for table in _TABLES:
+            conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar_one()
+    engine.dispose()
+
+
+def _time(name: str, call: Callable[[], object], repeat: int) -> None:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    print(f"  {name:22} p50 {statistics.median(samples):9.3f} ms   max {max(samples):9.3f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="events rows (SQLite only)")
+    parser.add_argument("--url", help="existing database to use instead of SQLite")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url
+        if url is None:
+            path = Path(tmp) / "standin.sqlite3"
+            _build_sqlite(path, args.rows)
+            url = f"sqlite:///{path}"
+        settings.feature_private_database = True
+        settings.database_url = url
+        settings.database_url_read = ""
+        database._cfg["row_count_cache_seconds"] = 0
+
+        print(f"Row counts for {', '.join(_TABLES)} on {url.split('://')[0]}")
+        _time("engine per call", _cold_counts, args.repeat)
+        _time("pooled exact", lambda: database.list_table_row_counts(mode="exact"), args.repeat)
+        database._cfg["exact_count_below"] = 0
+        _time(
+            "pooled estimated",
+            lambda: database.list_table_row_counts(mode="estimated"),
+            args.repeat,
+        )
+        database._cfg["row_count_cache_seconds"] = 60
+        _time("cached", lambda: database.list_table_row_counts(mode="estimated"), args.repeat)
+        database.dispose_engines()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
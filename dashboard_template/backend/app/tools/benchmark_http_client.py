@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Compare a cold HTTP client per call against the shared pooled client.
+
+Starts a local HTTPS stub server (plain HTTP with --plain, or when the openssl
+CLI is missing) and times the same sequential GETs two ways: a new
+``httpx.AsyncClient`` per request, as providers used to do, and
+``app.services.http_client``, which reuses keep-alive connections.
+
+Usage:
+    cd backend && uv run python -m app.tools.benchmark_http_client [--requests 200] [--plain]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.server
+import shutil
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from app.services import http_client
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self) -> None:
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path] | None:
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        return None
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-keyout", str(key), "-out", str(cert)],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def _start_stub(tls: tuple[Path, Path] | None) -> tuple[http.server.ThreadingHTTPServer, str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    scheme = "http"
+    if tls is not None:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*tls)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_address[1]}/health"
+
+
+def _summary(name: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"  {name:8} total {sum(samples):8.1f} ms   "
+        f"p50 {statistics.median(samples):6.2f} ms   p99 {p99:6.2f} ms"
+    )
+
+
+async def _cold(url: str, n: int, verify: ssl.SSLContext | bool) -> list[float]:
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        async with httpx.AsyncClient(timeout=10.0, verify=verify) as client:
+            (await client.get(url)).raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def _pooled(url: str, n: int, verify: ssl.SSLContext | bool) -> list[float]:
+    # Same pool settings the providers use, trusting the stub's certificate.
+    loop = asyncio.get_running_loop()
+    http_client._pools[loop] = http_client._Pool(http_client.create_http_client(verify=verify))
+    samples = []
+    try:
+        for _ in range(n):
+            started = time.perf_counter()
+            (await http_client.get(url, timeout=10.0)).raise_for_status()
+            samples.append((time.perf_counter() - started) * 1000)
+    finally:
+        await http_client.close_http_client()
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--plain", action="store_true", help="use plain HTTP instead of TLS")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tls = None if args.plain else _self_signed_cert(Path(tmp))
+        server, url = _start_stub(tls)
+        verify: ssl.SSLContext | bool = False
+        if tls is not None:
+            verify = ssl.create_default_context(cafile=str(tls[0]))
+            verify.check_hostname = False
+        try:
+            cold = asyncio.run(_cold(url, args.requests, verify))
+            pooled = asyncio.run(_pooled(url, args.requests, verify))
+        finally:
+            server.shutdown()
+
+    print(f"HTTP client benchmark — {args.requests} sequential GETs to {url}")
+    print(_summary("cold", cold))
+    print(_summary("pooled", pooled))
+    print(f"  speedup  {sum(cold) / sum(pooled):.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark secure_file_io record helpers: batching, codecs and group commit.
+
+    import  N records one ``create_record`` at a time vs one ``create_many``;
+            doubling N should roughly quadruple the first and double the second.
+    codecs  write and read a collection of N records with each available codec.
+    group   concurrent ``create_record`` threads with and without group commit.
+
+Files are written to a temporary directory (``--dir`` to pick the filesystem).
+
+Usage:
+    cd backend && uv run python -m app.tools.benchmark_secure_file_io [import|codecs|group] [--dir DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from app.utils import secure_file_io as fio
+
+
+def benchmark_import(directory: str | None, sizes: Iterable[int] = (500, 1000, 2000)) -> None:
+    print(f"{'records':>8}  {'create_record':>14}  {'create_many':>12}")
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for n in sizes:
+            records = [{"id": i, "name": f"user-{i}", "active": i % 2 == 0} for i in range(n)]
+            timings = {}
+            for label in ("per_record", "batch"):
+                target = Path(tmp) / f"{label}-{n}.json"
+                started = time.perf_counter()
+                if label == "batch":
+                    fio.create_many(target, records)
+                else:
+                    for record in records:
+                        fio.create_record(target, record)
+                timings[label] = time.perf_counter() - started
+                fio.clear_collection_cache(target)
+            print(f"{n:>8}  {timings['per_record']:>13.3f}s  {timings['batch']:>11.4f}s")
+
+
+def benchmark_codecs(
+    directory: str | None, sizes: Iterable[int] = (1_000, 100_000, 1_000_000)
+) -> None:
+    """Every row writes through ``save_all`` (atomic replace with fsync). The
+    ``json (stdlib)`` row is the previous behaviour - no codec configured, so
+    indented ``json.dumps`` - read back with ``json.loads``.
+    """
+    print(f"{'codec':<14} {'records':>9} {'MB':>8} {'write':>9} {'read':>9}")
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for n in sizes:
+            records = [
+                {"id": i, "name": f"user-{i}", "email": f"user-{i}@example.com",
+                 "active": i % 3 == 0, "score": i / 7}
+                for i in range(n)
+            ]
+            target = Path(tmp) / f"records-{n}"
+            started = time.perf_counter()
+            fio.save_all(target, records)
+            write_s = time.perf_counter() - started
+            started = time.perf_counter()
+            json.loads(fio.read_text(target, max_bytes=None))
+            _print_codec("json (stdlib)", n, target, write_s, time.perf_counter() - started)
+            for codec, (_, available) in fio.CODECS.items():
+                if not available:
+                    continue
+                fio.set_codec(target, codec)
+                started = time.perf_counter()
+                fio.save_all(target, records)
+                write_s = time.perf_counter() - started
+                started = time.perf_counter()
+                fio.read_json(target, max_bytes=None)
+                _print_codec(codec, n, target, write_s, time.perf_counter() - started)
+                fio.set_codec(target, None)
+            del records
+
+
+def _print_codec(codec: str, n: int, target: Path, write_s: float, read_s: float) -> None:
+    print(
+        f"{codec:<14} {n:>9} {target.stat().st_size / 2**20:>8.2f} "
+        f"{write_s:>8.3f}s {read_s:>8.3f}s"
+    )
+
+
+def benchmark_group_commit(
+    directory: str | None,
+    threads: Iterable[int] = (1, 8, 32),
+    writes_per_thread: int = 25,
+    records: int = 1_000,
+) -> None:
+    print(f"{'mode':<10} {'threads':>7} {'writes/s':>9} {'p50':>9} {'p99':>9}")
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for n_threads in threads:
+            for mode in ("per-write", "group"):
+                target = Path(tmp) / f"{mode}-{n_threads}.json"
+                fio.create_many(target, [{"id": f"seed-{i}"} for i in range(records)])
+                if mode == "group":
+                    fio.set_group_commit(target)
+                latencies: list[float] = []
+                start_gate = threading.Barrier(n_threads)
+
+                def writer(worker: int) -> None:
+                    start_gate.wait()
+                    for i in range(writes_per_thread):
+                        began = time.perf_counter()
+                        fio.create_record(target, {"id": f"{worker}-{i}"})
+                        latencies.append(time.perf_counter() - began)
+
+                workers = [threading.Thread(target=writer, args=(w,)) for w in range(n_threads)]
+                started = time.perf_counter()
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                elapsed = time.perf_counter() - started
+                fio.set_group_commit(target, False)
+
+                latencies.sort()
+                p50 = latencies[len(latencies) // 2] * 1000
+                p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+                print(
+                    f"{mode:<10} {n_threads:>7} {len(latencies) / elapsed:>9.0f} "
+                    f"{p50:>7.1f}ms {p99:>7.1f}ms"
+                )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "benchmark", nargs="?", choices=("import", "codecs", "group"), default="import"
+    )
+    parser.add_argument("--dir", help="directory for the temporary files")
+    args = parser.parse_args()
+
+    {
+        "import": benchmark_import,
+        "codecs": benchmark_codecs,
+        "group": benchmark_group_commit,
+    }[args.benchmark](args.dir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
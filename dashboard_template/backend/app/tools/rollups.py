@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Backfill, refresh or benchmark the live analytics rollup store.
+
+Reads the private database (DATABASE_URL) unless --sqlite points at a local
+SQLite copy of the users / sessions / events tables.
+
+Usage:
+    cd backend && uv run python -m app.tools.rollups backfill --since 2024-01-01
+    cd backend && uv run python -m app.tools.rollups refresh
+    cd backend && uv run python -m app.tools.rollups bench [--events 1000000] [--days 90]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.services.live import rollups
+
+_RAW_SCHEMA = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, created_at TEXT NOT NULL);
+CREATE TABLE sessions (
+    id INTEGER PRIMARY KEY, user_id INTEGER, created_at TEXT NOT NULL, duration REAL
+);
+CREATE TABLE events (
+    id INTEGER PRIMARY KEY, user_id INTEGER, event_type TEXT, created_at TEXT NOT NULL
+);
+CREATE INDEX users_created_at ON users (created_at);
+CREATE INDEX sessions_created_at ON sessions (created_at);
+CREATE INDEX events_created_at ON events (created_at);
+"""
+
+# What a builder had to run per request without rollups.
+_RAW_QUERIES = [
+    "SELECT COUNT(*) FROM users WHERE created_at < :end",
+    "SELECT COUNT(*) FROM users WHERE created_at >= :start AND created_at < :end",
+    "SELECT COUNT(*), AVG(duration) FROM sessions WHERE created_at >= :start AND created_at < :end",
+    "SELECT event_type, COUNT(*) FROM events"
+    " WHERE created_at >= :start AND created_at < :end GROUP BY event_type",
+    "SELECT COUNT(DISTINCT user_id) FROM ("
+    " SELECT user_id FROM sessions WHERE created_at >= :start AND created_at < :end"
+    " UNION ALL SELECT user_id FROM events WHERE created_at >= :start AND created_at < :end)",
+]
+
+
+def _source(args: argparse.Namespace) -> rollups.RawSource | None:
+    if args.sqlite:
+        return rollups.SqliteSource(args.sqlite)
+    return rollups.default_source()
+
+
+def _generate(path: Path, events: int, days: int, end: datetime) -> None:
+    rng = random.Random(7)
+    span = days * 86400
+    users = max(1, events // 100)
+
+    def stamp() -> str:
+        return (end - timedelta(seconds=rng.randrange(span))).strftime("%Y-%m-%d %H:%M:%S")
+
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.executescript(_RAW_SCHEMA)
+        conn.executemany("INSERT INTO users VALUES (?, ?)", ((i, stamp()) for i in range(users)))
+        conn.executemany(
+            "INSERT INTO sessions VALUES (?, ?, ?, ?)",
+            ((i, rng.randrange(users), stamp(), rng.uniform(5, 900)) for i in range(events // 10)),
+        )
+        types = ["page_view", "click", "user_signup", "error", "deploy"]
+        conn.executemany(
+            "INSERT INTO events VALUES (?, ?, ?, ?)",
+            ((i, rng.randrange(users), rng.choice(types), stamp()) for i in range(events)),
+        )
+
+
+def _bench(args: argparse.Namespace) -> int:
+    end = datetime(2024, 4, 1)
+    start = end - timedelta(days=args.days)
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = Path(tmp) / "raw.sqlite3"
+        print(f"Generating {args.events} events over {args.days} days...")
+        _generate(raw, args.events, args.days, end)
+        store = rollups.RollupStore(Path(tmp) / "rollups.sqlite3")
+
+        started = time.perf_counter()
+        store.backfill(rollups.SqliteSource(raw), start, end)
+        print(f"  backfill           {time.perf_counter() - started:8.2f} s")
+
+        ranges = [(end - timedelta(days=d, hours=5), end - timedelta(hours=3)) for d in (1, 7, 30)]
+        ranges.append((start, end))
+        with closing(sqlite3.connect(raw)) as conn:
+            for lo, hi in ranges:
+                params = {
+                    "start": lo.strftime("%Y-%m-%d %H:%M:%S"),
+                    "end": hi.strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                started = time.perf_counter()
+                for sql in _RAW_QUERIES:
+                    conn.execute(sql, params).fetchall()
+                raw_ms = (time.perf_counter() - started) * 1000
+                started = time.perf_counter()
+                store.summarize(lo, hi)
+                rollup_ms = (time.perf_counter() - started) * 1000
+                print(
+                    f"  {(hi - lo).days:3d}-day range     raw {raw_ms:9.1f} ms"
+                    f"   rollups {rollup_ms:7.1f} ms"
+                )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sqlite", help="read raw tables from this SQLite file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    backfill = commands.add_parser("backfill", help="rebuild buckets from --since until now")
+    backfill.add_argument("--since", type=datetime.fromisoformat, required=True)
+    backfill.add_argument("--until", type=datetime.fromisoformat)
+    commands.add_parser("refresh", help="fold rows created since the last refresh")
+    bench = commands.add_parser("bench", help="raw range queries vs rollups on synthetic data")
+    bench.add_argument("--events", type=int, default=1_000_000)
+    bench.add_argument("--days", type=int, default=90)
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        return _bench(args)
+
+    source = _source(args)
+    if source is None:
+        print("No raw source: set FEATURE_PRIVATE_DATABASE and DATABASE_URL, or pass --sqlite.")
+        return 1
+    store = rollups.get_store()
+    started = time.perf_counter()
+    if args.command == "backfill":
+        days = store.backfill(source, args.since, args.until)
+    else:
+        days = store.refresh(source)
+    print(f"Rebuilt {days} day(s) in {time.perf_counter() - started:.2f}s → {store.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
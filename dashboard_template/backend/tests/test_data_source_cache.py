@@ -0,0 +1,147 @@
+"""Tests for the DataSource caching decorator."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import httpx
+
+from app.main import app
+from app.routers import overview
+from app.services.cached_data_source import CachedDataSource
+from app.services.data_source import DataSource, MockDataSource
+
+FROM = datetime(2024, 1, 1)
+TO = datetime(2024, 1, 31)
+
+
+class CountingSource(MockDataSource):
+    """Mock source that counts backend calls and can be held open."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_overview(self, from_date, to_date):
+        self.calls += 1
+        self.release.wait(5)
+        return {"call": self.calls}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeated_calls_hit_the_cache():
+    inner = CountingSource()
+    cache = CachedDataSource(inner, ttl_seconds={"overview": 60})
+
+    assert cache.get_overview(FROM, TO) == {"call": 1}
+    assert cache.get_overview(FROM, TO) == {"call": 1}
+    assert inner.calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_dates_in_the_same_bucket_share_an_entry():
+    inner = CountingSource()
+    cache = CachedDataSource(inner, date_bucket_seconds=3600)
+
+    cache.get_overview(FROM, TO)
+    cache.get_overview(FROM.replace(minute=30), TO.replace(minute=59))
+    cache.get_overview(FROM.replace(hour=1), TO)
+
+    assert inner.calls == 2
+
+
+def test_entries_expire_after_their_ttl():
+    inner = CountingSource()
+    clock = FakeClock()
+    cache = CachedDataSource(inner, ttl_seconds={"overview": 10}, clock=clock)
+
+    cache.get_overview(FROM, TO)
+    clock.now = 9.9
+    cache.get_overview(FROM, TO)
+    clock.now = 10.0
+    cache.get_overview(FROM, TO)
+
+    assert inner.calls == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    inner = CountingSource()
+    cache = CachedDataSource(inner, max_entries=2, date_bucket_seconds=86400)
+
+    days = [datetime(2024, 1, day) for day in (1, 2, 3)]
+    cache.get_overview(days[0], TO)
+    cache.get_overview(days[1], TO)
+    cache.get_overview(days[0], TO)  # refresh day 1
+    cache.get_overview(days[2], TO)  # evicts day 2
+
+    cache.get_overview(days[0], TO)
+    assert inner.calls == 3
+    cache.get_overview(days[1], TO)
+    assert inner.calls == 4
+    assert cache.stats()["evictions"] == 2
+
+
+def test_concurrent_misses_trigger_one_backend_call():
+    inner = CountingSource()
+    inner.release.clear()
+    cache = CachedDataSource(inner)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_overview(FROM, TO)))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.stats()["coalesced"] < 9:
+        time.sleep(0.001)
+    inner.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert inner.calls == 1
+    assert results == [{"call": 1}] * 10
+
+
+async def test_concurrent_requests_share_one_computation(monkeypatch):
+    inner = CountingSource()
+    inner.release.clear()
+    cache = CachedDataSource(inner)
+    monkeypatch.setattr(overview, "get_data_source", lambda: cache)
+    threading.Timer(0.2, inner.release.set).start()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        params = {"from_date": "2024-01-01", "to_date": "2024-01-31"}
+        responses = await asyncio.gather(
+            *(client.get("/api/overview", params=params) for _ in range(10))
+        )
+
+    assert [r.json() for r in responses] == [{"call": 1}] * 10
+    assert inner.calls == 1
+    # Requests arrived while the first was still computing and waited on it.
+    assert cache.stats()["coalesced"] > 0
+
+
+def test_callers_get_copies_of_cached_results():
+    inner = CountingSource()
+    inner.get_overview = lambda *_: {"charts": {"daily": [1, 2]}}
+    cache = CachedDataSource(inner)
+
+    first = cache.get_overview(FROM, TO)
+    first["charts"]["daily"].append(3)
+    assert cache.get_overview(FROM, TO) == {"charts": {"daily": [1, 2]}}
+
+
+def test_cached_source_is_a_data_source():
+    assert isinstance(CachedDataSource(MockDataSource()), DataSource)
@@ -0,0 +1,100 @@
+"""Tests for the pooled private database provider."""
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.config import settings  # noqa: E402
+from app.services.providers import database  # noqa: E402
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """Private database pointing at a SQLite file with users/sessions/events."""
+    path = tmp_path / "private.sqlite3"
+    with closing(sqlite3.connect(path)) as conn, conn:
+        for table, rows in (("users", 120), ("sessions", 40), ("events", 7)):
+            conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, note TEXT)")
+            conn.executemany(f"INSERT INTO {table} (note) VALUES ('x')", [()] * rows)
+    monkeypatch.setattr(settings, "feature_private_database", True)
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{path}")
+    monkeypatch.setattr(settings, "database_url_read", "")
+    database.dispose_engines()
+    yield path
+    database.dispose_engines()
+
+
+def test_engine_is_shared_and_read_url_is_honored(sqlite_db, tmp_path, monkeypatch):
+    primary = database.get_engine()
+    assert database.get_engine() is primary
+    assert database.get_engine(read=True) is primary
+
+    monkeypatch.setattr(settings, "database_url_read", f"sqlite:///{tmp_path / 'replica.db'}")
+    replica = database.get_engine(read=True)
+    assert replica is not primary
+    assert str(replica.url).endswith("replica.db")
+
+
+def test_exact_counts(sqlite_db):
+    body = database.list_table_row_counts(mode="exact")
+    assert body["status"] == "connected"
+    assert [(t["name"], t["row_count"], t["estimated"]) for t in body["tables"]] == [
+        ("users", 120, False),
+        ("sessions", 40, False),
+        ("events", 7, False),
+    ]
+
+
+def test_estimated_counts_use_statistics_with_exact_fallback(sqlite_db, monkeypatch):
+    monkeypatch.setitem(database._cfg, "exact_count_below", 50)
+    monkeypatch.setitem(database._cfg, "row_count_cache_seconds", 0)
+
+    # No statistics yet: everything falls back to COUNT(*).
+    body = database.list_table_row_counts(mode="estimated")
+    assert not any(t["estimated"] for t in body["tables"])
+
+    with closing(sqlite3.connect(sqlite_db)) as conn:
+        conn.execute("ANALYZE")
+        conn.execute("UPDATE sqlite_stat1 SET stat = '1000' WHERE tbl = 'users'")
+        conn.commit()
+    database.dispose_engines()
+
+    rows = {t["name"]: t for t in database.list_table_row_counts(mode="estimated")["tables"]}
+    assert rows["users"] == {"name": "users", "row_count": 1000, "estimated": True}
+    assert rows["events"] == {"name": "events", "row_count": 7, "estimated": False}
+
+
+def test_counts_are_cached_briefly(sqlite_db, monkeypatch):
+    monkeypatch.setitem(database._cfg, "row_count_cache_seconds", 60)
+    first = database.list_table_row_counts(mode="exact")
+
+    with closing(sqlite3.connect(sqlite_db)) as conn, conn:
+        conn.execute("INSERT INTO events (note) VALUES ('y')")
+
+    cached = database.list_table_row_counts(mode="exact")
+    assert cached == first and cached is not first
+    cached["tables"][0]["row_count"] = -1
+    assert database.list_table_row_counts(mode="exact") == first
+    monkeypatch.setitem(database._cfg, "row_count_cache_seconds", 0)
+    database.dispose_engines()
+    events = database.list_table_row_counts(mode="exact")["tables"][2]
+    assert events["row_count"] == 8
+
+
+def test_counts_use_only_the_read_engine(sqlite_db, tmp_path, monkeypatch):
+    monkeypatch.setitem(database._cfg, "row_count_cache_seconds", 0)
+
+    def no_preflight():
+        raise AssertionError("counts must not ping the primary engine")
+
+    monkeypatch.setattr(database, "check_connection", no_preflight)
+    assert database.list_table_row_counts(mode="exact")["status"] == "connected"
+
+    unreachable = tmp_path / "missing-dir" / "replica.db"
+    monkeypatch.setattr(settings, "database_url_read", f"sqlite:///{unreachable}")
+    body = database.list_table_row_counts(mode="exact")
+    assert body["status"] == "unavailable"
+    assert body["tables"] == [] and body["notes"]
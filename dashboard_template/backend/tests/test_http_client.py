@@ -0,0 +1,45 @@
+"""Tests for the shared pooled provider HTTP client."""
+
+import asyncio
+
+import httpx
+
+from app.services import http_client
+
+
+async def test_client_is_shared_per_loop_and_recreated_after_close():
+    client = http_client.get_http_client()
+    assert http_client.get_http_client() is client
+
+    await http_client.close_http_client()
+    assert client.is_closed
+    assert http_client.get_http_client() is not client
+    await http_client.close_http_client()
+
+
+async def test_per_host_limit_caps_in_flight_requests(monkeypatch):
+    monkeypatch.setitem(http_client._cfg, "per_host_limit", 2)
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, json={"host": request.url.host})
+
+    loop = asyncio.get_running_loop()
+    http_client._pools[loop] = http_client._Pool(
+        http_client.create_http_client(transport=httpx.MockTransport(handler))
+    )
+    try:
+        responses = await asyncio.gather(
+            *(http_client.get(f"https://api.example.com/{i}", timeout=5) for i in range(6)),
+            http_client.get("https://other.example.com/", timeout=5),
+        )
+    finally:
+        await http_client.close_http_client()
+
+    assert [r.status_code for r in responses] == [200] * 7
+    assert peak == 3  # two for api.example.com plus one for other.example.com
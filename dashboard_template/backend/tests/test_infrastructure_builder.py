@@ -0,0 +1,69 @@
+"""Tests for the live infrastructure builder."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.config import settings
+from app.services.live import infrastructure_builder
+from app.services.providers import database, datadog, vercel
+
+
+@pytest.fixture
+def live_providers(monkeypatch):
+    """Enable Vercel, private DB and Datadog with slow fake providers."""
+    monkeypatch.setattr(settings, "feature_host_health", False)
+    monkeypatch.setattr(settings, "feature_vercel", True)
+    monkeypatch.setattr(settings, "feature_storage_metrics", False)
+    monkeypatch.setattr(settings, "feature_private_database", True)
+    monkeypatch.setattr(settings, "feature_datadog", True)
+
+    async def slow_deployments(env):
+        await asyncio.sleep(0.2)
+        return {"deployments": [{"id": "d1"}], "notes": ["vercel note"]}
+
+    def blocking_row_counts():
+        time.sleep(0.2)
+        return {"tables": [{"name": "users", "row_count": 3}], "notes": []}
+
+    async def slow_datadog():
+        await asyncio.sleep(0.2)
+        return {"status": "connected", "notes": []}
+
+    monkeypatch.setattr(vercel, "list_deployments", slow_deployments)
+    monkeypatch.setattr(database, "list_table_row_counts", blocking_row_counts)
+    monkeypatch.setattr(datadog, "validate_credentials", slow_datadog)
+
+
+async def test_providers_run_concurrently_with_timings(live_providers):
+    started = time.perf_counter()
+    body = await infrastructure_builder.build("test")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert body["deployments"] == [{"id": "d1"}]
+    assert body["database"]["tables"][0]["row_count"] == 3
+    assert body["datadog"]["status"] == "connected"
+    assert body["notes"] == [
+        "Host health disabled. Set FEATURE_HOST_HEALTH=true to enable.",
+        "vercel note",
+    ]
+    assert set(body["timings_ms"]) == {"vercel", "database", "datadog"}
+    assert all(ms >= 150 for ms in body["timings_ms"].values())
+
+
+async def test_deadline_miss_becomes_a_note(live_providers, monkeypatch):
+    async def hanging_datadog():
+        await asyncio.sleep(30)
+
+    monkeypatch.setattr(datadog, "validate_credentials", hanging_datadog)
+    monkeypatch.setitem(infrastructure_builder._cfg["deadline_seconds"], "datadog", 0.3)
+
+    started = time.perf_counter()
+    body = await infrastructure_builder.build("test")
+
+    assert time.perf_counter() - started < 1
+    assert body["datadog"] is None
+    assert "datadog did not respond within 0.3s; section skipped." in body["notes"]
+    assert body["deployments"] == [{"id": "d1"}]
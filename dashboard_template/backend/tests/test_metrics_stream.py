@@ -0,0 +1,145 @@
+"""Tests for the SSE metrics push channel."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import metrics_stream
+from app.services.metrics_stream import MetricsBroadcaster, merge_patch
+
+FROM = datetime(2024, 1, 1)
+TO = datetime(2024, 1, 31)
+
+
+def test_merge_patch():
+    old = {"total": 1, "charts": {"a": [1], "b": [2]}, "gone": True}
+    new = {"total": 2, "charts": {"a": [1], "b": [2, 3]}, "added": "x"}
+    assert merge_patch(old, new) == {
+        "total": 2,
+        "charts": {"b": [2, 3]},
+        "gone": None,
+        "added": "x",
+    }
+    assert merge_patch(new, new) is metrics_stream._MISSING
+
+
+def test_merge_patch_cannot_set_null():
+    unpatchable = metrics_stream._UNPATCHABLE
+    assert merge_patch({"datadog": {"ok": True}}, {"datadog": None}) is unpatchable
+    assert merge_patch({}, {"vercel": {"error": None}}) is unpatchable
+    assert merge_patch({"a": {"b": 1}}, {"a": {"b": None}}) is unpatchable
+    # Nulls inside arrays are literal, and an unchanged null is no change.
+    assert merge_patch({"s": [1], "d": None}, {"s": [None], "d": None}) == {"s": [None]}
+
+
+class CountingSource:
+    def __init__(self):
+        self.calls = 0
+
+    def get_overview(self, from_date, to_date):
+        self.calls += 1
+        return {"total_users": 100 + self.calls // 2, "charts": {"range": [str(from_date)]}}
+
+
+@pytest.fixture
+def source(monkeypatch):
+    source = CountingSource()
+    monkeypatch.setattr(metrics_stream, "get_data_source", lambda: source)
+    monkeypatch.setitem(metrics_stream._cfg, "interval_seconds", 0.05)
+    monkeypatch.setitem(metrics_stream._cfg, "heartbeat_seconds", 5)
+    return source
+
+
+def _parse(frame):
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+async def _collect(stream, count):
+    frames = []
+    async for frame in stream:
+        if frame.startswith("event:"):
+            frames.append(_parse(frame))
+            if len(frames) == count:
+                break
+    return frames
+
+
+async def test_compute_once_per_interval_for_all_subscribers(source):
+    broadcaster = MetricsBroadcaster()
+    streams = [broadcaster.subscribe([("overview", FROM, TO, None)]) for _ in range(20)]
+    results = await asyncio.gather(*(_collect(stream, 2) for stream in streams))
+
+    for frames in results:
+        snapshot = {"total_users": 100, "charts": {"range": [str(FROM)]}}
+        assert frames[0] == ("snapshot", {"endpoint": "overview", "data": snapshot})
+        assert frames[1] == ("patch", {"endpoint": "overview", "patch": {"total_users": 101}})
+    # One computation per interval (first, unchanged, changed), not one per subscriber.
+    assert source.calls <= 4
+    for stream in streams:
+        await stream.aclose()
+    assert broadcaster.topics == {}
+
+
+async def test_value_set_to_null_is_sent_as_snapshot(source, monkeypatch):
+    payloads = iter([{"datadog": {"hosts": 3}}, {"datadog": None}])
+    monkeypatch.setattr(source, "get_overview", lambda *_: next(payloads, {"datadog": None}))
+    broadcaster = MetricsBroadcaster()
+    stream = broadcaster.subscribe([("overview", FROM, TO, None)])
+
+    frames = await _collect(stream, 2)
+    assert frames[1] == ("snapshot", {"endpoint": "overview", "data": {"datadog": None}})
+    await stream.aclose()
+    await broadcaster.close()
+
+
+async def test_late_subscriber_gets_current_snapshot(source):
+    broadcaster = MetricsBroadcaster()
+    first = broadcaster.subscribe([("overview", FROM, TO, None)])
+    await _collect(first, 1)
+
+    late = broadcaster.subscribe([("overview", FROM, TO, None)])
+    event, data = (await _collect(late, 1))[0]
+    assert event == "snapshot"
+    assert data["data"]["charts"] == {"range": [str(FROM)]}
+    assert broadcaster.stats()["subscribers"] == 2
+
+    await first.aclose()
+    await late.aclose()
+    await broadcaster.close()
+
+
+async def test_slow_subscriber_is_resynced(source, monkeypatch):
+    monkeypatch.setitem(metrics_stream._cfg, "queue_size", 1)
+    monkeypatch.setitem(metrics_stream._cfg, "interval_seconds", 0.01)
+    broadcaster = MetricsBroadcaster()
+    stream = broadcaster.subscribe([("overview", FROM, TO, None)])
+    await stream.__anext__()  # retry: hint, subscribed
+    await asyncio.sleep(0.1)  # several patches overflow the queue
+
+    frames = await _collect(stream, 2)
+    assert "snapshot" in [event for event, _ in frames]
+    await stream.aclose()
+    await broadcaster.close()
+
+
+def test_unknown_endpoint_is_rejected():
+    params = {"from_date": "2024-01-01", "to_date": "2024-01-31", "endpoints": "nope"}
+    response = TestClient(app).get("/api/stream", params=params)
+    assert response.status_code == 422
+
+
+def test_costs_follow_the_costs_module_gate(monkeypatch):
+    monkeypatch.setattr(metrics_stream.settings, "dashboard_data_mode", "live")
+    monkeypatch.setattr(metrics_stream.settings, "feature_costs_module", False)
+    params = {"from_date": "2024-01-01", "to_date": "2024-01-31", "endpoints": "overview,costs"}
+    response = TestClient(app).get("/api/stream", params=params)
+    assert response.status_code == 422
+    assert "FEATURE_COSTS_MODULE" in response.json()["detail"]
+
+    monkeypatch.setattr(metrics_stream.settings, "feature_costs_module", True)
+    assert "costs" in metrics_stream.available_endpoints()
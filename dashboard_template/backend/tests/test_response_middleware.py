@@ -0,0 +1,73 @@
+"""Tests for ETag / 304 and compression of JSON responses."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import middleware
+from app.main import app
+
+client = TestClient(app)
+OVERVIEW = "/api/overview?from_date=2024-01-01&to_date=2024-01-31"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats(monkeypatch):
+    monkeypatch.setattr(middleware, "_response_stats", middleware._response_stats.copy())
+    middleware._response_stats.clear()
+    monkeypatch.setitem(middleware._responses_cfg, "min_compress_bytes", 256)
+
+
+def test_large_json_is_gzipped_with_an_etag():
+    response = client.get(OVERVIEW, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].startswith('W/"')
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["total_users"] == 1250  # decoded transparently
+    assert response.headers["X-Data-Mode"] == "mock"
+
+
+def test_identity_when_client_does_not_accept_gzip():
+    response = client.get(OVERVIEW, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_small_bodies_are_not_compressed(monkeypatch):
+    monkeypatch.setitem(middleware._responses_cfg, "min_compress_bytes", 1 << 20)
+    response = client.get(OVERVIEW, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert "etag" in response.headers
+
+
+def test_if_none_match_returns_304_and_counts_bytes_saved():
+    first = client.get(OVERVIEW, headers={"Accept-Encoding": "gzip"})
+    etag = first.headers["etag"]
+
+    repeat = client.get(OVERVIEW, headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    strong = client.get(OVERVIEW, headers={"If-None-Match": etag.removeprefix("W/")})
+    assert strong.status_code == 304
+
+    stats = middleware.get_response_stats()["/api/overview"]
+    raw = len(first.content)  # decoded size
+    assert stats["requests"] == 3
+    assert stats["not_modified"] == 2
+    assert stats["bytes_raw"] == 3 * raw
+    assert stats["bytes_sent"] == int(first.headers["content-length"]) < raw
+    assert stats["bytes_saved"] == 3 * raw - stats["bytes_sent"]
+
+
+def test_changed_payload_gets_a_new_etag():
+    first = client.get(OVERVIEW)
+    other = client.get("/api/overview?from_date=2024-01-01&to_date=2024-01-31&x=1")
+    assert other.headers["etag"] == first.headers["etag"]  # same payload, same tag
+
+    users = client.get("/api/users?from_date=2024-01-01&to_date=2024-01-31")
+    assert users.headers["etag"] != first.headers["etag"]
+    repeat = client.get(OVERVIEW, headers={"If-None-Match": users.headers["etag"]})
+    assert repeat.status_code == 200
@@ -0,0 +1,416 @@
+"""Tests for the secure_file_io locking and record helpers."""
+
+import asyncio
+import gc
+import json
+import multiprocessing
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.utils import secure_file_io as fio
+
+WORKERS = 4
+INCREMENTS = 50
+
+
+@pytest.fixture(autouse=True)
+def _unconfined():
+    # app.services.data_source confines access to the backend dir on import.
+    previous = fio.get_allowed_root()
+    fio.set_allowed_root(None)
+    yield
+    fio.set_allowed_root(previous)
+
+
+@pytest.fixture
+def snapshot_reads(monkeypatch):
+    """Count full reads of collection files."""
+    reads = []
+    original = fio._read_bytes_unlocked
+
+    def counting(path, max_bytes):
+        reads.append(path)
+        return original(path, max_bytes)
+
+    monkeypatch.setattr(fio, "_read_bytes_unlocked", counting)
+    return reads
+
+
+def test_collection_cache_reloads_after_external_write(tmp_path, snapshot_reads):
+    path = tmp_path / "users.json"
+    fio.save_all(path, [{"id": 1, "name": "Ada"}])
+
+    assert fio.find_by_id(path, 1)["name"] == "Ada"
+    assert fio.find_by_id(path, 1)["name"] == "Ada"
+    assert len(snapshot_reads) == 1
+
+    path.write_text('[{"id": 1, "name": "Grace Hopper"}]')  # bypasses the module
+    assert fio.find_by_id(path, 1)["name"] == "Grace Hopper"
+    assert len(snapshot_reads) == 2
+
+
+def test_declared_index_answers_lookups_in_file_order(tmp_path, snapshot_reads):
+    path = tmp_path / "users.json"
+    fio.save_all(path, [{"id": i, "team": "odd" if i % 2 else "even"} for i in range(6)])
+    fio.declare_index(path, "team")
+
+    assert [r["id"] for r in fio.find_by_field(path, "team", "odd")] == [1, 3, 5]
+    assert fio.find_by_field(path, "team", "none") == []
+    assert fio.find_by_id(path, 4) == {"id": 4, "team": "even"}
+    assert len(snapshot_reads) == 1
+    assert set(fio._collections[str(path.resolve())].indexes) == {"team", "id"}
+
+    # Callers get copies: mutating a result does not touch the cache.
+    fio.find_by_id(path, 4)["team"] = "mutated"
+    assert fio.find_by_id(path, 4)["team"] == "even"
+
+
+def test_indexes_stay_consistent_after_update_and_delete(tmp_path):
+    path = tmp_path / "users.json"
+    fio.save_all(path, [{"id": i, "team": "a"} for i in range(5)])
+    fio.declare_index(path, "team")
+
+    fio.update_record(path, 1, {"team": "b"})
+    fio.update_record(path, 3, {"team": "b"})
+    assert [r["id"] for r in fio.find_by_field(path, "team", "b")] == [1, 3]
+    assert [r["id"] for r in fio.find_by_field(path, "team", "a")] == [0, 2, 4]
+
+    fio.delete_record(path, 0)  # shifts every later position
+    assert [r["id"] for r in fio.find_by_field(path, "team", "b")] == [1, 3]
+    assert fio.find_by_id(path, 4) == {"id": 4, "team": "a"}
+    fio.create_record(path, {"id": 5, "team": "b"})
+    assert [r["id"] for r in fio.find_by_field(path, "team", "b")] == [1, 3, 5]
+
+    fio.clear_collection_cache(path)
+    assert [r["id"] for r in fio.find_by_field(path, "team", "b")] == [1, 3, 5]
+
+
+@pytest.fixture
+def journaled(tmp_path):
+    path = tmp_path / "events.json"
+    fio.save_all(path, [{"id": 0}])
+    fio.set_journal_mode(path, compact_every=3)
+    yield path
+    fio.set_journal_mode(path, False)
+
+
+def test_journal_replay_drops_a_torn_last_line(journaled):
+    fio.create_record(journaled, {"id": 1})
+    fio.update_record(journaled, 0, {"seen": True})
+    journal = fio._journal_path(journaled)
+    intact = journal.read_bytes()
+    with journal.open("ab") as fh:
+        fh.write(b'{"op":"create","record":{"id"')  # crashed mid-append
+
+    fio.clear_collection_cache(journaled)
+    assert fio.read_all(journaled) == [{"id": 0, "seen": True}, {"id": 1}]
+    assert journal.read_bytes() == intact
+    assert fio.read_json(journaled) == [{"id": 0}]  # the snapshot alone
+
+    fio.create_record(journaled, {"id": 2})  # lands on a clean line and compacts
+    assert fio.read_json(journaled) == [{"id": 0, "seen": True}, {"id": 1}, {"id": 2}]
+
+
+def test_journal_from_a_crashed_compaction_is_discarded(journaled):
+    fio.create_record(journaled, {"id": 1})
+    fio.create_record(journaled, {"id": 2})
+    journal = fio._journal_path(journaled)
+    leftover = journal.read_bytes()
+    fio.compact_collection(journaled)
+    journal.write_bytes(leftover)  # as if the crash hit before the unlink
+
+    fio.clear_collection_cache(journaled)
+    assert fio.read_all(journaled) == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert not journal.exists()
+
+
+def test_journal_compacts_at_the_threshold(journaled):
+    journal = fio._journal_path(journaled)
+    fio.create_record(journaled, {"id": 1})
+    fio.create_record(journaled, {"id": 2})
+    assert len(journal.read_bytes().splitlines()) == 3  # header + two ops
+    assert fio.read_json(journaled) == [{"id": 0}]
+
+    fio.delete_record(journaled, 0)
+    assert not journal.exists()
+    assert fio.read_json(journaled) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize("mode", ["rewrite", "journal", "group"])
+def test_unserialisable_write_leaves_the_cache_unchanged(tmp_path, mode):
+    path = tmp_path / "events.json"
+    fio.save_all(path, [{"id": 0}])
+    if mode == "journal":
+        fio.set_journal_mode(path)
+    elif mode == "group":
+        fio.set_group_commit(path)
+    try:
+        with pytest.raises(TypeError):
+            fio.create_record(path, {"id": 1, "at": datetime(2024, 1, 1)})
+        with pytest.raises(TypeError):
+            fio.update_record(path, 0, {"at": datetime(2024, 1, 1)})
+        assert fio.read_all(path) == [{"id": 0}]
+
+        fio.create_record(path, {"id": 2})
+        assert fio.read_all(path) == [{"id": 0}, {"id": 2}]
+    finally:
+        fio.set_journal_mode(path, False)
+        fio.set_group_commit(path, False)
+
+    fio.clear_collection_cache(path)
+    assert fio.read_all(path) == [{"id": 0}, {"id": 2}]
+
+
+def test_transaction_rollback_leaves_file_and_cache_unchanged(tmp_path):
+    path = tmp_path / "users.json"
+    fio.save_all(path, [{"id": 1, "name": "Ada"}, {"id": 2, "name": "Grace"}])
+    before = path.read_bytes()
+    fio.read_all(path)  # warm the cache
+
+    with pytest.raises(RuntimeError):
+        with fio.transaction(path) as tx:
+            tx.update(1, {"name": "changed"})
+            tx.delete(2)
+            tx.create({"id": 3})
+            raise RuntimeError("abort")
+
+    assert path.read_bytes() == before
+    assert fio.read_all(path) == [{"id": 1, "name": "Ada"}, {"id": 2, "name": "Grace"}]
+    assert fio.find_by_id(path, 3) is None
+
+
+def test_bulk_helpers_write_once_and_are_all_or_nothing(tmp_path, monkeypatch):
+    path = tmp_path / "users.json"
+    writes = []
+    original = fio._atomic_write_unlocked
+    monkeypatch.setattr(
+        fio, "_atomic_write_unlocked", lambda p, data: (writes.append(p), original(p, data))
+    )
+
+    fio.create_many(path, [{"id": i, "n": 0} for i in range(5)])
+    fio.update_many(path, {1: {"n": 1}, 3: {"n": 3}})
+    assert fio.delete_many(path, [0, 4]) == [{"id": 0, "n": 0}, {"id": 4, "n": 0}]
+    assert len(writes) == 3
+    assert fio.read_json(path) == [{"id": 1, "n": 1}, {"id": 2, "n": 0}, {"id": 3, "n": 3}]
+
+    with pytest.raises(ValueError):
+        fio.update_many(path, [(1, {"n": 9}), ("missing", {"n": 9})])
+    with pytest.raises(ValueError):
+        fio.delete_many(path, [2, 2])  # only one record has id 2
+    assert len(writes) == 3
+    assert fio.read_all(path) == [{"id": 1, "n": 1}, {"id": 2, "n": 0}, {"id": 3, "n": 3}]
+
+
+def _hammer(root: str, path: str, worker: int, journaled: bool) -> None:
+    fio.set_lock_backend(root, "fcntl")
+    if journaled:
+        fio.set_journal_mode(path, compact_every=7)
+    for i in range(INCREMENTS):
+        with fio.transaction(path) as tx:
+            counter = tx.find_by_id("counter")
+            tx.update("counter", {"value": counter["value"] + 1})
+        fio.create_record(path, {"id": f"{worker}-{i}"})
+
+
+@pytest.mark.skipif(not fio._HAS_FCNTL, reason="fcntl lock backend is POSIX only")
+@pytest.mark.parametrize("journaled", [False, True])
+def test_fcntl_backend_loses_no_updates_across_processes(tmp_path, journaled):
+    path = tmp_path / "counter.json"
+    fio.save_all(path, [{"id": "counter", "value": 0}])
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_hammer, args=(str(tmp_path), str(path), worker, journaled))
+        for worker in range(WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    fio.clear_collection_cache()
+    assert fio.find_by_id(path, "counter")["value"] == WORKERS * INCREMENTS
+    assert len(fio.read_all(path)) == 1 + WORKERS * INCREMENTS
+
+
+@pytest.mark.skipif(not fio._HAS_FCNTL, reason="fcntl lock backend is POSIX only")
+@pytest.mark.parametrize("journaled", [False, True])
+def test_fcntl_backend_keeps_the_cache_across_own_writes(tmp_path, snapshot_reads, journaled):
+    path = tmp_path / "counter.json"
+    fio.save_all(path, [{"id": "counter", "value": 0}])
+    fio.set_lock_backend(tmp_path, "fcntl")
+    try:
+        if journaled:
+            fio.set_journal_mode(path)
+        for i in range(10):
+            fio.update_record(path, "counter", {"value": i + 1})
+        assert fio.find_by_id(path, "counter")["value"] == 10
+    finally:
+        fio.set_journal_mode(path, False)
+        fio.set_lock_backend(tmp_path, "thread")
+
+    # One load, plus (journaled) one digest of the snapshot the journal extends.
+    assert len(snapshot_reads) == (2 if journaled else 1)
+
+
+def test_rwlock_admits_concurrent_readers_but_one_writer():
+    lock = fio.RWLock()
+    inside = threading.Barrier(2, timeout=5)
+
+    def reader():
+        with lock.read():
+            inside.wait()  # only passes if both readers hold the lock at once
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+
+    lock.acquire_write()
+    acquired = threading.Event()
+    blocked = threading.Thread(target=lambda: (lock.acquire_read(), acquired.set()))
+    blocked.start()
+    assert not acquired.wait(0.1)
+    lock.release_write()
+    assert acquired.wait(5)
+    blocked.join()
+
+
+def test_lock_table_drops_unused_path_locks(tmp_path):
+    for i in range(100):
+        fio.write_text(tmp_path / f"{i}.txt", "x")
+    gc.collect()
+    assert not any(key.startswith(str(tmp_path)) for key in fio._locks)
+
+
+def test_iter_jsonl_keeps_reading_one_version_across_a_replace(tmp_path):
+    path = tmp_path / "events.jsonl"
+    fio.write_text(path, "".join(f'{{"n": {i}}}\n' for i in range(3)))
+
+    values = fio.iter_jsonl(path)
+    assert next(values) == {"n": 0}
+    fio.write_text(path, '{"n": "new"}\n')
+
+    assert list(values) == [{"n": 1}, {"n": 2}]
+    assert list(fio.iter_jsonl(path)) == [{"n": "new"}]
+
+
+def test_streaming_readers_open_nothing_until_iterated(tmp_path, monkeypatch):
+    path = tmp_path / "rows.csv"
+    fio.write_csv(path, [{"a": "1"}, {"a": "2"}])
+    handles = []
+    original = fio._open_for_stream
+    monkeypatch.setattr(
+        fio, "_open_for_stream", lambda *args: handles.append(original(*args)) or handles[-1]
+    )
+
+    fio.iter_csv(path)
+    fio.iter_jsonl(tmp_path / "missing.jsonl")  # errors surface on first next()
+    assert handles == []
+
+    rows = fio.iter_csv(path)
+    assert next(rows) == {"a": "1"}
+    rows.close()
+    assert handles[0].closed
+
+
+@pytest.mark.parametrize("codec", [name for name, (_, ok) in fio.CODECS.items() if ok])
+def test_codecs_round_trip_and_are_auto_detected(tmp_path, codec):
+    path = tmp_path / "users.json"
+    fio.set_codec(path, codec)
+    try:
+        fio.create_many(path, [{"id": i, "name": f"user-{i}"} for i in range(3)])
+        fio.update_record(path, 1, {"name": "renamed"})
+    finally:
+        fio.set_codec(path, None)
+
+    fio.clear_collection_cache(path)
+    assert fio.find_by_id(path, 1)["name"] == "renamed"
+    assert fio.read_json(path)[2] == {"id": 2, "name": "user-2"}
+
+
+@pytest.mark.parametrize("text", ["hello world", "", "  {'single': 'quotes'}"])
+def test_malformed_json_raises_json_decode_error(tmp_path, text):
+    path = tmp_path / "broken.json"
+    fio.write_text(path, text)
+    with pytest.raises(json.JSONDecodeError):
+        fio.read_json(path)
+
+
+async def test_async_api_mirrors_sync_helpers(tmp_path):
+    path = tmp_path / "items.json"
+
+    await asyncio.gather(*(fio.acreate_record(path, {"id": i}) for i in range(20)))
+    await fio.aupdate_record(path, 3, {"done": True})
+
+    assert len(await fio.aread_all(path)) == 20
+    assert (await fio.afind_by_id(path, 3))["done"] is True
+    assert fio.read_json(path) == await fio.aread_json(path)
+
+
+def test_group_commit_persists_every_concurrent_write(tmp_path):
+    path = tmp_path / "burst.json"
+    fio.set_group_commit(path)
+    try:
+        writers = [
+            threading.Thread(
+                target=lambda w=w: [fio.create_record(path, {"id": f"{w}-{i}"}) for i in range(10)]
+            )
+            for w in range(8)
+        ]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+    finally:
+        fio.set_group_commit(path, False)
+
+    fio.clear_collection_cache(path)
+    assert len(fio.read_all(path)) == 80
+
+
+def test_group_commit_fails_writes_lost_to_an_external_replace(tmp_path):
+    path = tmp_path / "burst.json"
+    fio.save_all(path, [{"id": "seed"}])
+    fio.set_group_commit(path)
+    resolved = path.resolve()
+    try:
+        fio.create_record(path, {"id": "durable"})
+        # Apply a write but stop before waiting for its flush...
+        with fio._locked(resolved):
+            entry = fio._get_collection(resolved, None)
+            entry.append({"id": "lost"})
+            chunk = fio._encode_op({"op": "create", "record": {"id": "lost"}})
+            ticket = fio._commit_op(resolved, entry, chunk)
+        # ...then someone replaces the file behind the module's back.
+        path.write_text('[{"id": "external", "note": "replaced"}]')
+
+        with pytest.raises(fio.FileStoreError):
+            fio._wait_durable(resolved, ticket)
+        fio.create_record(path, {"id": "after"})
+    finally:
+        fio.set_group_commit(path, False)
+
+    assert fio.read_json(path) == [{"id": "external", "note": "replaced"}, {"id": "after"}]
+
+
+async def test_concurrent_async_writers_share_group_commits(tmp_path, monkeypatch):
+    path = tmp_path / "burst.json"
+    flushes = []
+    original = fio._atomic_write_unlocked
+    monkeypatch.setattr(
+        fio, "_atomic_write_unlocked", lambda p, data: (flushes.append(p), original(p, data))
+    )
+    fio.set_group_commit(path)
+    try:
+        await asyncio.gather(*(fio.acreate_record(path, {"id": i}) for i in range(40)))
+        # Every call returned only once durable, so the file already has all 40.
+        assert len(fio.read_json(path)) == 40
+    finally:
+        fio.set_group_commit(path, False)
+
+    assert len(flushes) <= 20  # one per write before async writers shared flushes
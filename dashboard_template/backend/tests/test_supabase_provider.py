@@ -0,0 +1,124 @@
+"""Tests for Supabase table counts against a local PostgREST stub."""
+
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+from app.config import settings
+from app.services import http_client
+from app.services.providers import supabase
+
+COUNTS = {"users": 250_000, "sessions": 4_000, "events": 9}
+
+
+class _PostgrestStub(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    rpc_installed = True
+    delay = 0.0
+    requests: list[tuple[str, str, dict]] = []
+
+    def _reply(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append(("POST", self.path, payload))
+        if not self.rpc_installed:
+            return self._reply(404, b'{"code": "PGRST202"}')
+        rows = [
+            {
+                "name": name,
+                "row_count": COUNTS[name],
+                "estimated": payload["use_estimates"] and COUNTS[name] >= payload["exact_below"],
+            }
+            for name in payload["names"]
+            if name in COUNTS
+        ]
+        self._reply(200, json.dumps(rows).encode(), [("Content-Type", "application/json")])
+
+    def do_HEAD(self):
+        type(self).requests.append(("HEAD", self.path, dict(self.headers)))
+        time.sleep(self.delay)
+        table = self.path.split("?")[0].rsplit("/", 1)[-1]
+        if table not in COUNTS:
+            return self._reply(404)
+        self._reply(206, headers=[("Content-Range", f"0-0/{COUNTS[table]}")])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+async def stub(monkeypatch):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _PostgrestStub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(_PostgrestStub, "requests", [])
+    monkeypatch.setattr(settings, "feature_supabase", True)
+    monkeypatch.setattr(settings, "supabase_url_test", f"http://127.0.0.1:{server.server_port}/")
+    monkeypatch.setattr(settings, "supabase_service_role_key_test", "service-key")
+    monkeypatch.setattr(supabase, "_rpc_missing_until", {})
+    yield _PostgrestStub
+    await http_client.close_http_client()
+    server.shutdown()
+    server.server_close()
+
+
+async def test_counts_in_one_rpc_round_trip(stub):
+    body = await supabase.list_table_row_counts("test")
+
+    assert body["status"] == "connected"
+    assert body["tables"] == [
+        {"name": "users", "row_count": 250_000, "estimated": True},
+        {"name": "sessions", "row_count": 4_000, "estimated": False},
+        {"name": "events", "row_count": 9, "estimated": False},
+    ]
+    assert [(method, path) for method, path, _ in stub.requests] == [
+        ("POST", "/rest/v1/rpc/dashboard_table_counts")
+    ]
+
+
+async def test_missing_rpc_falls_back_to_concurrent_heads(stub, monkeypatch):
+    monkeypatch.setattr(stub, "rpc_installed", False)
+    monkeypatch.setattr(stub, "delay", 0.2)
+
+    started = time.perf_counter()
+    body = await supabase.list_table_row_counts("test", mode="exact")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.45  # three 200 ms requests in parallel
+    assert [t["row_count"] for t in body["tables"]] == [250_000, 4_000, 9]
+    assert "dashboard_table_counts" in body["notes"][0]
+    heads = [headers for method, _, headers in stub.requests if method == "HEAD"]
+    assert {h["Prefer"] for h in heads} == {"count=exact"}
+
+    # The missing RPC is remembered instead of being retried on every call.
+    stub.requests.clear()
+    await supabase.list_table_row_counts("test", mode="exact")
+    assert [method for method, _, _ in stub.requests] == ["HEAD"] * 3
+
+
+async def test_unreachable_project_reports_unavailable(stub, monkeypatch):
+    monkeypatch.setattr(settings, "supabase_url_test", "http://127.0.0.1:9")
+    body = await supabase.list_table_row_counts("test")
+    assert body["status"] == "unavailable"
+    assert body["tables"] == []
+
+
+@pytest.mark.parametrize("rpc_installed", [True, False])
+async def test_unknown_tables_are_listed_in_a_note(stub, monkeypatch, rpc_installed):
+    monkeypatch.setattr(stub, "rpc_installed", rpc_installed)
+    body = await supabase.list_table_row_counts("test", tables=["users", "nope", "events"])
+
+    assert body["status"] == "connected"
+    assert [t["name"] for t in body["tables"]] == ["users", "events"]
+    assert body["notes"][-1] == "Tables not found: nope."
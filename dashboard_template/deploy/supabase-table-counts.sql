@@ -0,0 +1,51 @@
+-- Dashboard row counts in one PostgREST round trip.
+--
+-- Run once in the Supabase SQL editor. The backend calls it as
+--   POST /rest/v1/rpc/dashboard_table_counts
+--   {"names": ["users", "sessions", "events"], "use_estimates": true, "exact_below": 100000}
+-- and falls back to one HEAD request per table while it does not exist.
+--
+-- With use_estimates, tables at or above exact_below rows report the planner
+-- estimate (pg_class.reltuples) instead of a full COUNT(*). Unknown tables are
+-- skipped.
+
+create or replace function public.dashboard_table_counts(
+  names text[],
+  use_estimates boolean default true,
+  exact_below bigint default 100000
+)
+returns table (name text, row_count bigint, estimated boolean)
+language plpgsql
+stable
+security definer
+set search_path = public
+as $$
+declare
+  table_name text;
+  relation regclass;
+  estimate bigint;
+begin
+  foreach table_name in array names loop
+    relation := to_regclass(table_name);
+    continue when relation is null;
+
+    select c.reltuples::bigint into estimate from pg_class c where c.oid = relation;
+
+    name := table_name;
+    -- reltuples is -1 until the table has been analyzed.
+    if use_estimates and estimate >= greatest(exact_below, 0) then
+      row_count := estimate;
+      estimated := true;
+    else
+      execute format('select count(*) from %s', relation) into row_count;
+      estimated := false;
+    end if;
+    return next;
+  end loop;
+end;
+$$;
+
+revoke execute on function public.dashboard_table_counts(text[], boolean, bigint)
+  from public, anon, authenticated;
+grant execute on function public.dashboard_table_counts(text[], boolean, bigint)
+  to service_role;
@@ -208,3 +208,66 @@ export async function fetchAiMetrics(from: string, to: string): Promise<AiMetric
   }
   return response.json();
 }
+
+export type StreamEndpoint =
+  | "overview"
+  | "users"
+  | "sessions"
+  | "activity"
+  | "ai"
+  | "costs"
+  | "infrastructure";
+
+export type StreamEvent =
+  | { kind: "snapshot"; endpoint: StreamEndpoint; data: unknown }
+  | { kind: "patch"; endpoint: StreamEndpoint; patch: unknown };
+
+/**
+ * Subscribe to server-pushed metrics (GET /api/stream, Server-Sent Events).
+ * The first event per endpoint is a snapshot; later ones are JSON merge patches
+ * (RFC 7386) to apply with applyMergePatch. A snapshot can arrive again at any
+ * time (resync, or a value that became null) and replaces the endpoint's data.
+ * Returns a function that closes the stream.
+ */
+export function openMetricsStream(
+  from: string,
+  to: string,
+  endpoints: StreamEndpoint[],
+  environment: "test" | "prod",
+  onEvent: (event: StreamEvent) => void
+): () => void {
+  const params = new URLSearchParams({
+    from_date: from,
+    to_date: to,
+    endpoints: endpoints.join(","),
+    environment,
+  });
+  const source = new EventSource(`${API_URL}/api/stream?${params}`);
+  source.addEventListener("snapshot", (message) => {
+    const { endpoint, data } = JSON.parse((message as MessageEvent).data);
+    onEvent({ kind: "snapshot", endpoint, data });
+  });
+  source.addEventListener("patch", (message) => {
+    const { endpoint, patch } = JSON.parse((message as MessageEvent).data);
+    onEvent({ kind: "patch", endpoint, patch });
+  });
+  return () => source.close();
+}
+
+export function applyMergePatch(target: unknown, patch: unknown): unknown {
+  if (patch === null || typeof patch !== "object" || Array.isArray(patch)) {
+    return patch;
+  }
+  const result: Record<string, unknown> =
+    target !== null && typeof target === "object" && !Array.isArray(target)
+      ? { ...(target as Record<string, unknown>) }
+      : {};
+  for (const [key, value] of Object.entries(patch as Record<string, unknown>)) {
+    if (value === null) {
+      delete result[key];
+    } else {
+      result[key] = applyMergePatch(result[key], value);
+    }
+  }
+  return result;
+}
@@ -4,9 +4,14 @@
  * React Query hooks for API calls, aligned with feature flags.
  */
 
-import { useQuery } from "@tanstack/react-query";
+import { useEffect } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { useFeatures } from "../hooks/useFeatures";
+import { useDataEnvironment } from "../hooks/useDataEnvironment";
 import {
+  applyMergePatch,
+  openMetricsStream,
+  type StreamEndpoint,
   fetchOverview,
   fetchUsers,
   fetchSessions,
@@ -67,3 +72,39 @@ export function useAiMetrics(from: string, to: string) {
     queryFn: () => fetchAiMetrics(from, to),
   });
 }
+
+/**
+ * Keep the query cache for the given endpoints fresh from the server push
+ * channel instead of re-fetching. Query keys match the hooks above.
+ */
+export function useMetricsStream(
+  from: string,
+  to: string,
+  endpoints: StreamEndpoint[] = ["overview", "users", "sessions", "activity"]
+) {
+  const queryClient = useQueryClient();
+  const { environment } = useDataEnvironment();
+  const endpointList = endpoints.join(",");
+
+  useEffect(() => {
+    const queryKey = (endpoint: StreamEndpoint) =>
+      endpoint === "infrastructure" ? ["infrastructure"] : [endpoint, from, to];
+
+    return openMetricsStream(
+      from,
+      to,
+      endpointList.split(",") as StreamEndpoint[],
+      environment,
+      (event) => {
+        const key = queryKey(event.endpoint);
+        if (event.kind === "snapshot") {
+          queryClient.setQueryData(key, event.data);
+        } else {
+          queryClient.setQueryData(key, (current: unknown) =>
+            applyMergePatch(current, event.patch)
+          );
+        }
+      }
+    );
+  }, [queryClient, from, to, endpointList, environment]);
+}
@@ -12,6 +12,9 @@ import {
 import { Sidebar } from "./components/Sidebar";
 import { DevBanner } from "./components/DevBanner";
 import { DataEnvironmentProvider } from "./hooks/useDataEnvironment";
+import { useDateRange } from "./hooks/useDateRange";
+import { useFeatures } from "./hooks/useFeatures";
+import { useMetricsStream } from "./lib/queries";
 import { templateConfig } from "../template.config";
 import "./index.css";
 
@@ -37,10 +40,21 @@ const queryClient = new QueryClient({
 });
 
 function RootLayout() {
+  const { dateRange } = useDateRange();
+  const { features } = useFeatures();
+
   React.useEffect(() => {
     document.title = templateConfig.projectName;
   }, []);
 
+  useMetricsStream(
+    dateRange.from,
+    dateRange.to,
+    features?.features.costs_module
+      ? ["overview", "users", "sessions", "activity", "costs"]
+      : ["overview", "users", "sessions", "activity"]
+  );
+
   return (
     <div className="flex h-screen">
       <Sidebar />
@@ -6,22 +6,40 @@ Converts raster images (PNG, JPEG, WEBP, BMP, GIF, TIFF) into ASCII art text fil
 Pipeline:
     image → load (EXIF + alpha) → grayscale + RGB → compute width → resize → map → write
 
+Mapping engine:
+    Pixels are mapped with NumPy in one pass (``map_pixels_to_grid``) into an
+    ``AsciiGrid`` (ramp-index array + RGB array) that every writer consumes.
+    ``map_pixels_to_cells`` keeps the original per-pixel path as a reference;
+    ``--benchmark`` times both on a file and checks they agree.
+
 Batch features:
     - Recursive directory processing with per-file error isolation
     - Optional output directory (mirrors source tree)
-    - Skip unchanged outputs (--skip-existing)
+    - Skip unchanged outputs (--skip-existing; batches use a content-hash manifest)
+    - Parallel conversion across a process pool (--jobs N, deterministic logs/stats)
     - Hard caps on output dimensions (OOM guard)
-    - Atomic writes and closed image handles
+    - Atomic, streaming writes (row by row into a buffered temp file) and closed image handles
     - Structured BatchStats + argparse CLI
 
+Animation (--animate):
+    - Frames decoded lazily, one resize target shared by all frames
+    - Frames rendered in parallel (--jobs) into an HTML player or ANSI frame sequence
+
+Live video (--video, needs ffmpeg/ffprobe on PATH):
+    - ffmpeg decodes, resamples to --fps and scales to the grid; raw RGB is piped in
+    - Mapping reuses preallocated NumPy buffers; ANSI frames go straight to stdout
+    - Late frames are dropped; achieved FPS and per-stage latency are logged on exit
+
 Dependencies:
     - Pillow
+    - NumPy
 
 Output formats:
     - txt  : plain text (default)
-    - ansi : terminal true-color (RGB ANSI escape codes per character)
+    - ansi : terminal true-color (RGB ANSI escape codes per character, or per run with --coalesce)
     - html : zoomable viewer in any browser (optional per-character color)
-    - png  : raster image you can open/resize in any image viewer
+    - png  : raster image you can open/resize in any image viewer (colored PNGs are
+             composed from a cached glyph atlas)
     - all  : write txt + ansi + html + png (when --color, ansi/html/png use color)
 
 Examples (run from ``python_various_utils/``):
@@ -54,6 +72,22 @@ Colored HTML + PNG + plain txt + ANSI in one run::
 
     python image_to_ascii_2.py --file photo.png --width 80 --format all --color
 
+Smaller colored output: one escape/span per run of equal color, colors cut to 4 bits/channel::
+
+    python image_to_ascii_2.py --file photo.png --width 120 --format all --color --coalesce --color-bits 4
+
+Animated GIF → HTML player (all frames, rendered on 4 processes)::
+
+    python image_to_ascii_2.py --file anim.gif --width 100 --format html --color --animate --jobs 4
+
+Animated GIF → ANSI frame sequence (``cat anim.ansi.txt`` plays it)::
+
+    python image_to_ascii_2.py --file anim.gif --width 80 --format ansi --animate
+
+Play a video as live ANSI in the terminal (160 columns, 24 fps; Ctrl+C stops)::
+
+    python image_to_ascii_2.py --video clip.mp4 --width 160 --fps 24
+
 Dark terminal / inverted brightness::
 
     python image_to_ascii_2.py --file photo.png --width 80 --format ansi --invert
@@ -66,21 +100,42 @@ Batch: convert every image under a folder, mirror tree into ``./ascii_out/``::
 
     python image_to_ascii_2.py --dir ./photos --output-dir ./ascii_out --width 100 --format html
 
-Re-run batch but skip files whose outputs are already up to date::
+Batch on every core (stats and log order match a sequential run)::
+
+    python image_to_ascii_2.py --dir ./photos --output-dir ./ascii_out --jobs 0
+
+Re-run batch but skip files whose outputs are already up to date (decided by source
+content + conversion flags, recorded in ``ascii_out/.ascii_manifest.json``; changing
+e.g. ``--png-font-size`` only re-renders the PNGs)::
 
     python image_to_ascii_2.py --dir ./photos --output-dir ./ascii_out --skip-existing
+
+Benchmark the array mapping engine against the per-pixel reference path::
+
+    python image_to_ascii_2.py --file photo.png --pixel-grid --allow-large --benchmark
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import logging
+import os
+import subprocess
 import sys
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageSequence
 
 # =========================
 # CONFIG
@@ -106,7 +161,17 @@ BackgroundName = Literal["white", "black"]
 ConversionStatus = Literal["converted", "skipped", "failed"]
 OutputFormat = Literal["txt", "ansi", "html", "png", "all"]
 
+MANIFEST_NAME = ".ascii_manifest.json"
+MANIFEST_VERSION = 1
+HASH_CHUNK_BYTES = 1024 * 1024
+
 DEFAULT_PNG_FONT_SIZE = 8
+DEFAULT_FRAME_MS = 100
+DEFAULT_STREAM_WIDTH = 160
+DEFAULT_STREAM_FPS = 24.0
+MIN_COLOR_BITS = 1
+MAX_COLOR_BITS = 8
+WRITE_BUFFER_BYTES = 1024 * 1024
 RGB = tuple[int, int, int]
 
 
@@ -117,6 +182,72 @@ class AsciiCell:
     char: str
     rgb: RGB
 
+
+@dataclass(frozen=True, eq=False)
+class AsciiGrid:
+    """
+    Array-backed mapping result shared by all writers.
+
+    ``indices`` holds one ramp index per cell (shape ``rows x cols``) and ``rgb``
+    the display color per cell (shape ``rows x cols x 3``, uint8). Inversion is
+    already applied to both.
+    """
+
+    indices: np.ndarray
+    rgb: np.ndarray
+    char_ramp: str
+
+    @property
+    def width(self) -> int:
+        return int(self.indices.shape[1])
+
+    @property
+    def height(self) -> int:
+        return int(self.indices.shape[0])
+
+    def chars(self) -> np.ndarray:
+        """Per-cell characters as a ``rows x cols`` unicode array."""
+        ramp = np.array(list(self.char_ramp), dtype="<U1")
+        return ramp[self.indices]
+
+    def lines(self) -> list[str]:
+        """Plain text rows (one string per grid row)."""
+        if self.width == 0:
+            return [""] * self.height
+        chars = np.ascontiguousarray(self.chars())
+        return chars.view(f"<U{self.width}").ravel().tolist()
+
+    def iter_rows(self) -> Iterator[tuple[list[str], list[list[int]]]]:
+        """Yield ``(chars, colors)`` per row as plain Python lists (one row at a time)."""
+        ramp = self.char_ramp
+        for y in range(self.height):
+            yield [ramp[i] for i in self.indices[y].tolist()], self.rgb[y].tolist()
+
+    def iter_color_runs(self) -> Iterator[list[tuple[str, list[int]]]]:
+        """Yield each row as ``(chars, color)`` runs of horizontally adjacent equal colors."""
+        ramp = self.char_ramp
+        for y in range(self.height):
+            colors = self.rgb[y]
+            chars = "".join(ramp[i] for i in self.indices[y].tolist())
+            if not chars:
+                yield []
+                continue
+            starts = np.flatnonzero(np.any(colors[1:] != colors[:-1], axis=1)) + 1
+            bounds = [0, *starts.tolist(), len(chars)]
+            run_colors = colors[bounds[:-1]].tolist()
+            yield [
+                (chars[start:stop], color)
+                for start, stop, color in zip(bounds, bounds[1:], run_colors)
+            ]
+
+    def count_color_runs(self) -> int:
+        """Number of equal-color runs (= escapes/spans written when coalescing)."""
+        if self.width == 0:
+            return 0
+        changes = np.any(self.rgb[:, 1:] != self.rgb[:, :-1], axis=2)
+        return self.height + int(np.count_nonzero(changes))
+
+
 logger = logging.getLogger("image_to_ascii")
 
 
@@ -133,6 +264,9 @@ class ConversionResult:
     output: Path | None = None
     status: ConversionStatus = "failed"
     message: str = ""
+    color_cells: int = 0
+    color_spans: int = 0
+    cache_updates: dict[str, dict] = field(default_factory=dict)
 
 
 @dataclass
@@ -143,11 +277,18 @@ class BatchStats:
     skipped: int = 0
     failed: int = 0
     failures: list[tuple[Path, str]] = field(default_factory=list)
+    color_cells: int = 0
+    color_spans: int = 0
 
     @property
     def total(self) -> int:
         return self.converted + self.skipped + self.failed
 
+    @property
+    def span_compression(self) -> float:
+        """Colored cells per emitted escape/span across the batch (1.0 = no coalescing)."""
+        return self.color_cells / self.color_spans if self.color_spans else 1.0
+
 
 # =========================
 # LOGGING
@@ -203,20 +344,31 @@ def resolve_output_base(
     return image_path.with_suffix("")
 
 
-def output_paths_for_format(
+def output_jobs(
     base: Path,
     output_format: OutputFormat,
     *,
     use_color: bool = False,
-) -> list[Path]:
+) -> list[tuple[str, Path]]:
+    """Concrete ``(format, path)`` pairs written for ``output_format``."""
     if output_format == "all":
-        paths = [base.with_suffix(".txt"), base.with_suffix(".html"), base.with_suffix(".png")]
+        jobs = [("txt", base.with_suffix(".txt"))]
         if use_color:
-            paths.insert(1, base.with_suffix(".ansi.txt"))
-        return paths
+            jobs.append(("ansi", base.with_suffix(".ansi.txt")))
+        jobs.extend([("html", base.with_suffix(".html")), ("png", base.with_suffix(".png"))])
+        return jobs
     if output_format == "ansi":
-        return [base.with_suffix(".ansi.txt")]
-    return [base.with_suffix(f".{output_format}")]
+        return [("ansi", base.with_suffix(".ansi.txt"))]
+    return [(output_format, base.with_suffix(f".{output_format}"))]
+
+
+def output_paths_for_format(
+    base: Path,
+    output_format: OutputFormat,
+    *,
+    use_color: bool = False,
+) -> list[Path]:
+    return [path for _, path in output_jobs(base, output_format, use_color=use_color)]
 
 
 def resolve_output_path(
@@ -266,6 +418,143 @@ def clamp_output_dimensions(
     return width, height
 
 
+# =========================
+# CONVERSION CACHE
+# =========================
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def format_params_key(fmt: str, params: dict) -> str:
+    """
+    Digest of the conversion parameters that can change one output format.
+
+    txt depends only on the grid; color flags are added for ansi/html/png and the
+    font size for png, so changing one flag only invalidates the formats it affects.
+    """
+    relevant = {key: params[key] for key in ("grid", "invert", "background", "gif_frame")}
+    if fmt in ("ansi", "html", "png"):
+        colored = fmt == "ansi" or params["use_color"]
+        relevant["use_color"] = colored
+        if colored:
+            relevant["color_bits"] = params["color_bits"]
+            if fmt in ("ansi", "html"):
+                relevant["coalesce_colors"] = params["coalesce_colors"]
+    if fmt == "png":
+        relevant["png_font_size"] = params["png_font_size"]
+    encoded = json.dumps([fmt, relevant], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ConversionCache:
+    """
+    On-disk manifest for content-based ``--skip-existing`` in batch runs.
+
+    ``sources`` maps a resolved source path to its size, mtime and SHA-256 (the
+    hash is only recomputed when size/mtime change). ``outputs`` maps each output
+    path (relative to ``root``) to the source hash + parameter key that produced
+    it and the output's own digest. Conversions never mutate the manifest
+    directly: they return ``cache_updates`` that the batch merges and saves once,
+    which keeps ``--jobs`` workers independent.
+    """
+
+    root: Path
+    sources: dict[str, dict] = field(default_factory=dict)
+    outputs: dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    @classmethod
+    def load(cls, root: Path) -> ConversionCache:
+        cache = cls(root=root)
+        try:
+            data = json.loads(cache.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable manifest %s: %s", cache.path, exc)
+            return cache
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info("Manifest %s has another version; rebuilding", cache.path)
+            return cache
+        cache.sources = data.get("sources", {})
+        cache.outputs = data.get("outputs", {})
+        return cache
+
+    def save(self) -> None:
+        document = {"version": MANIFEST_VERSION, "sources": self.sources, "outputs": self.outputs}
+        with _atomic_text_output(self.path) as handle:
+            json.dump(document, handle, sort_keys=True, separators=(",", ":"))
+
+    def merge(self, updates: dict[str, dict]) -> None:
+        self.sources.update(updates.get("sources", {}))
+        self.outputs.update(updates.get("outputs", {}))
+
+    def _output_key(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def source_entry(self, source: Path) -> dict:
+        """Current ``{size, mtime_ns, sha256}`` for ``source``, reusing the stored hash if unchanged."""
+        st = source.stat()
+        known = self.sources.get(str(source.resolve()))
+        if known and known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+            return known
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": file_sha256(source)}
+
+    def fresh_output_entry(self, output: Path, source_sha: str, params_key: str) -> dict | None:
+        """Stored entry if ``output`` was made from this source + params and is intact, else None."""
+        known = self.outputs.get(self._output_key(output))
+        if not known or known["source"] != source_sha or known["params"] != params_key:
+            return None
+        try:
+            st = output.stat()
+        except OSError:
+            return None
+        if known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+            return known
+        if file_sha256(output) != known["sha256"]:
+            return None
+        return {**known, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def output_updates(
+        self,
+        source: Path,
+        source_info: dict,
+        outputs: dict[Path, tuple[str, dict | None]],
+    ) -> dict[str, dict]:
+        """
+        Build ``cache_updates`` for one source.
+
+        ``outputs`` maps each output path to its params key and, for outputs
+        that were reused, the fresh entry (None means it was just written).
+        """
+        entries: dict[str, dict] = {}
+        for output, (params_key, entry) in outputs.items():
+            if entry is None:
+                st = output.stat()
+                entry = {
+                    "source": source_info["sha256"],
+                    "params": params_key,
+                    "sha256": file_sha256(output),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                }
+            entries[self._output_key(output)] = entry
+        return {"sources": {str(source.resolve()): source_info}, "outputs": entries}
+
+
 # =========================
 # IMAGE LOADING
 # =========================
@@ -286,18 +575,39 @@ def load_image_pair(
         if getattr(opened, "is_animated", False) and gif_frame:
             opened.seek(gif_frame)
 
-        img = ImageOps.exif_transpose(opened)
+        rgb = _flatten_to_rgb(opened, background)
+        return rgb.convert("L"), rgb
 
-        has_alpha = img.mode in ("RGBA", "LA") or (
-            img.mode == "P" and "transparency" in opened.info
-        )
-        if has_alpha:
-            rgba = img.convert("RGBA")
-            base = Image.new("RGBA", rgba.size, background + (255,))
-            img = Image.alpha_composite(base, rgba)
 
-        rgb = img.convert("RGB")
-        return rgb.convert("L"), rgb
+def _flatten_to_rgb(frame: Image.Image, background: tuple[int, int, int]) -> Image.Image:
+    """Apply EXIF orientation and composite transparency onto ``background``."""
+    img = ImageOps.exif_transpose(frame)
+
+    has_alpha = img.mode in ("RGBA", "LA") or (
+        img.mode == "P" and "transparency" in frame.info
+    )
+    if has_alpha:
+        rgba = img.convert("RGBA")
+        base = Image.new("RGBA", rgba.size, background + (255,))
+        img = Image.alpha_composite(base, rgba)
+
+    return img.convert("RGB")
+
+
+def iter_frames(
+    path: Path,
+    *,
+    background: tuple[int, int, int] = (255, 255, 255),
+) -> Iterator[tuple[Image.Image, int]]:
+    """
+    Lazily decode every frame as ``(rgb, duration_ms)``.
+
+    Only the current frame is held in memory; still images yield one frame.
+    """
+    with Image.open(path) as opened:
+        for frame in ImageSequence.Iterator(opened):
+            duration = int(frame.info.get("duration") or DEFAULT_FRAME_MS)
+            yield _flatten_to_rgb(frame, background), duration
 
 
 def load_and_prepare_image(
@@ -366,6 +676,20 @@ def select_char_ramp(effective_width: int) -> str:
 # =========================
 
 
+def terminal_grid_size(
+    size: tuple[int, int],
+    width: int,
+    aspect_ratio_correction: float,
+    *,
+    allow_large: bool = False,
+) -> tuple[int, int]:
+    """Character grid (cols, rows) for a source ``size`` at ``width`` columns."""
+    original_width, original_height = size
+    scale_factor = width / original_width
+    new_height = int(original_height * scale_factor * aspect_ratio_correction)
+    return clamp_output_dimensions(width, max(1, new_height), allow_large=allow_large)
+
+
 def resize_for_terminal(
     img: Image.Image,
     width: int,
@@ -373,13 +697,42 @@ def resize_for_terminal(
     *,
     allow_large: bool = False,
 ) -> Image.Image:
-    original_width, original_height = img.size
-    scale_factor = width / original_width
-    new_height = int(original_height * scale_factor * aspect_ratio_correction)
-    width, new_height = clamp_output_dimensions(
-        width, max(1, new_height), allow_large=allow_large
+    grid_size = terminal_grid_size(
+        img.size, width, aspect_ratio_correction, allow_large=allow_large
     )
-    return img.resize((width, new_height), Image.Resampling.LANCZOS)
+    return img.resize(grid_size, Image.Resampling.LANCZOS)
+
+
+def map_pixels_to_grid(
+    gray: Image.Image,
+    rgb: Image.Image,
+    char_ramp: str,
+    invert: bool,
+) -> AsciiGrid:
+    """Map pixels to ramp indices (from luminance) and colors (from RGB) with NumPy."""
+    if gray.size != rgb.size:
+        raise ValueError("grayscale and RGB images must be the same size")
+
+    max_index = len(char_ramp) - 1
+    luminance = np.asarray(gray, dtype=np.int32)
+    colors = np.array(rgb, dtype=np.uint8)
+    if invert:
+        luminance = 255 - luminance
+        colors = 255 - colors
+
+    indices = (luminance * max_index // 255).astype(np.min_scalar_type(max_index))
+    return AsciiGrid(indices=indices, rgb=colors, char_ramp=char_ramp)
+
+
+def quantize_colors(rgb: np.ndarray, bits: int) -> np.ndarray:
+    """Reduce each channel to ``bits`` bits, spread back over 0-255 (0 and 255 are kept)."""
+    if not MIN_COLOR_BITS <= bits <= MAX_COLOR_BITS:
+        raise ValueError(f"color bits must be {MIN_COLOR_BITS}-{MAX_COLOR_BITS}, got {bits}")
+    if bits == MAX_COLOR_BITS:
+        return rgb
+    levels = (1 << bits) - 1
+    steps = (rgb.astype(np.uint16) * levels + 127) // 255
+    return (steps * 255 // levels).astype(np.uint8)
 
 
 def map_pixels_to_cells(
@@ -388,7 +741,11 @@ def map_pixels_to_cells(
     char_ramp: str,
     invert: bool,
 ) -> list[list[AsciiCell]]:
-    """Map pixels to characters (from luminance) with colors (from RGB)."""
+    """
+    Map pixels to characters (from luminance) with colors (from RGB).
+
+    Per-pixel reference implementation; ``map_pixels_to_grid`` is the fast path.
+    """
     if gray.size != rgb.size:
         raise ValueError("grayscale and RGB images must be the same size")
 
@@ -418,26 +775,41 @@ def cells_to_plain_lines(cells: list[list[AsciiCell]]) -> list[str]:
 
 def map_pixels_to_chars(img: Image.Image, char_ramp: str, invert: bool) -> list[str]:
     rgb = img.convert("RGB")
-    cells = map_pixels_to_cells(img, rgb, char_ramp, invert)
-    return cells_to_plain_lines(cells)
+    return map_pixels_to_grid(img, rgb, char_ramp, invert).lines()
 
 
-def write_output(lines: list[str], output_path: Path) -> None:
-    """Write ASCII art atomically (temp file + replace)."""
+@contextmanager
+def _atomic_text_output(output_path: Path) -> Iterator:
+    """Open a buffered temp file next to ``output_path``; replace the target on success."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
-    content = "\n".join(lines)
     try:
-        tmp_path.write_text(content, encoding="utf-8")
+        with open(tmp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as handle:
+            yield handle
         tmp_path.replace(output_path)
-    except Exception:
+    except BaseException:
         if tmp_path.exists():
             tmp_path.unlink(missing_ok=True)
         raise
 
 
+def _write_rows(handle, rows: Iterable[str]) -> None:
+    """Write rows separated by newlines (no trailing newline), one row at a time."""
+    for index, row in enumerate(rows):
+        if index:
+            handle.write("\n")
+        handle.write(row)
+
+
+def write_output(lines: Iterable[str], output_path: Path) -> None:
+    """Write ASCII art atomically (streamed temp file + replace)."""
+    with _atomic_text_output(output_path) as handle:
+        _write_rows(handle, lines)
+
+
+@lru_cache(maxsize=None)
 def _load_monospace_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    """Best-effort monospace font for PNG rendering."""
+    """Best-effort monospace font for PNG rendering (cached per size, per process)."""
     candidates = [
         Path("C:/Windows/Fonts/consola.ttf"),
         Path("C:/Windows/Fonts/cour.ttf"),
@@ -455,59 +827,63 @@ def _load_monospace_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageF
     return ImageFont.load_default()
 
 
-def write_ansi(cells: list[list[AsciiCell]], output_path: Path) -> None:
-    """Write true-color ANSI escape codes (view with ``type``, ``cat``, Windows Terminal)."""
-    lines: list[str] = []
-    for row in cells:
-        parts: list[str] = []
-        for cell in row:
-            r, g, b = cell.rgb
-            parts.append(f"\033[38;2;{r};{g};{b}m{cell.char}")
-        lines.append("".join(parts) + "\033[0m")
-    write_output(lines, output_path)
+def _iter_ansi_rows(grid: AsciiGrid, coalesce: bool) -> Iterator[str]:
+    if coalesce:
+        for runs in grid.iter_color_runs():
+            yield "".join(f"\033[38;2;{r};{g};{b}m{chars}" for chars, (r, g, b) in runs) + "\033[0m"
+        return
+    for chars, colors in grid.iter_rows():
+        yield "".join(
+            f"\033[38;2;{r};{g};{b}m{char}" for char, (r, g, b) in zip(chars, colors)
+        ) + "\033[0m"
 
 
-def _render_html_art(
-    lines: list[str],
-    cells: list[list[AsciiCell]] | None,
-) -> str:
+def write_ansi(grid: AsciiGrid, output_path: Path, *, coalesce: bool = False) -> None:
+    """
+    Write true-color ANSI escape codes (view with ``type``, ``cat``, Windows Terminal).
+
+    ``coalesce`` emits one escape per run of equal color instead of one per character.
+    """
+    write_output(_iter_ansi_rows(grid, coalesce), output_path)
+
+
+def _iter_html_art(
+    lines: Iterable[str],
+    grid: AsciiGrid | None,
+    coalesce: bool = False,
+) -> Iterator[str]:
+    """Yield escaped ``<pre>`` rows (colored spans when ``grid`` is given)."""
     import html as html_module
 
-    if cells is None:
-        return html_module.escape("\n".join(lines))
+    if grid is None:
+        for line in lines:
+            yield html_module.escape(line)
+        return
 
-    rows: list[str] = []
-    for row in cells:
-        spans = [
-            f'<span style="color:rgb({cell.rgb[0]},{cell.rgb[1]},{cell.rgb[2]})">'
-            f"{html_module.escape(cell.char)}</span>"
-            for cell in row
-        ]
-        rows.append("".join(spans))
-    return "\n".join(rows)
+    if coalesce:
+        for runs in grid.iter_color_runs():
+            yield "".join(
+                f'<span style="color:rgb({r},{g},{b})">{html_module.escape(chars)}</span>'
+                for chars, (r, g, b) in runs
+            )
+        return
 
+    escaped = [html_module.escape(char) for char in grid.char_ramp]
+    for y in range(grid.height):
+        yield "".join(
+            f'<span style="color:rgb({r},{g},{b})">{escaped[index]}</span>'
+            for index, (r, g, b) in zip(grid.indices[y].tolist(), grid.rgb[y].tolist())
+        )
 
-def write_html(
-    lines: list[str],
-    output_path: Path,
-    *,
-    title: str,
-    invert: bool,
-    cells: list[list[AsciiCell]] | None = None,
-) -> None:
-    """
-    Write a self-contained HTML viewer with zoom controls.
 
-    Open in any browser and use the slider to shrink/enlarge the ASCII art.
-    Pass ``cells`` for per-character color from the source image.
-    """
+def _html_shell(title: str, invert: bool, extra_script: str = "") -> tuple[str, str]:
+    """HTML viewer markup before and after the ``<pre>`` art block."""
     import html as html_module
 
-    art_html = _render_html_art(lines, cells)
     bg = "#111" if invert else "#f8f8f8"
     fg = "#eee" if invert else "#111"
 
-    document = f"""<!DOCTYPE html>
+    head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
@@ -553,7 +929,8 @@ def write_html(
     <span id="dims"></span>
   </div>
   <div id="viewport">
-    <pre id="art">{art_html}</pre>
+    <pre id="art">"""
+    tail = f"""</pre>
   </div>
   <script>
     const art = document.getElementById("art");
@@ -579,19 +956,131 @@ def write_html(
     }});
 
     applyScale(100);
-  </script>
+  </script>{extra_script}
 </body>
 </html>
 """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
-    try:
-        tmp_path.write_text(document, encoding="utf-8")
-        tmp_path.replace(output_path)
-    except Exception:
-        if tmp_path.exists():
-            tmp_path.unlink(missing_ok=True)
-        raise
+    return head, tail
+
+
+def write_html(
+    lines: Iterable[str],
+    output_path: Path,
+    *,
+    title: str,
+    invert: bool,
+    grid: AsciiGrid | None = None,
+    coalesce: bool = False,
+) -> None:
+    """
+    Write a self-contained HTML viewer with zoom controls.
+
+    Open in any browser and use the slider to shrink/enlarge the ASCII art.
+    Pass ``grid`` for per-character color from the source image (``coalesce``
+    merges runs of equal color into one span). Rows are streamed into the temp
+    file, so no whole-document string is built.
+    """
+    head, tail = _html_shell(title, invert)
+    with _atomic_text_output(output_path) as handle:
+        handle.write(head)
+        _write_rows(handle, _iter_html_art(lines, grid, coalesce))
+        handle.write(tail)
+
+
+@dataclass(frozen=True, eq=False)
+class GlyphAtlas:
+    """
+    Pre-rasterized ramp glyphs for one font size.
+
+    ``masks[i]`` is the antialiased coverage of ``char_ramp[i]`` drawn at
+    (``offset_x``, ``offset_y``) inside a tile, so ink that overhangs the
+    ``cell_w`` x ``cell_h`` cell (descenders, wide glyphs) is kept.
+    """
+
+    char_ramp: str
+    cell_w: int
+    cell_h: int
+    offset_x: int
+    offset_y: int
+    masks: np.ndarray
+
+
+@lru_cache(maxsize=None)
+def _cell_size(font_size: int) -> tuple[int, int]:
+    """Character cell (width, height) from the ink box of ``"M"``."""
+    font = _load_monospace_font(font_size)
+    bbox = ImageDraw.Draw(Image.new("L", (1, 1))).textbbox((0, 0), "M", font=font)
+    return max(1, bbox[2] - bbox[0]), max(1, bbox[3] - bbox[1])
+
+
+@lru_cache(maxsize=32)
+def load_glyph_atlas(char_ramp: str, font_size: int) -> GlyphAtlas:
+    """Rasterize each ramp character once per font size (cached for the whole batch)."""
+    font = _load_monospace_font(font_size)
+    cell_w, cell_h = _cell_size(font_size)
+    measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+    boxes = [measure.textbbox((0, 0), char, font=font) for char in char_ramp]
+
+    left = min([0, *(box[0] for box in boxes)])
+    top = min([0, *(box[1] for box in boxes)])
+    right = max([cell_w, *(box[2] for box in boxes)])
+    bottom = max([cell_h, *(box[3] for box in boxes)])
+
+    masks = np.zeros((len(char_ramp), bottom - top, right - left), dtype=np.uint8)
+    for index, char in enumerate(char_ramp):
+        tile = Image.new("L", (right - left, bottom - top), 0)
+        ImageDraw.Draw(tile).text((-left, -top), char, font=font, fill=255)
+        masks[index] = np.asarray(tile)
+
+    return GlyphAtlas(
+        char_ramp=char_ramp,
+        cell_w=cell_w,
+        cell_h=cell_h,
+        offset_x=-left,
+        offset_y=-top,
+        masks=masks,
+    )
+
+
+def _compose_colored(grid: AsciiGrid, atlas: GlyphAtlas, bg: RGB) -> np.ndarray:
+    """
+    Build the colored raster from atlas tiles with a per-cell color blend.
+
+    Uses Pillow's mask-fill arithmetic and draws rows top to bottom, so the
+    result matches drawing each character with ``ImageDraw.text``. Within a row,
+    cells are laid down in column passes whose tiles never overlap.
+    """
+    cell_w, cell_h = atlas.cell_w, atlas.cell_h
+    tile_h, tile_w = atlas.masks.shape[1:]
+    passes = -(-tile_w // cell_w)
+    stride = passes * cell_w
+
+    canvas_h = (grid.height - 1) * cell_h + max(tile_h, cell_h + atlas.offset_y)
+    canvas_w = grid.width * cell_w + tile_w + stride
+    canvas = np.empty((canvas_h, canvas_w, 3), dtype=np.uint32)
+    canvas[:] = bg
+
+    for y in range(grid.height):
+        top = y * cell_h
+        for first in range(min(passes, grid.width)):
+            indices = grid.indices[y, first::passes]
+            count = len(indices)
+            coverage = np.zeros((tile_h, count, stride), dtype=np.uint32)
+            coverage[:, :, :tile_w] = atlas.masks[indices].transpose(1, 0, 2)
+            coverage = coverage.reshape(tile_h, count * stride, 1)
+            colors = np.repeat(grid.rgb[y, first::passes].astype(np.uint32), stride, axis=0)
+
+            left = first * cell_w
+            region = canvas[top : top + tile_h, left : left + count * stride]
+            blended = region * (255 - coverage) + colors * coverage + 128
+            region[:] = ((blended >> 8) + blended) >> 8
+
+    height = grid.height * cell_h
+    width = grid.width * cell_w
+    return canvas[
+        atlas.offset_y : atlas.offset_y + height,
+        atlas.offset_x : atlas.offset_x + width,
+    ].astype(np.uint8)
 
 
 def write_png(
@@ -600,33 +1089,29 @@ def write_png(
     *,
     font_size: int = DEFAULT_PNG_FONT_SIZE,
     invert: bool,
-    cells: list[list[AsciiCell]] | None = None,
+    grid: AsciiGrid | None = None,
 ) -> None:
-    """Render ASCII lines to a PNG image (zoomable in any image viewer)."""
+    """
+    Render ASCII lines to a PNG image (zoomable in any image viewer).
+
+    Colored output is composed from a cached ``GlyphAtlas`` instead of one
+    ``draw.text`` call per cell.
+    """
     fg = (255, 255, 255) if invert else (0, 0, 0)
     bg = (0, 0, 0) if invert else (255, 255, 255)
-    font = _load_monospace_font(font_size)
-
-    probe = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(probe)
-    bbox = draw.textbbox((0, 0), "M", font=font)
-    char_w = max(1, bbox[2] - bbox[0])
-    char_h = max(1, bbox[3] - bbox[1])
+    char_w, char_h = _cell_size(font_size)
 
-    cols = max(len(line) for line in lines) if lines else 1
-    rows = len(lines) or 1
-    img = Image.new("RGB", (cols * char_w, rows * char_h), bg)
-    draw = ImageDraw.Draw(img)
-
-    if cells is None:
+    if grid is not None and grid.width and grid.height:
+        atlas = load_glyph_atlas(grid.char_ramp, font_size)
+        img = Image.fromarray(_compose_colored(grid, atlas, bg), mode="RGB")
+    else:
+        font = _load_monospace_font(font_size)
+        cols = max(len(line) for line in lines) if lines else 1
+        rows = len(lines) or 1
+        img = Image.new("RGB", (cols * char_w, rows * char_h), bg)
+        draw = ImageDraw.Draw(img)
         for row_index, line in enumerate(lines):
             draw.text((0, row_index * char_h), line, font=font, fill=fg)
-    else:
-        for row_index, row in enumerate(cells):
-            x = 0
-            for cell in row:
-                draw.text((x, row_index * char_h), cell.char, font=font, fill=cell.rgb)
-                x += char_w
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(output_path, format="PNG")
@@ -637,45 +1122,42 @@ def write_outputs(
     base_path: Path,
     output_format: OutputFormat,
     *,
-    cells: list[list[AsciiCell]] | None = None,
+    grid: AsciiGrid | None = None,
     title: str,
     invert: bool,
     png_font_size: int,
     use_color: bool = False,
+    coalesce_colors: bool = False,
+    only: set[str] | None = None,
 ) -> list[Path]:
-    """Write one or more output formats for the same ASCII result."""
+    """
+    Write one or more output formats for the same ASCII result.
+
+    ``only`` restricts writing to those formats (used by the batch cache to
+    re-render just the outputs a changed flag affects).
+    """
     written: list[Path] = []
-    if output_format == "all":
-        jobs: list[tuple[str, Path]] = [("txt", base_path.with_suffix(".txt"))]
-        if use_color:
-            jobs.append(("ansi", base_path.with_suffix(".ansi.txt")))
-        jobs.extend(
-            [
-                ("html", base_path.with_suffix(".html")),
-                ("png", base_path.with_suffix(".png")),
-            ]
-        )
-    elif output_format == "ansi":
-        jobs = [("ansi", base_path.with_suffix(".ansi.txt"))]
-    else:
-        jobs = [(output_format, base_path.with_suffix(f".{output_format}"))]
+    jobs = output_jobs(base_path, output_format, use_color=use_color)
+    if only is not None:
+        jobs = [(fmt, path) for fmt, path in jobs if fmt in only]
 
-    color_cells = cells if use_color else None
+    color_grid = grid if use_color else None
 
     for fmt, path in jobs:
         if fmt == "txt":
             write_output(lines, path)
         elif fmt == "ansi":
-            if cells is None:
-                raise ValueError("ANSI output requires color cell data")
-            write_ansi(cells, path)
+            if grid is None:
+                raise ValueError("ANSI output requires color grid data")
+            write_ansi(grid, path, coalesce=coalesce_colors)
         elif fmt == "html":
             write_html(
                 lines,
                 path,
                 title=title,
                 invert=invert,
-                cells=color_cells,
+                grid=color_grid,
+                coalesce=coalesce_colors,
             )
         elif fmt == "png":
             write_png(
@@ -683,12 +1165,93 @@ def write_outputs(
                 path,
                 font_size=png_font_size,
                 invert=invert,
-                cells=color_cells,
+                grid=color_grid,
             )
         written.append(path)
     return written
 
 
+def prepare_working_pair(
+    gray: Image.Image,
+    rgb: Image.Image,
+    *,
+    output_width: int | None,
+    resolution: int,
+    aspect_ratio_correction: float,
+    native_size: bool,
+    pixel_grid: bool,
+    allow_large: bool,
+) -> tuple[Image.Image, Image.Image, str]:
+    """Resize the grayscale/RGB pair to the character grid; returns (gray, rgb, width_source)."""
+    if pixel_grid:
+        if gray.width > MAX_OUTPUT_WIDTH or gray.height > MAX_OUTPUT_HEIGHT:
+            if not allow_large:
+                raise ValueError(
+                    f"Pixel grid is {gray.width}x{gray.height} chars — too large. "
+                    f"Pass --allow-large to proceed, or use --native-size / lower --resolution."
+                )
+            logger.warning(
+                "Large pixel grid: %sx%s characters (%s cells)",
+                gray.width,
+                gray.height,
+                gray.width * gray.height,
+            )
+        return gray, rgb, "pixel-grid"
+
+    effective_width = compute_effective_width(
+        gray,
+        output_width=output_width,
+        resolution=resolution,
+        native_size=native_size,
+        allow_large=allow_large,
+    )
+    if native_size and not allow_large and gray.width > MAX_OUTPUT_WIDTH:
+        logger.warning(
+            "Native width %s clamped to %s — pass --allow-large for full size",
+            gray.width,
+            MAX_OUTPUT_WIDTH,
+        )
+    working_gray = resize_for_terminal(
+        gray,
+        effective_width,
+        aspect_ratio_correction,
+        allow_large=allow_large,
+    )
+    working_rgb = resize_for_terminal(
+        rgb,
+        effective_width,
+        aspect_ratio_correction,
+        allow_large=allow_large,
+    )
+    width_source = (
+        "native"
+        if native_size
+        else "manual"
+        if output_width is not None
+        else f"{resolution}%"
+    )
+    return working_gray, working_rgb, width_source
+
+
+def resolve_char_ramp(
+    char_ramp: str | None,
+    use_extended_ramp: bool | None,
+    grid_width: int,
+) -> str:
+    """Pick the explicit ramp, or standard/extended from flags and grid width."""
+    if char_ramp is None:
+        if use_extended_ramp is True:
+            char_ramp = CHAR_RAMP_EXTENDED
+        elif use_extended_ramp is False:
+            char_ramp = CHAR_RAMP_STANDARD
+        else:
+            char_ramp = select_char_ramp(grid_width)
+
+    if not char_ramp:
+        raise ValueError("Character ramp must be a non-empty string.")
+    return char_ramp
+
+
 # =========================
 # CONVERSION CORE
 # =========================
@@ -716,6 +1279,9 @@ def convert_to_ascii(
     output_format: OutputFormat = "txt",
     png_font_size: int = DEFAULT_PNG_FONT_SIZE,
     use_color: bool = False,
+    coalesce_colors: bool = False,
+    color_bits: int | None = None,
+    cache: ConversionCache | None = None,
 ) -> ConversionResult:
     """
     Full pipeline: load → grayscale/RGB → compute width → resize → map → write.
@@ -734,6 +1300,15 @@ def convert_to_ascii(
     Color (``use_color`` or ``--color``):
       - Character shape from luminance; color from source pixel RGB.
       - ANSI uses 24-bit escape codes; HTML/PNG tint each character.
+      - ``color_bits``: quantize each channel to N bits first (flattens gradients).
+      - ``coalesce_colors``: one ANSI escape / HTML span per run of equal color;
+        the cells-per-span ratio is reported in ``ConversionResult.message``.
+
+    Skipping (``skip_existing``):
+      - without ``cache``: skip when every output is newer than the source.
+      - with ``cache``: skip by source content hash + per-format parameters;
+        only stale formats are re-written. Manifest changes are returned in
+        ``ConversionResult.cache_updates`` for the caller to merge.
     """
     resolution = max(MIN_RESOLUTION, min(MAX_RESOLUTION, resolution))
     image_path = Path(image_path)
@@ -745,10 +1320,51 @@ def convert_to_ascii(
         root=root,
         output_dir=output_dir,
     )
-    destinations = output_paths_for_format(base, output_format, use_color=use_color)
+    jobs = output_jobs(base, output_format, use_color=use_color)
+    destinations = [path for _, path in jobs]
     primary = destinations[0]
 
-    if skip_existing and all(should_skip_existing(image_path, dest) for dest in destinations):
+    cached: dict[Path, tuple[str, dict | None]] = {}
+    stale_formats: set[str] | None = None
+    if skip_existing and cache is not None:
+        source_info = cache.source_entry(image_path)
+        params = {
+            "grid": [
+                output_width,
+                resolution,
+                native_size,
+                pixel_grid,
+                allow_large,
+                aspect_ratio_correction,
+                char_ramp,
+                use_extended_ramp,
+            ],
+            "invert": invert,
+            "background": list(background),
+            "gif_frame": gif_frame,
+            "use_color": use_color,
+            "color_bits": color_bits,
+            "coalesce_colors": coalesce_colors,
+            "png_font_size": png_font_size,
+        }
+        stale_formats = set()
+        for fmt, path in jobs:
+            key = format_params_key(fmt, params)
+            entry = cache.fresh_output_entry(path, source_info["sha256"], key)
+            cached[path] = (key, entry)
+            if entry is None:
+                stale_formats.add(fmt)
+        if not stale_formats:
+            logger.debug("Skip unchanged (manifest): %s", image_path)
+            return ConversionResult(
+                source=image_path,
+                output=primary,
+                status="skipped",
+                message="output up to date",
+                cache_updates=cache.output_updates(image_path, source_info, cached),
+            )
+        destinations = [path for fmt, path in jobs if fmt in stale_formats]
+    elif skip_existing and all(should_skip_existing(image_path, dest) for dest in destinations):
         logger.debug("Skip unchanged: %s", image_path)
         return ConversionResult(
             source=image_path,
@@ -771,83 +1387,49 @@ def convert_to_ascii(
         background=background,
         gif_frame=gif_frame,
     )
+    working_gray, working_rgb, width_source = prepare_working_pair(
+        gray,
+        rgb,
+        output_width=output_width,
+        resolution=resolution,
+        aspect_ratio_correction=aspect_ratio_correction,
+        native_size=native_size,
+        pixel_grid=pixel_grid,
+        allow_large=allow_large,
+    )
+    char_ramp = resolve_char_ramp(char_ramp, use_extended_ramp, working_gray.width)
 
-    if pixel_grid:
-        if gray.width > MAX_OUTPUT_WIDTH or gray.height > MAX_OUTPUT_HEIGHT:
-            if not allow_large:
-                raise ValueError(
-                    f"Pixel grid is {gray.width}x{gray.height} chars — too large. "
-                    f"Pass --allow-large to proceed, or use --native-size / lower --resolution."
-                )
-            logger.warning(
-                "Large pixel grid: %sx%s characters (%s cells)",
-                gray.width,
-                gray.height,
-                gray.width * gray.height,
-            )
-        working_gray = gray
-        working_rgb = rgb
-        width_source = "pixel-grid"
-    else:
-        effective_width = compute_effective_width(
-            gray,
-            output_width=output_width,
-            resolution=resolution,
-            native_size=native_size,
-            allow_large=allow_large,
-        )
-        if native_size and not allow_large and gray.width > MAX_OUTPUT_WIDTH:
-            logger.warning(
-                "Native width %s clamped to %s — pass --allow-large for full size",
-                gray.width,
-                MAX_OUTPUT_WIDTH,
-            )
-        working_gray = resize_for_terminal(
-            gray,
-            effective_width,
-            aspect_ratio_correction,
-            allow_large=allow_large,
-        )
-        working_rgb = resize_for_terminal(
-            rgb,
-            effective_width,
-            aspect_ratio_correction,
-            allow_large=allow_large,
-        )
-        width_source = (
-            "native"
-            if native_size
-            else "manual"
-            if output_width is not None
-            else f"{resolution}%"
-        )
-
-    if char_ramp is None:
-        if use_extended_ramp is True:
-            char_ramp = CHAR_RAMP_EXTENDED
-        elif use_extended_ramp is False:
-            char_ramp = CHAR_RAMP_STANDARD
-        else:
-            char_ramp = select_char_ramp(working_gray.width)
-
-    if not char_ramp:
-        raise ValueError("Character ramp must be a non-empty string.")
-
-    cells = map_pixels_to_cells(working_gray, working_rgb, char_ramp, invert)
-    lines = cells_to_plain_lines(cells)
+    grid = map_pixels_to_grid(working_gray, working_rgb, char_ramp, invert)
+    if color_bits is not None:
+        grid = replace(grid, rgb=quantize_colors(grid.rgb, color_bits))
+    lines = grid.lines()
     written = write_outputs(
         lines,
         base,
         output_format,
-        cells=cells,
+        grid=grid,
         title=image_path.stem,
         invert=invert,
         png_font_size=png_font_size,
         use_color=use_color,
+        coalesce_colors=coalesce_colors,
+        only=stale_formats,
     )
 
+    cache_updates: dict[str, dict] = {}
+    if cache is not None and stale_formats is not None:
+        cache_updates = cache.output_updates(image_path, source_info, cached)
+
+    color_cells = color_spans = 0
+    span_note = ""
+    if coalesce_colors and use_color:
+        color_cells = grid.width * grid.height
+        color_spans = grid.count_color_runs()
+        ratio = color_cells / color_spans if color_spans else 1.0
+        span_note = f", spans {color_cells}->{color_spans} ({ratio:.1f}x)"
+
     logger.info(
-        "Converted: %s -> %s (grid=%sx%s [%s], ramp=%s%s)",
+        "Converted: %s -> %s (grid=%sx%s [%s], ramp=%s%s%s)",
         image_path,
         ", ".join(str(p) for p in written),
         working_gray.width,
@@ -855,14 +1437,471 @@ def convert_to_ascii(
         width_source,
         ramp_label(char_ramp),
         ", color" if use_color else "",
+        span_note,
     )
 
     return ConversionResult(
         source=image_path,
         output=written[0],
         status="converted",
-        message=f"{working_gray.width}x{working_gray.height}",
+        message=f"{working_gray.width}x{working_gray.height}{span_note}",
+        color_cells=color_cells,
+        color_spans=color_spans,
+        cache_updates=cache_updates,
+    )
+
+
+# =========================
+# ANIMATION
+# =========================
+
+ANIMATION_FORMATS = ("html", "ansi")
+
+_HTML_PLAYER_SCRIPT = """
+  <script>
+    const frames = Array.from(document.querySelectorAll("#frames > pre"));
+    let current = 0;
+    let paused = false;
+    let timer = null;
+
+    function tick() {
+      art.innerHTML = frames[current].innerHTML;
+      const delay = Number(frames[current].dataset.ms) || 100;
+      current = (current + 1) % frames.length;
+      if (!paused && frames.length > 1) timer = setTimeout(tick, delay);
+    }
+
+    art.title = "Click to pause / resume";
+    art.addEventListener("click", () => {
+      paused = !paused;
+      clearTimeout(timer);
+      if (!paused) tick();
+    });
+
+    tick();
+    applyScale(Number(zoom.value));
+  </script>"""
+
+
+def _render_frame(frame: np.ndarray, settings: dict) -> str:
+    """Resize one decoded RGB frame to the shared grid size and render it as text rows."""
+    rgb = Image.fromarray(frame)
+    gray = rgb.convert("L")
+    size = settings["size"]
+    if rgb.size != size:
+        gray = gray.resize(size, Image.Resampling.LANCZOS)
+        rgb = rgb.resize(size, Image.Resampling.LANCZOS)
+
+    grid = map_pixels_to_grid(gray, rgb, settings["char_ramp"], settings["invert"])
+    if settings["color_bits"] is not None:
+        grid = replace(grid, rgb=quantize_colors(grid.rgb, settings["color_bits"]))
+
+    if settings["output_format"] == "ansi":
+        rows = _iter_ansi_rows(grid, settings["coalesce_colors"])
+    else:
+        color_grid = grid if settings["use_color"] else None
+        rows = _iter_html_art(grid.lines(), color_grid, settings["coalesce_colors"])
+    return "\n".join(rows)
+
+
+def _render_frame_in_worker(frame: np.ndarray) -> str:
+    return _render_frame(frame, _worker_options)
+
+
+def _ordered_window_map(pool: ProcessPoolExecutor, func, items: Iterable, window: int) -> Iterator:
+    """Like ``pool.map`` but keeps at most ``window`` items in flight (inputs stay lazy)."""
+    pending: deque = deque()
+    for item in items:
+        pending.append(pool.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def convert_animation(
+    image_path: Path,
+    output_path: Path | None = None,
+    *,
+    output_width: int | None = None,
+    resolution: int = DEFAULT_RESOLUTION,
+    char_ramp: str | None = None,
+    use_extended_ramp: bool | None = None,
+    aspect_ratio_correction: float = ASPECT_RATIO_CORRECTION,
+    invert: bool = False,
+    background: tuple[int, int, int] = (255, 255, 255),
+    skip_existing: bool = False,
+    dry_run: bool = False,
+    native_size: bool = False,
+    pixel_grid: bool = False,
+    allow_large: bool = False,
+    output_format: OutputFormat = "html",
+    use_color: bool = False,
+    coalesce_colors: bool = False,
+    color_bits: int | None = None,
+    jobs: int = 1,
+) -> ConversionResult:
+    """
+    Convert every frame of an animated image (GIF/WEBP/...) to one output.
+
+      - ``output_format=html`` → self-contained player (frame delays from the file,
+        click the art to pause).
+      - ``output_format=ansi`` → ``.ansi.txt`` frame sequence (cursor-home before
+        each frame, so ``cat`` plays it in a true-color terminal).
+
+    Frames are decoded lazily; the grid size and ramp come from the first frame
+    and are reused for all frames. ``jobs > 1`` renders frames on a process pool
+    with a bounded window, so only a few decoded frames exist at any time.
+    """
+    if output_format not in ANIMATION_FORMATS:
+        raise ValueError(
+            f"Animation output supports {', '.join(ANIMATION_FORMATS)}, not {output_format!r}"
+        )
+    resolution = max(MIN_RESOLUTION, min(MAX_RESOLUTION, resolution))
+    image_path = Path(image_path)
+    use_color = use_color or output_format == "ansi"
+    base = resolve_output_base(image_path, output_path)
+    destination = output_paths_for_format(base, output_format, use_color=use_color)[0]
+
+    if skip_existing and should_skip_existing(image_path, destination):
+        logger.debug("Skip unchanged: %s", image_path)
+        return ConversionResult(
+            source=image_path,
+            output=destination,
+            status="skipped",
+            message="output up to date",
+        )
+
+    if dry_run:
+        logger.info("[dry-run] would animate: %s -> %s", image_path, destination)
+        return ConversionResult(
+            source=image_path,
+            output=destination,
+            status="skipped",
+            message="dry run",
+        )
+
+    frames = iter_frames(image_path, background=background)
+    try:
+        first_rgb, first_ms = next(frames)
+    except StopIteration:
+        raise ValueError(f"No frames in {image_path}") from None
+
+    working_gray, _, width_source = prepare_working_pair(
+        first_rgb.convert("L"),
+        first_rgb,
+        output_width=output_width,
+        resolution=resolution,
+        aspect_ratio_correction=aspect_ratio_correction,
+        native_size=native_size,
+        pixel_grid=pixel_grid,
+        allow_large=allow_large,
+    )
+    char_ramp = resolve_char_ramp(char_ramp, use_extended_ramp, working_gray.width)
+    settings = dict(
+        size=working_gray.size,
+        char_ramp=char_ramp,
+        invert=invert,
+        color_bits=color_bits,
+        coalesce_colors=coalesce_colors,
+        output_format=output_format,
+        use_color=use_color,
+    )
+
+    durations: list[int] = []
+
+    def decoded() -> Iterator[np.ndarray]:
+        durations.append(first_ms)
+        yield np.asarray(first_rgb)
+        for rgb, duration in frames:
+            durations.append(duration)
+            yield np.asarray(rgb)
+
+    jobs = resolve_jobs(jobs)
+    frame_count = 0
+    with _atomic_text_output(destination) as handle:
+        if output_format == "html":
+            head, tail = _html_shell(image_path.stem, invert, _HTML_PLAYER_SCRIPT)
+            handle.write(head + '</pre>\n    <div id="frames" hidden>')
+        else:
+            handle.write("\033[2J")
+
+        def write_frame(rendered: str) -> None:
+            if output_format == "html":
+                handle.write(f'<pre data-ms="{durations[frame_count]}">{rendered}</pre>')
+            else:
+                handle.write("\033[H" + rendered + "\n")
+
+        if jobs > 1:
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(settings, logger.getEffectiveLevel()),
+            ) as pool:
+                for rendered in _ordered_window_map(
+                    pool, _render_frame_in_worker, decoded(), jobs * 2
+                ):
+                    write_frame(rendered)
+                    frame_count += 1
+        else:
+            for frame in decoded():
+                write_frame(_render_frame(frame, settings))
+                frame_count += 1
+
+        if output_format == "html":
+            handle.write("</div>" + tail[len("</pre>"):])
+
+    logger.info(
+        "Animated: %s -> %s (%s frames, grid=%sx%s [%s], ramp=%s%s)",
+        image_path,
+        destination,
+        frame_count,
+        working_gray.width,
+        working_gray.height,
+        width_source,
+        ramp_label(char_ramp),
+        ", color" if use_color else "",
+    )
+
+    return ConversionResult(
+        source=image_path,
+        output=destination,
+        status="converted",
+        message=f"{working_gray.width}x{working_gray.height}, {frame_count} frames",
+    )
+
+
+# =========================
+# LIVE VIDEO STREAMING
+# =========================
+
+
+def probe_video_size(path: Path) -> tuple[int, int]:
+    """Pixel (width, height) of the first video stream via ``ffprobe``."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height",
+        "-of", "csv=p=0:s=x",
+        str(path),
+    ]
+    output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    width, height = output.strip().splitlines()[0].split("x")[:2]
+    return int(width), int(height)
+
+
+class FfmpegFrameSource:
+    """
+    Raw ``rgb24`` frames from ``ffmpeg``, already resampled to ``fps`` and scaled
+    to the character grid, read straight into a caller-owned buffer.
+    """
+
+    def __init__(self, path: Path, grid_size: tuple[int, int], fps: float) -> None:
+        cols, rows = grid_size
+        self.frame_bytes = cols * rows * 3
+        cmd = [
+            "ffmpeg",
+            "-v", "error",
+            "-nostdin",
+            "-i", str(path),
+            "-an",
+            "-vf", f"fps={fps},scale={cols}:{rows}:flags=area",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-",
+        ]
+        self.process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, bufsize=self.frame_bytes * 2
+        )
+
+    def readinto(self, buffer: bytearray) -> bool:
+        """Fill ``buffer`` with the next frame; False at end of stream."""
+        view = memoryview(buffer)
+        filled = 0
+        while filled < self.frame_bytes:
+            count = self.process.stdout.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+        self.process.stdout.close()
+        self.process.wait()
+
+    def __enter__(self) -> FfmpegFrameSource:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StreamMapper:
+    """
+    Frame-to-``AsciiGrid`` mapping on preallocated buffers.
+
+    ``frame`` receives raw RGB bytes; ``map()`` updates ``grid`` in place using
+    Pillow's integer RGB→L weights, so characters match the still-image path.
+    """
+
+    def __init__(self, grid_size: tuple[int, int], char_ramp: str, invert: bool) -> None:
+        cols, rows = grid_size
+        self.invert = invert
+        self.max_index = len(char_ramp) - 1
+        self.frame = bytearray(cols * rows * 3)
+        self.rgb = np.frombuffer(self.frame, dtype=np.uint8).reshape(rows, cols, 3)
+        self._luminance = np.empty((rows, cols), dtype=np.uint32)
+        self._scratch = np.empty((rows, cols), dtype=np.uint32)
+        indices = np.empty((rows, cols), dtype=np.min_scalar_type(self.max_index))
+        colors = np.empty_like(self.rgb) if invert else self.rgb
+        self.grid = AsciiGrid(indices=indices, rgb=colors, char_ramp=char_ramp)
+
+    def map(self) -> AsciiGrid:
+        lum, scratch = self._luminance, self._scratch
+        np.multiply(self.rgb[..., 0], 19595, out=lum, dtype=np.uint32)
+        np.multiply(self.rgb[..., 1], 38470, out=scratch, dtype=np.uint32)
+        lum += scratch
+        np.multiply(self.rgb[..., 2], 7471, out=scratch, dtype=np.uint32)
+        lum += scratch
+        lum += 0x8000
+        lum >>= 16
+        if self.invert:
+            np.subtract(255, lum, out=lum)
+            np.subtract(255, self.rgb, out=self.grid.rgb)
+        lum *= self.max_index
+        lum //= 255
+        np.copyto(self.grid.indices, lum, casting="unsafe")
+        return self.grid
+
+
+@dataclass
+class StreamStats:
+    """Frame counts and per-stage latencies (seconds) for one live stream."""
+
+    shown: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0
+    stages: dict[str, list[float]] = field(
+        default_factory=lambda: {"read": [], "map": [], "render": [], "write": []}
+    )
+
+    @property
+    def achieved_fps(self) -> float:
+        return self.shown / self.elapsed if self.elapsed else 0.0
+
+    def stage_summary(self, stage: str) -> str:
+        samples = sorted(self.stages[stage])
+        if not samples:
+            return f"{stage}=n/a"
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        mean = sum(samples) / len(samples)
+        return f"{stage}={mean * 1000:.2f}/{p95 * 1000:.2f}ms"
+
+
+def stream_video(
+    video_path: str | Path,
+    *,
+    output_width: int | None = None,
+    fps: float = DEFAULT_STREAM_FPS,
+    char_ramp: str | None = None,
+    use_extended_ramp: bool | None = None,
+    aspect_ratio_correction: float = ASPECT_RATIO_CORRECTION,
+    invert: bool = False,
+    coalesce_colors: bool = False,
+    color_bits: int | None = None,
+    out=None,
+) -> StreamStats:
+    """
+    Play a video file as true-color ANSI frames on ``out`` (default: stdout).
+
+    Frames are paced to ``fps`` against the wall clock; a frame that arrives more
+    than one interval late is dropped instead of rendered (unless ffmpeg itself is
+    the bottleneck, in which case the clock is re-anchored). Ctrl+C stops cleanly.
+    """
+    video_path = Path(video_path)
+    if not video_path.is_file():
+        raise FileNotFoundError(f"File not found: {video_path}")
+    if fps <= 0:
+        raise ValueError("fps must be positive.")
+
+    out = out or sys.stdout.buffer
+    grid_size = terminal_grid_size(
+        probe_video_size(video_path),
+        output_width or DEFAULT_STREAM_WIDTH,
+        aspect_ratio_correction,
     )
+    char_ramp = resolve_char_ramp(char_ramp, use_extended_ramp, grid_size[0])
+    mapper = StreamMapper(grid_size, char_ramp, invert)
+    stats = StreamStats()
+    interval = 1.0 / fps
+
+    out.write(b"\033[?25l\033[2J")
+    started = time.perf_counter()
+    try:
+        with FfmpegFrameSource(video_path, grid_size, fps) as source:
+            index = 0
+            while True:
+                t_read = time.perf_counter()
+                if not source.readinto(mapper.frame):
+                    break
+                t_mapped = time.perf_counter()
+                read_time = t_mapped - t_read
+                stats.stages["read"].append(read_time)
+
+                if index == 0:
+                    started = t_mapped
+                due = started + index * interval
+                index += 1
+                late = t_mapped - due
+                if late > interval:
+                    if read_time < interval:
+                        # Frames are queued in the pipe: we are behind, skip this one.
+                        stats.dropped += 1
+                        continue
+                    # The source itself is slower than the target: re-anchor the clock.
+                    started += late
+                    due += late
+
+                grid = mapper.map()
+                if color_bits is not None:
+                    grid = replace(grid, rgb=quantize_colors(grid.rgb, color_bits))
+                t_render = time.perf_counter()
+                stats.stages["map"].append(t_render - t_mapped)
+
+                rows = _iter_ansi_rows(grid, coalesce_colors)
+                payload = ("\033[H" + "\n".join(rows)).encode("utf-8")
+                stats.stages["render"].append(time.perf_counter() - t_render)
+
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                t_write = time.perf_counter()
+                out.write(payload)
+                out.flush()
+                stats.stages["write"].append(time.perf_counter() - t_write)
+                stats.shown += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats.elapsed = time.perf_counter() - started
+        out.write(b"\033[0m\033[?25h\n")
+        out.flush()
+
+    logger.info(
+        "Stream done: %sx%s @ target %.1f fps -> %.1f fps (%s shown, %s dropped); "
+        "mean/p95 %s",
+        grid_size[0],
+        grid_size[1],
+        fps,
+        stats.achieved_fps,
+        stats.shown,
+        stats.dropped,
+        " ".join(stats.stage_summary(stage) for stage in stats.stages),
+    )
+    return stats
 
 
 # =========================
@@ -890,8 +1929,16 @@ def process_single_file(
     output_format: OutputFormat = "txt",
     png_font_size: int = DEFAULT_PNG_FONT_SIZE,
     use_color: bool = False,
+    coalesce_colors: bool = False,
+    color_bits: int | None = None,
+    animate: bool = False,
+    jobs: int = 1,
 ) -> ConversionResult:
-    """Convert one image; optionally re-raise on failure."""
+    """
+    Convert one image; optionally re-raise on failure.
+
+    ``animate`` converts every frame via ``convert_animation`` (``jobs`` workers).
+    """
     path = Path(file)
 
     if not path.is_file():
@@ -903,6 +1950,27 @@ def process_single_file(
         )
 
     try:
+        if animate:
+            return convert_animation(
+                path,
+                output_path=output_path,
+                output_width=output_width,
+                resolution=resolution,
+                use_extended_ramp=use_extended_ramp,
+                aspect_ratio_correction=aspect_ratio_correction,
+                invert=invert,
+                background=background_rgb(background),
+                skip_existing=skip_existing,
+                dry_run=dry_run,
+                native_size=native_size,
+                pixel_grid=pixel_grid,
+                allow_large=allow_large,
+                output_format=output_format,
+                use_color=use_color,
+                coalesce_colors=coalesce_colors,
+                color_bits=color_bits,
+                jobs=jobs,
+            )
         return convert_to_ascii(
             path,
             output_path=output_path,
@@ -921,6 +1989,8 @@ def process_single_file(
             output_format=output_format,
             png_font_size=png_font_size,
             use_color=use_color,
+            coalesce_colors=coalesce_colors,
+            color_bits=color_bits,
         )
     except Exception as exc:
         logger.error("Failed: %s -> %s", path, exc)
@@ -941,6 +2011,76 @@ def iter_image_files(root: Path, source_formats: list[str] | None = None) -> lis
     return sorted(files)
 
 
+def _record_result(
+    stats: BatchStats,
+    file_path: Path,
+    result: ConversionResult,
+    index: int,
+    total: int,
+    cache: ConversionCache | None = None,
+) -> None:
+    """Fold one file outcome into ``stats`` (failures keep their message) and the manifest."""
+    if cache is not None and result.cache_updates:
+        cache.merge(result.cache_updates)
+    if result.status == "converted":
+        stats.converted += 1
+        stats.color_cells += result.color_cells
+        stats.color_spans += result.color_spans
+    elif result.status == "skipped":
+        stats.skipped += 1
+    else:
+        stats.failed += 1
+        stats.failures.append((file_path, result.message))
+        logger.error("Failed (%s/%s): %s -> %s", index, total, file_path, result.message)
+
+
+# Per-worker state for --jobs; set once by _init_worker, reused for every file.
+_worker_options: dict = {}
+
+
+class _RecordCollector(logging.Handler):
+    """Buffer worker log records so the parent can replay them in file order."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _init_worker(options: dict, log_level: int) -> None:
+    """Pool initializer: keep conversion options and silence direct worker output."""
+    _worker_options.clear()
+    _worker_options.update(options)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(log_level)
+
+
+def _convert_in_worker(file_path: Path) -> tuple[ConversionResult, list[logging.LogRecord]]:
+    """Convert one file inside a pool worker; never raises."""
+    collector = _RecordCollector()
+    logger.addHandler(collector)
+    try:
+        result = convert_to_ascii(file_path, **_worker_options)
+    except Exception as exc:
+        result = ConversionResult(source=file_path, status="failed", message=str(exc))
+    finally:
+        logger.removeHandler(collector)
+    return result, collector.records
+
+
+def resolve_jobs(jobs: int) -> int:
+    """``jobs <= 0`` means one worker per CPU core."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
 def process_directory(
     root: str | Path,
     *,
@@ -961,11 +2101,21 @@ def process_directory(
     output_format: OutputFormat = "txt",
     png_font_size: int = DEFAULT_PNG_FONT_SIZE,
     use_color: bool = False,
+    coalesce_colors: bool = False,
+    color_bits: int | None = None,
+    jobs: int = 1,
 ) -> BatchStats:
     """
     Recursively convert images under ``root``.
 
     Failures are logged and recorded in ``BatchStats.failures``; processing continues.
+
+    ``jobs > 1`` spreads files across a process pool (``jobs <= 0``: all cores).
+    Workers are initialized once with the conversion options; their log records
+    are replayed in file order, so logs and stats match a sequential run.
+
+    ``skip_existing`` uses a content-hash manifest (``MANIFEST_NAME``) stored in
+    ``output_dir`` (or ``root`` when writing next to the sources).
     """
     root_path = Path(root).resolve()
     out_dir = Path(output_dir).resolve() if output_dir else None
@@ -983,44 +2133,64 @@ def process_directory(
         logger.warning("No supported images found under %s", root_path)
         return stats
 
-    logger.info("Batch start: %s file(s) under %s", len(files), root_path)
+    jobs = min(resolve_jobs(jobs), len(files))
+    cache = ConversionCache.load(out_dir or root_path) if skip_existing else None
+    options = dict(
+        output_width=output_width,
+        resolution=resolution,
+        use_extended_ramp=use_extended_ramp,
+        aspect_ratio_correction=aspect_ratio_correction,
+        invert=invert,
+        background=background_rgb(background),
+        gif_frame=gif_frame,
+        skip_existing=skip_existing,
+        dry_run=dry_run,
+        root=root_path,
+        output_dir=out_dir,
+        native_size=native_size,
+        pixel_grid=pixel_grid,
+        allow_large=allow_large,
+        output_format=output_format,
+        png_font_size=png_font_size,
+        use_color=use_color,
+        coalesce_colors=coalesce_colors,
+        color_bits=color_bits,
+        cache=cache,
+    )
 
-    for index, file_path in enumerate(files, start=1):
-        logger.debug("Processing %s/%s: %s", index, len(files), file_path)
-        try:
-            result = convert_to_ascii(
-                file_path,
-                output_width=output_width,
-                resolution=resolution,
-                use_extended_ramp=use_extended_ramp,
-                aspect_ratio_correction=aspect_ratio_correction,
-                invert=invert,
-                background=background_rgb(background),
-                gif_frame=gif_frame,
-                skip_existing=skip_existing,
-                dry_run=dry_run,
-                root=root_path,
-                output_dir=out_dir,
-                native_size=native_size,
-                pixel_grid=pixel_grid,
-                allow_large=allow_large,
-                output_format=output_format,
-                png_font_size=png_font_size,
-                use_color=use_color,
-            )
-        except Exception as exc:
-            stats.failed += 1
-            stats.failures.append((file_path, str(exc)))
-            logger.error("Failed (%s/%s): %s -> %s", index, len(files), file_path, exc)
-            continue
-
-        if result.status == "converted":
-            stats.converted += 1
-        elif result.status == "skipped":
-            stats.skipped += 1
-        else:
-            stats.failed += 1
-            stats.failures.append((file_path, result.message))
+    logger.info(
+        "Batch start: %s file(s) under %s%s",
+        len(files),
+        root_path,
+        f" ({jobs} workers)" if jobs > 1 else "",
+    )
+
+    if jobs > 1:
+        chunksize = max(1, min(32, len(files) // (jobs * 4)))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(options, logger.getEffectiveLevel()),
+        ) as pool:
+            outcomes = pool.map(_convert_in_worker, files, chunksize=chunksize)
+            for index, (file_path, (result, records)) in enumerate(
+                zip(files, outcomes), start=1
+            ):
+                logger.debug("Processed %s/%s: %s", index, len(files), file_path)
+                for record in records:
+                    logger.handle(record)
+                _record_result(stats, file_path, result, index, len(files), cache)
+    else:
+        for index, file_path in enumerate(files, start=1):
+            logger.debug("Processing %s/%s: %s", index, len(files), file_path)
+            try:
+                result = convert_to_ascii(file_path, **options)
+            except Exception as exc:
+                result = ConversionResult(source=file_path, status="failed", message=str(exc))
+            _record_result(stats, file_path, result, index, len(files), cache)
+
+    if cache is not None and not dry_run:
+        cache.save()
 
     logger.info(
         "Batch done: converted=%s skipped=%s failed=%s total=%s",
@@ -1029,9 +2199,103 @@ def process_directory(
         stats.failed,
         stats.total,
     )
+    if stats.color_spans:
+        logger.info(
+            "Color spans: %s cells -> %s spans (%.1fx)",
+            stats.color_cells,
+            stats.color_spans,
+            stats.span_compression,
+        )
     return stats
 
 
+# =========================
+# BENCHMARK
+# =========================
+
+
+@dataclass
+class MappingBenchmark:
+    """Timings for the per-pixel reference mapping vs the NumPy grid mapping."""
+
+    grid_width: int
+    grid_height: int
+    reference_seconds: float
+    array_seconds: float
+    identical: bool
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.array_seconds if self.array_seconds else float("inf")
+
+
+def _best_of(repeat: int, func) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def benchmark_mapping(
+    image_path: str | Path,
+    *,
+    output_width: int | None = None,
+    resolution: int = DEFAULT_RESOLUTION,
+    use_extended_ramp: bool | None = None,
+    aspect_ratio_correction: float = ASPECT_RATIO_CORRECTION,
+    invert: bool = False,
+    background: BackgroundName = "white",
+    gif_frame: int = 0,
+    native_size: bool = False,
+    pixel_grid: bool = False,
+    allow_large: bool = False,
+    repeat: int = 3,
+) -> MappingBenchmark:
+    """
+    Time ``map_pixels_to_cells`` against ``map_pixels_to_grid`` on one image.
+
+    Both paths map the same resized grid; ``identical`` is True when characters
+    and colors match cell for cell.
+    """
+    gray, rgb = load_image_pair(
+        Path(image_path),
+        background=background_rgb(background),
+        gif_frame=gif_frame,
+    )
+    working_gray, working_rgb, _ = prepare_working_pair(
+        gray,
+        rgb,
+        output_width=output_width,
+        resolution=max(MIN_RESOLUTION, min(MAX_RESOLUTION, resolution)),
+        aspect_ratio_correction=aspect_ratio_correction,
+        native_size=native_size,
+        pixel_grid=pixel_grid,
+        allow_large=allow_large,
+    )
+    char_ramp = resolve_char_ramp(None, use_extended_ramp, working_gray.width)
+
+    reference_seconds, cells = _best_of(
+        repeat, lambda: map_pixels_to_cells(working_gray, working_rgb, char_ramp, invert)
+    )
+    array_seconds, grid = _best_of(
+        repeat, lambda: map_pixels_to_grid(working_gray, working_rgb, char_ramp, invert)
+    )
+    identical = cells_to_plain_lines(cells) == grid.lines() and [
+        [list(cell.rgb) for cell in row] for row in cells
+    ] == grid.rgb.tolist()
+
+    return MappingBenchmark(
+        grid_width=working_gray.width,
+        grid_height=working_gray.height,
+        reference_seconds=reference_seconds,
+        array_seconds=array_seconds,
+        identical=identical,
+    )
+
+
 # =========================
 # CLI
 # =========================
@@ -1054,6 +2318,7 @@ def build_arg_parser() -> argparse.ArgumentParser:
     target = parser.add_mutually_exclusive_group(required=True)
     target.add_argument("--file", "-f", help="Single image file to convert")
     target.add_argument("--dir", "-d", help="Directory to scan recursively")
+    target.add_argument("--video", help="Video file to play as live ANSI on stdout (needs ffmpeg)")
 
     parser.add_argument(
         "--output-dir",
@@ -1097,6 +2362,36 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Tint each character with source pixel color (html/png; adds .ansi.txt with --format all)",
     )
+    parser.add_argument(
+        "--coalesce",
+        action="store_true",
+        help="Colored ansi/html: one escape/span per run of equal color instead of per character",
+    )
+    parser.add_argument(
+        "--color-bits",
+        type=int,
+        choices=range(MIN_COLOR_BITS, MAX_COLOR_BITS + 1),
+        metavar=f"{{{MIN_COLOR_BITS}-{MAX_COLOR_BITS}}}",
+        help="Quantize colors to N bits per channel (longer runs with --coalesce)",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=DEFAULT_STREAM_FPS,
+        help=f"Target frame rate for --video (default: {DEFAULT_STREAM_FPS:g})",
+    )
+    parser.add_argument(
+        "--animate",
+        action="store_true",
+        help="Convert every frame of an animated --file (GIF/WEBP) to an html player or ansi sequence",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for --dir batches or --animate frames (0 = one per CPU core, default: 1)",
+    )
     parser.add_argument(
         "--png-font-size",
         type=int,
@@ -1123,13 +2418,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--skip-existing",
         action="store_true",
-        help="Skip when output .txt exists and is newer than source",
+        help="Skip up-to-date outputs (batch: by content hash + flags via manifest; single file: by mtime)",
     )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="List conversions without writing files",
     )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time per-pixel vs NumPy mapping on --file (writes nothing)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Debug logging")
     parser.add_argument("--quiet", "-q", action="store_true", help="Errors only")
     return parser
@@ -1162,15 +2462,67 @@ def main(argv: list[str] | None = None) -> int:
         output_format=args.format,
         png_font_size=args.png_font_size,
         use_color=args.color or args.format == "ansi",
+        coalesce_colors=args.coalesce,
+        color_bits=args.color_bits,
     )
 
+    if args.benchmark:
+        if not args.file:
+            parser.error("--benchmark requires --file.")
+        bench = benchmark_mapping(
+            args.file,
+            output_width=args.width,
+            resolution=args.resolution,
+            use_extended_ramp=use_extended_ramp,
+            invert=args.invert,
+            background=args.background,
+            native_size=args.native_size,
+            pixel_grid=args.pixel_grid,
+            allow_large=args.allow_large,
+        )
+        logger.info(
+            "Benchmark %sx%s: per-pixel=%.3fs numpy=%.3fs speedup=%.1fx identical=%s",
+            bench.grid_width,
+            bench.grid_height,
+            bench.reference_seconds,
+            bench.array_seconds,
+            bench.speedup,
+            bench.identical,
+        )
+        return 0 if bench.identical else 1
+
+    if args.video:
+        stream_video(
+            args.video,
+            output_width=args.width,
+            fps=args.fps,
+            use_extended_ramp=use_extended_ramp,
+            invert=args.invert,
+            coalesce_colors=args.coalesce,
+            color_bits=args.color_bits,
+        )
+        return 0
+
+    if args.animate:
+        if not args.file:
+            parser.error("--animate requires --file.")
+        if args.format not in ANIMATION_FORMATS:
+            parser.error(f"--animate supports --format {' or '.join(ANIMATION_FORMATS)}.")
+
     if args.file:
-        result = process_single_file(args.file, raise_on_error=True, **common)
+        result = process_single_file(
+            args.file,
+            raise_on_error=True,
+            animate=args.animate,
+            jobs=args.jobs,
+            **common,
+        )
         return 0 if result.status != "failed" else 1
 
     stats = process_directory(
         args.dir,
         output_dir=args.output_dir,
+        jobs=args.jobs,
         **common,
     )
     return 0 if stats.failed == 0 else 1
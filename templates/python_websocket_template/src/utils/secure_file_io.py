@@ -27,29 +27,77 @@ This module addresses all four:
         flushed + fsynced, then ``os.replace``-d over the target (atomic on
         POSIX and Windows). Readers never see a partial file.
     * A configurable max-read-size guard (``MAX_READ_BYTES``).
-    * A per-path ``threading.Lock`` so reads/writes of the same file are
-        serialized. Read-modify-write helpers hold the lock for the whole
-        transaction.
+    * A per-path reader-writer lock (``RWLock``): reads of the same file run
+        concurrently, writes are exclusive. Read-modify-write helpers hold
+        the write side for the whole transaction. The lock table is weak, so
+        a path's lock disappears once no thread is using it.
+    * Optionally (``set_lock_backend(root, "fcntl")``), an advisory ``flock``
+        on a ``<file>.lock`` sidecar as well, so several processes (e.g.
+        uvicorn ``workers > 1``) sharing files under *root* cannot interleave
+        read-modify-write cycles. Readers take it shared, writers exclusive.
+
+Record helpers keep each parsed collection in memory (keyed by resolved path,
+invalidated when the file's mtime/size/inode change) with hash indexes on the
+id field and on any fields declared via ``declare_index``, so lookups do not
+re-read or re-scan the file. Callers always get copies, never cached objects.
+
+Collections can opt into group commit (``set_group_commit``): concurrent
+record writers apply their change in memory, and whichever writer finds no
+flush in flight persists everything pending with one atomic write, so one
+fsync covers a whole burst. Each caller still returns only once its own change
+is durable.
+
+Collections can opt into journal mode (``set_journal_mode``): mutations are
+appended to ``<file>.journal`` (one JSON line, one fsync each) instead of
+rewriting the whole file, and the log is folded back into the JSON snapshot by
+an atomic replace every ``compact_every`` operations. The journal header
+records the sha256 of the snapshot it extends, so a log left behind by a
+compaction that crashed before deleting it is recognised and discarded.
+
+On-disk format is pluggable per collection or root (``set_codec``): pretty
+JSON (default), compact JSON, orjson or MessagePack (the last two only if
+installed). Readers auto-detect JSON vs MessagePack, and parse JSON with
+orjson when it is available.
 
 Layers
+    Config     : set_allowed_root / set_lock_backend / set_codec
     Primitives : read_bytes / write_bytes / read_text / write_text
     Formats    : read_json / write_json, read_csv / write_csv,
                     read_yaml / write_yaml   (YAML needs PyYAML installed)
+    Streaming  : iter_csv / iter_jsonl / read_bytes_mmap
+                    (constant memory; no MAX_READ_BYTES cap unless asked)
     Records    : read_all / save_all / find_by_id / find_by_field /
                     create_record / update_record / delete_record
                     (treat a JSON file as a list[dict] "collection")
+    Cache      : declare_index / clear_collection_cache
+    Journal    : set_journal_mode / compact_collection
+    Durability : set_group_commit   (batch concurrent writers' fsyncs)
+    Batches    : transaction / create_many / update_many / delete_many
+                    (many mutations, one lock hold, one atomic write)
+    Async      : aread_json / acreate_record / ... - every helper above
+                    prefixed with "a", awaitable (see "Asyncio API" below)
 """
 
 #Native imports
+import asyncio
+import bisect
 import csv
+import functools
+import hashlib
 import io
 import json
+import mmap
 import os
 import stat
 import tempfile
 import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, Optional, Union
 
 #Optional dependency - only required by the read_yaml / write_yaml helpers
 try:
@@ -58,6 +106,24 @@ try:
 except ImportError:
     _HAS_YAML = False
 
+try:
+    import orjson  # optional accelerated JSON codec / parser
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import msgpack  # optional binary codec
+    _HAS_MSGPACK = True
+except ImportError:
+    _HAS_MSGPACK = False
+
+try:
+    import fcntl  # POSIX only; enables the "fcntl" lock backend
+    _HAS_FCNTL = True
+except ImportError:
+    _HAS_FCNTL = False
+
 PathLike = Union[str, os.PathLike]
 
 
@@ -76,8 +142,29 @@ _allowed_root: Optional[Path] = None
 _RAISE = object()
 
 #Per-path locks - created on first access. Keyed by the resolved path string.
-_locks: dict[str, threading.Lock] = {}
-_locks_meta_lock = threading.Lock()  # guards the _locks dict itself
+#Weak values: an entry lives only while some thread holds or waits on it.
+_locks: "weakref.WeakValueDictionary[str, RWLock]" = weakref.WeakValueDictionary()
+_locks_meta_lock = threading.Lock()  # guards _locks / _lock_backends
+
+#Roots whose files also take an inter-process flock (see set_lock_backend).
+LOCK_BACKENDS: tuple = ("thread", "fcntl")
+LOCK_SUFFIX: str = ".lock"
+_lock_backends: dict[Path, str] = {}
+
+#(generation read at acquire, generation now) under the current thread's flock
+#(see _locked); the two differ only for exclusive holders.
+_held = threading.local()
+
+#How many parsed collections the record helpers keep in memory (LRU).
+MAX_CACHED_COLLECTIONS: int = 64
+
+#Journal mode: sidecar suffix and default ops between compactions.
+JOURNAL_SUFFIX: str = ".journal"
+JOURNAL_COMPACT_EVERY: int = 1000
+
+#Group commit: longest a flush leader waits for writers already queued on the
+#lock to apply their changes, so they ride along in the same flush.
+GROUP_COMMIT_MAX_WAIT: float = 0.01
 
 
 # --- EXCEPTIONS ---
@@ -93,6 +180,64 @@ class FileTooLargeError(FileStoreError):
     """Raised when a file exceeds the allowed read size."""
 
 
+# --- LOCKS ---
+class RWLock:
+    """Reader-writer lock: any number of readers, or one writer.
+
+    Writer-preferring - once a writer is waiting, new readers queue behind it,
+    so a steady stream of reads cannot starve writes. Not re-entrant.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
 # --- CONFIG HELPERS ---
 def set_allowed_root(root: Optional[PathLike]) -> None:
     """Confine all subsequent file access to *root* (or disable with ``None``).
@@ -110,6 +255,32 @@ def get_allowed_root() -> Optional[Path]:
     return _allowed_root
 
 
+def set_lock_backend(root: PathLike, backend: str = "fcntl") -> None:
+    """Choose how files under *root* are locked.
+
+    Parameters:
+        root:    Directory the choice applies to (including subdirectories).
+        backend: ``"thread"`` (default for every path) - in-process locks
+            only; ``"fcntl"`` - additionally take an advisory ``flock`` on a
+            ``<file>.lock`` sidecar, shared for reads and exclusive for
+            writes, so multiple processes can safely share the files.
+
+    Raises:
+        ValueError: unknown *backend*.
+        FileStoreError: ``"fcntl"`` requested on a platform without fcntl.
+    """
+    if backend not in LOCK_BACKENDS:
+        raise ValueError(f"Unknown lock backend '{backend}', expected one of {LOCK_BACKENDS}.")
+    if backend == "fcntl" and not _HAS_FCNTL:
+        raise FileStoreError("The 'fcntl' lock backend is only available on POSIX systems.")
+    resolved = Path(root).resolve()
+    with _locks_meta_lock:
+        if backend == "thread":
+            _lock_backends.pop(resolved, None)
+        else:
+            _lock_backends[resolved] = backend
+
+
 # --- INTERNAL HELPERS ---
 def _resolve_path(path: PathLike) -> Path:
     """Resolve *path* to an absolute path and enforce root confinement.
@@ -125,13 +296,61 @@ def _resolve_path(path: PathLike) -> Path:
     return resolved
 
 
-def _get_lock(path: Path) -> threading.Lock:
-    """Return (and lazily create) the Lock guarding *path*."""
+def _get_lock(path: Path) -> RWLock:
+    """Return (and lazily create) the RWLock guarding *path*.
+
+    Callers must keep the returned object referenced for as long as they use
+    it - that reference is what keeps it in the weak ``_locks`` table.
+    """
     key = str(path)
     with _locks_meta_lock:
-        if key not in _locks:
-            _locks[key] = threading.Lock()
-        return _locks[key]
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = RWLock()
+        return lock
+
+
+def _uses_fcntl(path: Path) -> bool:
+    if not _lock_backends:
+        return False
+    with _locks_meta_lock:
+        return any(path.is_relative_to(root) for root in _lock_backends)
+
+
+@contextmanager
+def _locked(path: Path, *, shared: bool = False) -> Iterator[None]:
+    """Hold *path*'s lock for the block.
+
+    Always takes the in-process RWLock (read side if *shared*). Under the
+    "fcntl" backend it also takes ``flock`` on the ``<path>.lock`` sidecar
+    (``LOCK_SH`` if *shared*). The sidecar holds a generation counter that
+    every exclusive holder bumps; it becomes part of the collection cache
+    signature, because mtime/size/inode alone can miss two quick same-size
+    writes from another process. A cached entry is checked against the
+    generation found at acquire and then stamped with the bumped one, so a
+    process's own writes do not invalidate its cache.
+    """
+    lock = _get_lock(path)
+    with (lock.read() if shared else lock.write()):
+        if not _uses_fcntl(path):
+            yield
+            return
+        if shared and not path.parent.is_dir():
+            yield  # nothing to read, nothing to protect
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path.with_name(path.name + LOCK_SUFFIX), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            seen = generation = int(os.pread(fd, 32, 0) or b"0")
+            if not shared:
+                generation += 1
+                os.pwrite(fd, str(generation).encode("ascii"), 0)
+            _held.generation = (seen, generation)
+            yield
+        finally:
+            _held.generation = None
+            os.close(fd)  # releases the flock
 
 
 def _read_bytes_unlocked(path: Path, max_bytes: Optional[int]) -> bytes:
@@ -207,15 +426,19 @@ def read_bytes(path: PathLike, *, max_bytes: Optional[int] = MAX_READ_BYTES) ->
         FileNotFoundError, PathSecurityError, FileTooLargeError.
     """
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
+    with _locked(resolved, shared=True):
         return _read_bytes_unlocked(resolved, max_bytes)
 
 
 def write_bytes(path: PathLike, data: bytes) -> None:
     """Atomically write raw *data* (bytes) to *path*, creating parents."""
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
+    with _locked(resolved):
         _atomic_write_unlocked(resolved, data)
+        #A full replacement supersedes any pending journal ops and any
+        #cached (or group-commit pending) collection state.
+        _discard_journal(resolved)
+        _forget_collection(resolved)
 
 
 def read_text(
@@ -233,6 +456,101 @@ def write_text(path: PathLike, text: str, *, encoding: str = "utf-8") -> None:
     write_bytes(path, text.encode(encoding))
 
 
+# ---------------------------------------------------------------------------
+# Codecs - how JSON-shaped data is stored on disk
+# ---------------------------------------------------------------------------
+def _encode_json(data: Any) -> bytes:
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _encode_json_compact(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_orjson(data: Any) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _encode_msgpack(data: Any) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+#name -> (encoder, available?)
+CODECS: dict = {
+    "json": (_encode_json, True),
+    "json-compact": (_encode_json_compact, True),
+    "orjson": (_encode_orjson, _HAS_ORJSON),
+    "msgpack": (_encode_msgpack, _HAS_MSGPACK),
+}
+DEFAULT_CODEC: str = "json"
+
+_codecs: dict[Path, str] = {}  # path or root -> codec name
+_codecs_lock = threading.Lock()
+
+#First byte of a MessagePack map or array (fixmap, fixarray, array16/32,
+#map16/32); no valid JSON document starts with one. Anything else goes to the
+#JSON parser, so malformed text still raises JSONDecodeError.
+_MSGPACK_FIRST_BYTES = frozenset(range(0x80, 0xA0)) | frozenset(range(0xDC, 0xE0))
+
+
+def set_codec(path: PathLike, codec: Optional[str]) -> None:
+    """Store the file or every file under the directory *path* with *codec*.
+
+    Parameters:
+        path:  A collection file or a root directory (the most specific
+            setting wins).
+        codec: ``"json"`` (indented, the default), ``"json-compact"``,
+            ``"orjson"`` or ``"msgpack"``; ``None`` removes the setting.
+
+    Applies to record helpers and ``write_json`` / ``save_all`` (whose
+    formatting arguments are then ignored). Existing files are converted on
+    their next write; reads auto-detect either way.
+
+    Raises:
+        ValueError: unknown codec. FileStoreError: codec's library missing.
+    """
+    resolved = Path(path).resolve()
+    if codec is not None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}', expected one of {tuple(CODECS)}.")
+        if not CODECS[codec][1]:
+            raise FileStoreError(f"Codec '{codec}' requires the '{codec}' package: pip install {codec}")
+    with _codecs_lock:
+        if codec is None:
+            _codecs.pop(resolved, None)
+        else:
+            _codecs[resolved] = codec
+
+
+def _configured_codec(path: Path) -> Optional[str]:
+    """Codec set for *path* or its closest configured parent, else ``None``."""
+    if not _codecs:
+        return None
+    with _codecs_lock:
+        matches = [root for root in _codecs if path.is_relative_to(root)]
+        return _codecs[max(matches, key=lambda root: len(root.parts))] if matches else None
+
+
+def _encode(path: Path, data: Any) -> bytes:
+    return CODECS[_configured_codec(path) or DEFAULT_CODEC][0](data)
+
+
+def _decode(raw: bytes, encoding: str = "utf-8") -> Any:
+    """Parse *raw* as JSON or MessagePack (auto-detected)."""
+    if raw[:1] and raw[0] in _MSGPACK_FIRST_BYTES:
+        if not _HAS_MSGPACK:
+            raise FileStoreError(
+                "Content is not JSON (looks like MessagePack); pip install msgpack to read it."
+            )
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    if _HAS_ORJSON and encoding.replace("-", "").lower() == "utf8":
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or >64-bit ints: let the stdlib parse (or report) it
+    return json.loads(raw.decode(encoding))
+
+
 # ---------------------------------------------------------------------------
 # JSON
 # ---------------------------------------------------------------------------
@@ -243,7 +561,7 @@ def read_json(
     encoding: str = "utf-8",
     max_bytes: Optional[int] = MAX_READ_BYTES,
 ) -> Any:
-    """Read and parse a JSON file.
+    """Read and parse a JSON file (or a MessagePack one, see ``set_codec``).
 
     Parameters:
         path:      JSON file to read.
@@ -258,13 +576,13 @@ def read_json(
         file is missing and no *default* was supplied.
     """
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
+    with _locked(resolved, shared=True):
         if not resolved.is_file():
             if default is _RAISE:
                 raise FileNotFoundError(f"No such file: '{resolved}'")
             return default
         raw = _read_bytes_unlocked(resolved, max_bytes)
-    return json.loads(raw.decode(encoding))
+    return _decode(raw, encoding)
 
 
 def write_json(
@@ -276,7 +594,15 @@ def write_json(
     sort_keys: bool = False,
     encoding: str = "utf-8",
 ) -> None:
-    """Serialize *data* to JSON and atomically write it to *path*."""
+    """Serialize *data* to JSON and atomically write it to *path*.
+
+    If a codec was configured for *path* (``set_codec``) it is used instead
+    and the formatting arguments are ignored.
+    """
+    resolved = _resolve_path(path)
+    if _configured_codec(resolved) is not None:
+        write_bytes(resolved, _encode(resolved, data))
+        return
     text = json.dumps(
         data, indent=indent, ensure_ascii=ensure_ascii, sort_keys=sort_keys
     )
@@ -357,7 +683,7 @@ def read_yaml(
     """
     _require_yaml()
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
+    with _locked(resolved, shared=True):
         if not resolved.is_file():
             if default is _RAISE:
                 raise FileNotFoundError(f"No such file: '{resolved}'")
@@ -382,17 +708,121 @@ def write_yaml(
     write_text(path, text, encoding=encoding)
 
 
+# ---------------------------------------------------------------------------
+# Streaming - large files with constant memory
+# ---------------------------------------------------------------------------
+# The lock is held only while the file is opened: writers replace files
+# atomically, so an open handle keeps reading the same (old) inode and always
+# sees one consistent version, even if the file is replaced mid-iteration.
+# Size guards default to off here, since memory no longer grows with the file.
+def _open_for_stream(path: PathLike, max_bytes: Optional[int]) -> BinaryIO:
+    """Resolve *path* (root-confined), open it for binary reading and enforce
+    *max_bytes* against the opened file.
+    """
+    resolved = _resolve_path(path)
+    with _locked(resolved, shared=True):
+        if not resolved.is_file():
+            raise FileNotFoundError(f"No such file: '{resolved}'")
+        fh = resolved.open("rb")
+    size = os.fstat(fh.fileno()).st_size
+    if max_bytes is not None and size > max_bytes:
+        fh.close()
+        raise FileTooLargeError(
+            f"File '{resolved}' is {size} bytes, exceeds limit of {max_bytes}."
+        )
+    return fh
+
+
+def iter_csv(
+    path: PathLike,
+    *,
+    encoding: str = "utf-8",
+    max_bytes: Optional[int] = None,
+    **reader_kwargs: Any,
+) -> Iterator[dict]:
+    """Yield the rows of a CSV file one dict at a time (streaming ``read_csv``).
+
+    The file is opened (and checked) on the first ``next()`` and closed when
+    iteration ends or the generator is closed, so an unstarted generator holds
+    nothing. Per-field size is still capped by ``csv.field_size_limit()``.
+    """
+    fh = _open_for_stream(path, max_bytes)
+    with io.TextIOWrapper(fh, encoding=encoding, newline="") as text:
+        for row in csv.DictReader(text, **reader_kwargs):
+            yield dict(row)
+
+
+def iter_jsonl(
+    path: PathLike,
+    *,
+    max_bytes: Optional[int] = None,
+    max_line_bytes: Optional[int] = MAX_READ_BYTES,
+) -> Iterator[Any]:
+    """Yield one parsed value per line of a JSON Lines file (blank lines skipped).
+
+    Parameters:
+        max_bytes:      Reject files larger than this (``None``: no limit).
+        max_line_bytes: Reject any single line larger than this.
+
+    Like ``iter_csv``, nothing is opened until the first ``next()``.
+
+    Raises:
+        FileNotFoundError, PathSecurityError, FileTooLargeError (on the first
+        ``next()`` for the file, later for an oversized line).
+    """
+    limit = -1 if max_line_bytes is None else max_line_bytes + 1
+    with _open_for_stream(path, max_bytes) as fh:
+        for number, line in enumerate(iter(lambda: fh.readline(limit), b""), 1):
+            if max_line_bytes is not None and len(line.rstrip(b"\r\n")) > max_line_bytes:
+                raise FileTooLargeError(
+                    f"Line {number} of '{fh.name}' exceeds {max_line_bytes} bytes."
+                )
+            if line.strip():
+                yield json.loads(line)
+
+
+@contextmanager
+def read_bytes_mmap(
+    path: PathLike, *, max_bytes: Optional[int] = None
+) -> Iterator[memoryview]:
+    """Map *path* read-only and yield a zero-copy ``memoryview`` of it.
+
+    Pages are loaded by the OS on access, so multi-GB files cost no heap.
+    Release any slices of the view before the block ends.
+
+    Example::
+
+        with read_bytes_mmap("export.bin") as view:
+            header = bytes(view[:16])
+    """
+    with _open_for_stream(path, max_bytes) as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield memoryview(b"")  # mmap cannot map an empty file
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
 # ---------------------------------------------------------------------------
 # Record helpers - treat a JSON file as a list[dict] "collection"
 # ---------------------------------------------------------------------------
 # These hold the per-file lock for the whole read-modify-write transaction, so
 # concurrent create/update/delete calls on the same file cannot interleave.
-def _load_records(path: Path, max_bytes: Optional[int]) -> list:
-    """Load a JSON list from *path* (empty list if missing). Lock must be held."""
-    if not path.is_file():
+#
+# Parsed collections are cached in ``_collections`` (LRU, keyed by resolved
+# path). Each entry remembers the file signature (mtime_ns, size, inode) it was
+# loaded from; any change on disk - including writes by another process or by
+# write_json/save_all - makes the next access reload. Hash indexes map a field
+# value to the ordered positions of matching records.
+def _parse_records(path: Path, raw: Optional[bytes]) -> list:
+    """Parse snapshot bytes of *path* as a JSON list (``None`` -> empty list)."""
+    if raw is None:
         return []
-    raw = _read_bytes_unlocked(path, max_bytes)
-    data = json.loads(raw.decode("utf-8"))
+    data = _decode(raw)
     if not isinstance(data, list):
         raise FileStoreError(
             f"Record helpers expect a JSON array at '{path}', got {type(data).__name__}."
@@ -400,11 +830,544 @@ def _load_records(path: Path, max_bytes: Optional[int]) -> list:
     return data
 
 
+def _clone(value: Any) -> Any:
+    """Copy a JSON-shaped value (dict / list / scalars); cheaper than deepcopy."""
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size, inode) of *path*, or ``None`` if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _Collection:
+    """Cached records of one JSON collection plus its hash indexes."""
+
+    __slots__ = ("signature", "records", "indexes", "digest", "journal_ops")
+
+    def __init__(self, signature: Optional[tuple], records: list) -> None:
+        #(snapshot signature, journal signature) this state was loaded from.
+        self.signature = signature
+        self.records = records
+        #sha256 of the snapshot bytes (computed lazily; journal header) and
+        #number of ops currently in the journal.
+        self.digest: Optional[str] = None
+        self.journal_ops = 0
+        #field -> {value: [positions]}; ``None`` marks a field whose values
+        #are not all hashable (lookups on it fall back to a scan).
+        self.indexes: dict[str, Optional[dict]] = {}
+
+    def index(self, field: str) -> Optional[dict]:
+        if field not in self.indexes:
+            buckets: Optional[dict] = {}
+            try:
+                for position, record in enumerate(self.records):
+                    buckets.setdefault(record.get(field), []).append(position)
+            except TypeError:
+                buckets = None
+            self.indexes[field] = buckets
+        return self.indexes[field]
+
+    def positions(self, field: str, value: Any) -> list:
+        """Ordered positions of records with ``record[field] == value``."""
+        buckets = self.index(field)
+        if buckets is not None:
+            try:
+                return buckets.get(value, [])
+            except TypeError:
+                pass
+        return [i for i, record in enumerate(self.records) if record.get(field) == value]
+
+    def append(self, record: dict) -> None:
+        position = len(self.records)
+        self.records.append(record)
+        for field, buckets in self.indexes.items():
+            if buckets is None:
+                continue
+            try:
+                buckets.setdefault(record.get(field), []).append(position)
+            except TypeError:
+                self.indexes[field] = None
+
+    def update(self, position: int, updates: dict) -> dict:
+        record = self.records[position]
+        before = {field: record.get(field) for field in self.indexes if field in updates}
+        record.update(updates)
+        for field, old in before.items():
+            buckets = self.indexes[field]
+            new = record.get(field)
+            if buckets is None or old == new:
+                continue
+            try:
+                buckets[old].remove(position)
+                if not buckets[old]:
+                    del buckets[old]
+                bisect.insort(buckets.setdefault(new, []), position)
+            except TypeError:
+                self.indexes[field] = None
+        return record
+
+    def remove(self, position: int) -> dict:
+        record = self.records.pop(position)
+        #Positions after *position* shift; rebuild indexes lazily on next use.
+        self.indexes.clear()
+        return record
+
+    def remove_many(self, positions: Iterable[int]) -> list:
+        """Remove several positions in one pass (returned in file order)."""
+        doomed = set(positions)
+        removed, kept = [], []
+        for position, record in enumerate(self.records):
+            (removed if position in doomed else kept).append(record)
+        self.records = kept
+        self.indexes.clear()
+        return removed
+
+
+_collections: "OrderedDict[str, _Collection]" = OrderedDict()
+_declared_indexes: dict[str, set] = {}
+_journal_modes: dict[str, int] = {}  # resolved path -> compact_every
+_group_commits: dict[str, "_GroupCommit"] = {}  # resolved path -> state
+_collections_lock = threading.Lock()  # guards the four dicts above
+
+
+class _GroupCommit:
+    """Sequence numbers of one collection's group-committed writes.
+
+    ``pending`` is the last mutation applied in memory. ``outcomes`` records
+    how writes were settled as ascending ``(last_seq, error)`` runs: every
+    sequence after the previous run up to ``last_seq`` was flushed (``error``
+    is ``None``) or lost. One waiter at a time is the ``flushing`` leader.
+    ``arriving`` counts writers between requesting the path lock and applying
+    their change.
+    """
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition()
+        self.arriving = 0
+        self.pending = 0
+        self.outcomes: list = []
+        self.flushing = False
+
+    @property
+    def settled(self) -> int:
+        return self.outcomes[-1][0] if self.outcomes else 0
+
+    @property
+    def dirty(self) -> bool:
+        return self.pending > self.settled
+
+    def settle(self, error: Optional[BaseException] = None) -> None:
+        """Mark every unsettled write durable (or lost, with *error*)."""
+        with self.cond:
+            if self.dirty:
+                if error is None and self.outcomes and self.outcomes[-1][1] is None:
+                    self.outcomes[-1] = (self.pending, None)  # extend the durable run
+                else:
+                    self.outcomes.append((self.pending, error))
+            self.cond.notify_all()
+
+    def outcome(self, seq: int) -> tuple:
+        """``(settled, error)`` for write *seq*. Caller holds ``cond``."""
+        if seq > self.settled:
+            return False, None
+        return True, next(error for last, error in self.outcomes if last >= seq)
+
+
+@contextmanager
+def _group_arrival(path: Path) -> Iterator[None]:
+    """Count a record writer as arriving for *path*'s group commit (if any)
+    until it has applied its change; wrap the lock acquisition with it.
+    """
+    with _collections_lock:
+        group = _group_commits.get(str(path))
+    if group is None:
+        yield
+        return
+    with group.cond:
+        group.arriving += 1
+    try:
+        yield
+    finally:
+        with group.cond:
+            group.arriving -= 1
+            group.cond.notify_all()
+
+
+def _is_dirty(key: str) -> bool:
+    """True if *key*'s cached entry holds group writes not yet on disk."""
+    group = _group_commits.get(key)
+    return group is not None and group.dirty
+
+
+def _journal_path(path: Path) -> Path:
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def _discard_journal(path: Path) -> None:
+    """Remove *path*'s journal, if any. Lock must be held."""
+    try:
+        _journal_path(path).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _lock_generation(*, at_acquire: bool = False) -> Optional[int]:
+    """The held fcntl lock's generation - current, or as found when it was
+    taken (*at_acquire*) - or ``None`` without one.
+    """
+    held = getattr(_held, "generation", None)
+    return None if held is None else held[0 if at_acquire else 1]
+
+
+def _collection_signature(path: Path, *, at_acquire: bool = False) -> tuple:
+    return (
+        _file_signature(path),
+        _file_signature(_journal_path(path)),
+        _lock_generation(at_acquire=at_acquire),
+    )
+
+
+def _snapshot_digest(raw: Optional[bytes]) -> str:
+    return hashlib.sha256(raw).hexdigest() if raw is not None else ""
+
+
+def _apply_op(entry: _Collection, op: dict) -> None:
+    """Apply one journal operation to *entry* (used for replay)."""
+    kind = op.get("op")
+    if kind == "create":
+        entry.append(op["record"])
+        return
+    positions = entry.positions(op["id_field"], op["id"])
+    if not positions or kind not in ("update", "delete"):
+        raise FileStoreError(f"Journal operation cannot be replayed: {op!r}")
+    if kind == "update":
+        entry.update(positions[0], op["updates"])
+    else:
+        entry.remove(positions[0])
+
+
+def _replay_journal(path: Path, entry: _Collection) -> None:
+    """Fold *path*'s journal into *entry*. Lock must be held."""
+    journal = _journal_path(path)
+    try:
+        data = journal.read_bytes()
+    except FileNotFoundError:
+        return  # another process's reader discarded a stale journal first
+    lines = data.split(b"\n")
+    if lines[-1]:
+        #A crash mid-append leaves a final line without its newline: drop it
+        #and truncate so the next append starts on a clean line.
+        with journal.open("r+b") as fh:
+            fh.truncate(len(data) - len(lines[-1]))
+            os.fsync(fh.fileno())
+    lines = lines[:-1]
+
+    if not lines or json.loads(lines[0]).get("base") != entry.digest:
+        #Written against another snapshot: a compaction already folded these
+        #ops in and crashed before removing the log.
+        journal.unlink(missing_ok=True)
+        return
+    for line in lines[1:]:
+        _apply_op(entry, json.loads(line))
+    entry.journal_ops = len(lines) - 1
+
+
+def _forget_collection(path: Path, error: Optional[BaseException] = None) -> None:
+    """Drop *path*'s cached collection. Group-commit writers still waiting on
+    it are released as durable (the file was superseded) or, given *error*,
+    as failed.
+    """
+    with _collections_lock:
+        _collections.pop(str(path), None)
+        group = _group_commits.get(str(path))
+    if group is not None:
+        group.settle(error)
+
+
+def _get_collection(path: Path, max_bytes: Optional[int]) -> _Collection:
+    """Return the cached collection for *path*, reloading if the file changed.
+
+    The per-path lock must be held.
+    """
+    key = str(path)
+    signature = _collection_signature(path, at_acquire=True)
+    current = signature[:2] + (_lock_generation(),)
+    with _collections_lock:
+        entry = _collections.get(key)
+        if entry is not None:
+            _collections.move_to_end(key)
+        declared = set(_declared_indexes.get(key, ()))
+
+    if entry is not None and entry.signature != signature and _is_dirty(key):
+        #Someone else replaced the file under writes still waiting for their
+        #group commit; those writes are lost, so fail them rather than
+        #reporting them durable after reloading.
+        _forget_collection(path, FileStoreError(f"'{path}' was modified externally."))
+    elif entry is not None and entry.signature == signature:
+        snapshot = signature[0]
+        if max_bytes is not None and snapshot is not None and snapshot[1] > max_bytes:
+            raise FileTooLargeError(
+                f"File '{path}' is {snapshot[1]} bytes, exceeds limit of {max_bytes}."
+            )
+        #Still current; carry it over to this holder's (bumped) generation.
+        entry.signature = current
+        return entry
+
+    raw = _read_bytes_unlocked(path, max_bytes) if path.is_file() else None
+    entry = _Collection(current, _parse_records(path, raw))
+    if signature[1] is not None:
+        entry.digest = _snapshot_digest(raw)
+        _replay_journal(path, entry)
+        entry.signature = _collection_signature(path)
+    for field in declared:
+        entry.index(field)
+    with _collections_lock:
+        _collections[key] = entry
+        _collections.move_to_end(key)
+        #Evict least recently used entries, never ones with unflushed writes.
+        for stale in list(_collections):
+            if len(_collections) <= MAX_CACHED_COLLECTIONS:
+                break
+            if not _is_dirty(stale):
+                del _collections[stale]
+    return entry
+
+
+def _persist_collection(path: Path, entry: _Collection) -> None:
+    """Atomically write *entry* back to *path* as a full snapshot and drop any
+    journal (this is also the compaction step). Lock must be held.
+
+    On failure the cache entry is dropped, since it may hold mutations that
+    never reached the disk.
+    """
+    try:
+        data = _encode(path, entry.records)
+        _atomic_write_unlocked(path, data)
+        #Once the snapshot is replaced the journal's base digest no longer
+        #matches, so a crash before this unlink is harmless.
+        _discard_journal(path)
+    except BaseException as exc:
+        _forget_collection(path, exc)
+        raise
+    entry.digest = _snapshot_digest(data)
+    entry.journal_ops = 0
+    entry.signature = _collection_signature(path)
+    with _collections_lock:
+        group = _group_commits.get(str(path))
+    if group is not None:
+        group.settle()
+
+
+def _encode_op(op: dict) -> bytes:
+    """Serialise *op* as one journal line. Record helpers call this before
+    applying the change, so a value that is not JSON-serialisable raises
+    with the cached collection untouched.
+    """
+    return json.dumps(op, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _append_journal(path: Path, entry: _Collection, chunk: bytes) -> None:
+    """Append the encoded op *chunk* to *path*'s journal with a single fsync.
+    Lock must be held.
+    """
+    journal = _journal_path(path)
+    try:
+        if not journal.exists():
+            if entry.digest is None:
+                entry.digest = _snapshot_digest(
+                    _read_bytes_unlocked(path, None) if path.is_file() else None
+                )
+            header = json.dumps({"base": entry.digest}).encode("utf-8") + b"\n"
+            chunk = header + chunk
+            entry.journal_ops = 0
+        with journal.open("ab") as fh:
+            fh.write(chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+    except BaseException as exc:
+        _forget_collection(path, exc)
+        raise
+    entry.journal_ops += 1
+    entry.signature = _collection_signature(path)
+
+
+def _commit_op(path: Path, entry: _Collection, chunk: bytes) -> Optional[tuple]:
+    """Persist a mutation already applied to *entry* (*chunk* is its
+    ``_encode_op`` line): queue it for the next
+    group commit, append it to the journal (compacting past the threshold) or
+    do a full atomic rewrite, depending on the collection's mode.
+
+    Returns a ticket for ``_wait_durable`` in group-commit mode, else ``None``.
+    """
+    with _collections_lock:
+        group = _group_commits.get(str(path))
+        compact_every = _journal_modes.get(str(path))
+    if group is not None:
+        with group.cond:
+            group.pending += 1
+            return (group, group.pending)
+    if compact_every is None:
+        _persist_collection(path, entry)
+        return
+    _append_journal(path, entry, chunk)
+    if entry.journal_ops >= compact_every:
+        _persist_collection(path, entry)
+    return None
+
+
+def _wait_durable(path: Path, ticket: Optional[tuple]) -> None:
+    """Block until the group-commit write *ticket* is on disk. Call it after
+    releasing *path*'s lock; the first waiter with no flush in flight becomes
+    the leader and persists everything pending in one atomic write.
+
+    Raises:
+        FileStoreError: the flush carrying this write failed.
+    """
+    if ticket is None:
+        return
+    deferred = getattr(_deferred_waits, "tickets", None)
+    if deferred is not None:
+        deferred.append((path, ticket))  # the async wrapper waits (see _make_async)
+        return
+    group, seq = ticket
+    while True:
+        with group.cond:
+            settled, error = group.outcome(seq)
+            if settled and error is None:
+                return
+            if settled:
+                raise FileStoreError(f"Group commit to '{path}' failed.") from error
+            if group.flushing:
+                group.cond.wait()
+                continue
+            group.flushing = True
+            #Let writers already queued on the lock apply first, so they
+            #share this flush instead of each needing one.
+            deadline = time.monotonic() + GROUP_COMMIT_MAX_WAIT
+            while group.arriving and time.monotonic() < deadline:
+                group.cond.wait(deadline - time.monotonic())
+        try:
+            with _locked(path):
+                try:
+                    #Loading may find the file replaced externally and fail
+                    #the pending writes; then there is nothing left to flush.
+                    entry = _get_collection(path, None) if group.dirty else None
+                    if entry is not None and group.dirty:
+                        _persist_collection(path, entry)
+                except Exception as exc:
+                    group.settle(exc)  # waiters re-check and raise
+        finally:
+            with group.cond:
+                group.flushing = False
+                group.cond.notify_all()
+
+
+def set_group_commit(path: PathLike, enabled: bool = True) -> None:
+    """Batch concurrent writers' fsyncs for the collection at *path*.
+
+    With group commit, ``create_record`` / ``update_record`` /
+    ``delete_record`` apply their change in memory and release the lock; one
+    waiting caller then writes everything pending with a single atomic write
+    while new writers queue up for the next one. Every call still returns only
+    after its change is durable, so throughput grows with the batch size
+    instead of being capped at one fsync per write. Takes precedence over
+    journal mode. In-process only: not available with the "fcntl" backend,
+    as another process could not see writes waiting for a flush.
+
+    Disabling flushes anything pending first.
+    """
+    resolved = _resolve_path(path)
+    if enabled and _uses_fcntl(resolved):
+        raise FileStoreError("Group commit cannot be combined with the 'fcntl' lock backend.")
+    with _locked(resolved):
+        with _collections_lock:
+            group = _group_commits.get(str(resolved))
+            if enabled and group is None:
+                _group_commits[str(resolved)] = _GroupCommit()
+            elif not enabled:
+                _group_commits.pop(str(resolved), None)
+        if not enabled and group is not None and group.dirty:
+            entry = _get_collection(resolved, None)
+            if group.dirty:  # not failed by an external replace while loading
+                _persist_collection(resolved, entry)
+                group.settle()
+
+
+def set_journal_mode(
+    path: PathLike, enabled: bool = True, *, compact_every: int = JOURNAL_COMPACT_EVERY
+) -> None:
+    """Switch the collection at *path* to (or from) journal mode.
+
+    In journal mode ``create_record`` / ``update_record`` / ``delete_record``
+    append one line to ``<path>.journal`` instead of rewriting the file, and
+    the journal is compacted into the snapshot every *compact_every* ops.
+    Disabling compacts immediately. Record helpers always replay a journal
+    found on disk, so only writers need to opt in; ``read_json`` on the raw
+    file sees the snapshot only.
+    """
+    if compact_every < 1:
+        raise ValueError("compact_every must be >= 1.")
+    resolved = _resolve_path(path)
+    with _locked(resolved):
+        with _collections_lock:
+            if enabled:
+                _journal_modes[str(resolved)] = compact_every
+            else:
+                _journal_modes.pop(str(resolved), None)
+        if not enabled and _journal_path(resolved).exists():
+            _persist_collection(resolved, _get_collection(resolved, MAX_READ_BYTES))
+
+
+def compact_collection(path: PathLike) -> None:
+    """Fold *path*'s journal into its JSON snapshot now (no-op without one)."""
+    resolved = _resolve_path(path)
+    with _locked(resolved):
+        if _journal_path(resolved).exists():
+            _persist_collection(resolved, _get_collection(resolved, MAX_READ_BYTES))
+
+
+def declare_index(path: PathLike, *fields: str) -> None:
+    """Maintain hash indexes on *fields* of the collection at *path*.
+
+    ``find_by_field`` on a declared field is then a dict lookup instead of a
+    scan. (The ``id_field`` used by ``find_by_id`` / ``update_record`` /
+    ``delete_record`` is always indexed on first use.)
+    """
+    resolved = _resolve_path(path)
+    with _locked(resolved):
+        with _collections_lock:
+            _declared_indexes.setdefault(str(resolved), set()).update(fields)
+            entry = _collections.get(str(resolved))
+        if entry is not None:
+            for field in fields:
+                entry.index(field)
+
+
+def clear_collection_cache(path: Optional[PathLike] = None) -> None:
+    """Drop cached collections (all of them, or just *path*'s). Entries with
+    group-commit writes still waiting for their flush are kept.
+    """
+    keys = [str(_resolve_path(path))] if path is not None else None
+    with _collections_lock:
+        for key in keys if keys is not None else list(_collections):
+            if not _is_dirty(key):
+                _collections.pop(key, None)
+
+
 def read_all(path: PathLike, *, max_bytes: Optional[int] = MAX_READ_BYTES) -> list:
     """Return every record in the JSON file at *path* (``[]`` if it doesn't exist)."""
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
-        return _load_records(resolved, max_bytes)
+    with _locked(resolved, shared=True):
+        return _clone(_get_collection(resolved, max_bytes).records)
 
 
 def save_all(path: PathLike, data: list) -> None:
@@ -416,26 +1379,38 @@ def find_by_id(
     path: PathLike, record_id: Any, *, id_field: str = "id"
 ) -> Optional[dict]:
     """Return the first record whose *id_field* equals *record_id*, or ``None``."""
-    for record in read_all(path):
-        if record.get(id_field) == record_id:
-            return record
-    return None
+    resolved = _resolve_path(path)
+    with _locked(resolved, shared=True):
+        entry = _get_collection(resolved, MAX_READ_BYTES)
+        positions = entry.positions(id_field, record_id)
+        return _clone(entry.records[positions[0]]) if positions else None
 
 
 def find_by_field(path: PathLike, field: str, value: Any) -> list:
-    """Return all records where ``record[field] == value``."""
-    return [r for r in read_all(path) if r.get(field) == value]
+    """Return all records where ``record[field] == value``.
+
+    Uses a hash index when *field* was declared via ``declare_index``;
+    otherwise scans the cached records (no file re-read).
+    """
+    resolved = _resolve_path(path)
+    with _locked(resolved, shared=True):
+        entry = _get_collection(resolved, MAX_READ_BYTES)
+        if field in entry.indexes:
+            positions = entry.positions(field, value)
+            return [_clone(entry.records[i]) for i in positions]
+        return [_clone(r) for r in entry.records if r.get(field) == value]
 
 
 def create_record(path: PathLike, record: dict) -> dict:
     """Append *record* to the JSON collection at *path* and persist it."""
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
-        data = _load_records(resolved, MAX_READ_BYTES)
-        data.append(record)
-        _atomic_write_unlocked(
-            resolved, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
-        )
+    with _group_arrival(resolved), _locked(resolved):
+        entry = _get_collection(resolved, MAX_READ_BYTES)
+        stored = _clone(record)
+        chunk = _encode_op({"op": "create", "record": stored})
+        entry.append(stored)
+        ticket = _commit_op(resolved, entry, chunk)
+    _wait_durable(resolved, ticket)
     return record
 
 
@@ -448,24 +1423,22 @@ def update_record(
         ValueError: if no record with *record_id* exists.
     """
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
-        data = _load_records(resolved, MAX_READ_BYTES)
-
-        updated_record = None
-        for record in data:
-            if record.get(id_field) == record_id:
-                record.update(updates)
-                updated_record = record
-                break
+    with _group_arrival(resolved), _locked(resolved):
+        entry = _get_collection(resolved, MAX_READ_BYTES)
+        positions = entry.positions(id_field, record_id)
 
-        if updated_record is None:
+        if not positions:
             raise ValueError(
                 f"Record with {id_field}='{record_id}' not found in '{resolved}'."
             )
 
-        _atomic_write_unlocked(
-            resolved, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        updates = _clone(updates)
+        chunk = _encode_op(
+            {"op": "update", "id_field": id_field, "id": record_id, "updates": updates}
         )
+        updated_record = _clone(entry.update(positions[0], updates))
+        ticket = _commit_op(resolved, entry, chunk)
+    _wait_durable(resolved, ticket)
     return updated_record
 
 
@@ -478,28 +1451,322 @@ def delete_record(
         ValueError: if no record with *record_id* exists.
     """
     resolved = _resolve_path(path)
-    with _get_lock(resolved):
-        data = _load_records(resolved, MAX_READ_BYTES)
-
-        deleted_record = None
-        remaining = []
-        for record in data:
-            if deleted_record is None and record.get(id_field) == record_id:
-                deleted_record = record
-            else:
-                remaining.append(record)
+    with _group_arrival(resolved), _locked(resolved):
+        entry = _get_collection(resolved, MAX_READ_BYTES)
+        positions = entry.positions(id_field, record_id)
 
-        if deleted_record is None:
+        if not positions:
             raise ValueError(
                 f"Record with {id_field}='{record_id}' not found in '{resolved}'."
             )
 
-        _atomic_write_unlocked(
-            resolved, json.dumps(remaining, indent=2, ensure_ascii=False).encode("utf-8")
-        )
+        chunk = _encode_op({"op": "delete", "id_field": id_field, "id": record_id})
+        deleted_record = entry.remove(positions[0])
+        ticket = _commit_op(resolved, entry, chunk)
+    _wait_durable(resolved, ticket)
     return deleted_record
 
 
+# ---------------------------------------------------------------------------
+# Batches - many mutations under one lock hold, committed with one write
+# ---------------------------------------------------------------------------
+class Transaction:
+    """Mutations against one collection, applied in memory and committed
+    atomically by ``transaction()``. Don't call the module-level record
+    helpers for the same path inside the block - the per-path lock is
+    already held and is not re-entrant.
+    """
+
+    def __init__(self, path: Path, entry: _Collection, id_field: str) -> None:
+        self.path = path
+        self.id_field = id_field
+        self._entry = entry
+        self.dirty = False
+
+    def _position(self, record_id: Any) -> int:
+        positions = self._entry.positions(self.id_field, record_id)
+        if not positions:
+            raise ValueError(
+                f"Record with {self.id_field}='{record_id}' not found in '{self.path}'."
+            )
+        return positions[0]
+
+    def find_by_id(self, record_id: Any) -> Optional[dict]:
+        positions = self._entry.positions(self.id_field, record_id)
+        return _clone(self._entry.records[positions[0]]) if positions else None
+
+    def create(self, record: dict) -> dict:
+        self._entry.append(_clone(record))
+        self.dirty = True
+        return record
+
+    def create_many(self, records: Iterable[dict]) -> list:
+        records = list(records)
+        for record in records:
+            self._entry.append(_clone(record))
+        self.dirty = self.dirty or bool(records)
+        return records
+
+    def update(self, record_id: Any, updates: dict) -> dict:
+        record = self._entry.update(self._position(record_id), _clone(updates))
+        self.dirty = True
+        return _clone(record)
+
+    def update_many(
+        self, updates: Union[dict, Iterable[tuple]]
+    ) -> list:
+        """Apply ``{record_id: updates}`` (or ``(record_id, updates)`` pairs)."""
+        pairs = updates.items() if isinstance(updates, dict) else updates
+        return [self.update(record_id, changes) for record_id, changes in pairs]
+
+    def delete(self, record_id: Any) -> dict:
+        record = self._entry.remove(self._position(record_id))
+        self.dirty = True
+        return record
+
+    def delete_many(self, record_ids: Iterable[Any]) -> list:
+        """Delete one matching record per id (an id listed twice removes the
+        first two matches, same as two ``delete`` calls). Validates every id
+        before removing anything, then removes in a single pass.
+        """
+        wanted = Counter(record_ids)
+        positions = []
+        for record_id, count in wanted.items():
+            matches = self._entry.positions(self.id_field, record_id)
+            if len(matches) < count:
+                raise ValueError(
+                    f"Record with {self.id_field}='{record_id}' not found in '{self.path}'."
+                )
+            positions.extend(matches[:count])
+        if not positions:
+            return []
+        self.dirty = True
+        return self._entry.remove_many(positions)
+
+
+@contextmanager
+def transaction(path: PathLike, *, id_field: str = "id") -> Iterator[Transaction]:
+    """Hold *path*'s lock and yield a ``Transaction``; commit on exit.
+
+    All changes are written with a single atomic replace when the block exits
+    normally (a journaled collection is compacted in the same write). If the
+    block raises, nothing is written and the in-memory cache is discarded, so
+    the collection is exactly as it was on disk.
+
+    Example::
+
+        with transaction("users.json") as tx:
+            tx.create({"id": "u9", "name": "Grace"})
+            tx.update("u1", {"active": False})
+    """
+    resolved = _resolve_path(path)
+    with _locked(resolved):
+        entry = _get_collection(resolved, MAX_READ_BYTES)
+        if _is_dirty(str(resolved)):
+            #Persist other writers' pending group commits first, so a rollback
+            #below cannot discard them.
+            _persist_collection(resolved, entry)
+        tx = Transaction(resolved, entry, id_field)
+        try:
+            yield tx
+        except BaseException:
+            _forget_collection(resolved)
+            raise
+        if tx.dirty:
+            _persist_collection(resolved, tx._entry)
+
+
+def create_many(path: PathLike, records: Iterable[dict]) -> list:
+    """Append all *records* to the collection at *path* with one write."""
+    with transaction(path) as tx:
+        return tx.create_many(records)
+
+
+def update_many(
+    path: PathLike, updates: Union[dict, Iterable[tuple]], *, id_field: str = "id"
+) -> list:
+    """Apply ``{record_id: updates}`` to *path* with one write; all or nothing.
+
+    Raises:
+        ValueError: if any id is missing (nothing is written).
+    """
+    with transaction(path, id_field=id_field) as tx:
+        return tx.update_many(updates)
+
+
+def delete_many(path: PathLike, record_ids: Iterable[Any], *, id_field: str = "id") -> list:
+    """Delete the records matching *record_ids* with one write; all or nothing.
+
+    Raises:
+        ValueError: if any id is missing (nothing is written).
+    """
+    with transaction(path, id_field=id_field) as tx:
+        return tx.delete_many(record_ids)
+
+
+# ---------------------------------------------------------------------------
+# Asyncio API - ``await aread_json(...)``, ``await acreate_record(...)``, ...
+# ---------------------------------------------------------------------------
+# Each coroutine runs its sync twin in a bounded thread pool. Before taking a
+# pool thread it waits on a per-path async reader-writer lock in the event
+# loop, so queued writers (and readers behind a writer) of a slow collection
+# wait as coroutines instead of parking pool threads: a slow fsync on one
+# file occupies one thread, and unrelated paths keep flowing. A group-commit
+# writer releases the async lock once its change is applied and waits for the
+# flush afterwards, so concurrent coroutines share flushes like threads do.
+AIO_MAX_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+
+_aio_executor: Optional[ThreadPoolExecutor] = None
+#Group-commit waits collected instead of performed by the current pool thread.
+_deferred_waits = threading.local()
+#event loop -> {resolved path: _AsyncRWLock}; both levels weak.
+_aio_locks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class _AsyncRWLock:
+    """Writer-preferring reader-writer lock for coroutines of one event loop."""
+
+    def __init__(self) -> None:
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        async with self._cond:
+            await self._cond.wait_for(lambda: not (self._writer or self._writers_waiting))
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._readers -= 1
+                self._cond.notify_all()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        async with self._cond:
+            self._writers_waiting += 1
+            try:
+                await self._cond.wait_for(lambda: not (self._writer or self._readers))
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+def _get_aio_lock(path: Path) -> _AsyncRWLock:
+    loop = asyncio.get_running_loop()
+    with _locks_meta_lock:
+        table = _aio_locks.get(loop)
+        if table is None:
+            table = _aio_locks[loop] = weakref.WeakValueDictionary()
+        lock = table.get(str(path))
+        if lock is None:
+            lock = table[str(path)] = _AsyncRWLock()
+        return lock
+
+
+def set_aio_workers(max_workers: int) -> None:
+    """Resize the async API's thread pool (takes effect for new calls)."""
+    global _aio_executor, AIO_MAX_WORKERS
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1.")
+    with _locks_meta_lock:
+        previous, _aio_executor = _aio_executor, None
+        AIO_MAX_WORKERS = max_workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def _get_aio_executor() -> ThreadPoolExecutor:
+    global _aio_executor
+    with _locks_meta_lock:
+        if _aio_executor is None:
+            _aio_executor = ThreadPoolExecutor(
+                max_workers=AIO_MAX_WORKERS, thread_name_prefix="secure_file_io"
+            )
+        return _aio_executor
+
+
+def _apply_deferring_durability(call: Callable) -> tuple:
+    """Run *call* in a pool thread, handing any group-commit wait to a new pool
+    task instead of blocking on it. Returns ``(result, future or None)``; the
+    wait is submitted before returning, so it runs even if the caller is
+    cancelled.
+    """
+    _deferred_waits.tickets = []
+    try:
+        result = call()
+        tickets = _deferred_waits.tickets
+    finally:
+        _deferred_waits.tickets = None
+    if not tickets:
+        return result, None
+
+    def wait() -> None:
+        for path, ticket in tickets:
+            _wait_durable(path, ticket)
+
+    return result, _get_aio_executor().submit(wait)
+
+
+def _make_async(func: Callable, *, shared: bool) -> Callable:
+    """Build the awaitable twin of the path-first helper *func*."""
+
+    @functools.wraps(func)
+    async def wrapper(path: PathLike, *args: Any, **kwargs: Any) -> Any:
+        resolved = _resolve_path(path)  # confinement errors raise right away
+        lock = _get_aio_lock(resolved)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, resolved, *args, **kwargs)
+        if shared:
+            async with lock.read():
+                return await loop.run_in_executor(_get_aio_executor(), call)
+        #Count as arriving while queued on the async lock too, so a flush
+        #leader waits for this write instead of flushing without it.
+        with _group_arrival(resolved):
+            async with lock.write():
+                result, durable = await loop.run_in_executor(
+                    _get_aio_executor(), _apply_deferring_durability, call
+                )
+        if durable is not None:
+            await asyncio.wrap_future(durable)
+        return result
+
+    wrapper.__name__ = wrapper.__qualname__ = f"a{func.__name__}"
+    wrapper.__doc__ = f"Awaitable ``{func.__name__}`` (runs in the secure_file_io thread pool).\n\n{func.__doc__ or ''}"
+    return wrapper
+
+
+aread_bytes = _make_async(read_bytes, shared=True)
+awrite_bytes = _make_async(write_bytes, shared=False)
+aread_text = _make_async(read_text, shared=True)
+awrite_text = _make_async(write_text, shared=False)
+aread_json = _make_async(read_json, shared=True)
+awrite_json = _make_async(write_json, shared=False)
+aread_csv = _make_async(read_csv, shared=True)
+awrite_csv = _make_async(write_csv, shared=False)
+aread_yaml = _make_async(read_yaml, shared=True)
+awrite_yaml = _make_async(write_yaml, shared=False)
+aread_all = _make_async(read_all, shared=True)
+asave_all = _make_async(save_all, shared=False)
+afind_by_id = _make_async(find_by_id, shared=True)
+afind_by_field = _make_async(find_by_field, shared=True)
+acreate_record = _make_async(create_record, shared=False)
+aupdate_record = _make_async(update_record, shared=False)
+adelete_record = _make_async(delete_record, shared=False)
+acreate_many = _make_async(create_many, shared=False)
+aupdate_many = _make_async(update_many, shared=False)
+adelete_many = _make_async(delete_many, shared=False)
+
+
 #Example usage
 """
 from src.utils import secure_file_io as fio
@@ -513,6 +1780,12 @@ fio.write_json("src/resources/config.json", {"debug": True})
 
 text  = fio.read_text("src/resources/notes.md")
 rows  = fio.read_csv("src/resources/users.csv")
+
+# Multi-GB exports with constant memory:
+for row in fio.iter_csv("exports/events.csv"):
+    ...
+for event in fio.iter_jsonl("exports/events.jsonl"):
+    ...
 data  = fio.read_yaml("src/resources/settings.yaml", default={})
 
 # JSON-file-as-collection CRUD (replaces the old json_store API):
@@ -521,4 +1794,27 @@ fio.create_record(users, {"id": "u1", "name": "Ada"})
 fio.update_record(users, "u1", {"name": "Ada Lovelace"})
 user  = fio.find_by_id(users, "u1")
 fio.delete_record(users, "u1")
+
+# Index a secondary field so find_by_field is a dict lookup, not a scan:
+fio.declare_index(users, "email")
+matches = fio.find_by_field(users, "email", "ada@example.com")
+
+# Compact / binary on-disk format for one collection (or a whole root):
+fio.set_codec(users, "orjson")        # or "json-compact", "msgpack"
+
+# Bursty concurrent writers share fsyncs (each call still waits for durability):
+fio.set_group_commit(users)
+
+# Append-only writes for a busy collection (compacted every 500 ops):
+fio.set_journal_mode(users, compact_every=500)
+
+# From async code (FastAPI handlers) - same API, awaitable, off the event loop:
+cfg  = await fio.aread_json("src/resources/config.json", default={})
+await fio.acreate_record(users, {"id": "u2", "name": "Grace"})
+
+# Bulk import / multi-step edit with one lock hold and one atomic write:
+fio.create_many(users, [{"id": f"u{i}"} for i in range(50_000)])
+with fio.transaction(users) as tx:
+    tx.update("u1", {"name": "Ada"})
+    tx.delete_many(["u2", "u3"])      # any failure -> nothing is written
 """